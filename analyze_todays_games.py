@@ -117,6 +117,7 @@ def load_todays_odds(odds_date: Optional[date] = None) -> pd.DataFrame:
 
     # Try dated file first, then generic file
     odds_paths = [
+        Path(f"data/overtime_ncaab_odds_{date_str}.csv.gz"),
         Path(f"data/overtime_ncaab_odds_{date_str}.csv"),
         Path("data/overtime_odds.csv"),
     ]
@@ -336,7 +336,9 @@ def main():
 
     # Load predictions and market odds
     predictions_path = Path(f"data/todays_game_predictions_{date_str}.csv")
-    market_path = Path(f"data/overtime_ncaab_odds_{date_str}.csv")
+    market_path = Path(f"data/overtime_ncaab_odds_{date_str}.csv.gz")
+    if not market_path.exists():
+        market_path = market_path.with_suffix("")
 
     if not predictions_path.exists():
         print(f"ERROR: Predictions file not found at {predictions_path}")
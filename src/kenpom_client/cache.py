@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class CacheEntry:
@@ -30,14 +32,20 @@ class FileCache:
         h = hashlib.sha256(key.encode("utf-8")).hexdigest()
         return self.root / f"{h}.json"
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str, ttl_seconds: Optional[float] = None) -> Optional[Any]:
+        """Return the cached payload, or None if missing or older than the TTL.
+
+        ttl_seconds overrides the cache-wide TTL for this lookup (math.inf for
+        payloads that never change, e.g. archive ratings for past dates).
+        """
         path = self._path_for_key(key)
         if not path.exists():
             return None
+        ttl = self.ttl if ttl_seconds is None else ttl_seconds
         try:
             obj = json.loads(path.read_text(encoding="utf-8"))
             created_ts = float(obj["created_ts"])
-            if (time.time() - created_ts) > self.ttl:
+            if (time.time() - created_ts) > ttl:
                 return None
             return obj["payload"]
         except Exception:
@@ -52,3 +60,56 @@ class FileCache:
             encoding="utf-8",
         )
         os.replace(tmp, path)
+
+
+class ArrayCache:
+    """
+    On-disk cache for NumPy result arrays:
+      key -> sha256 -> npz file
+
+    Bounded by max_bytes; when a write pushes the directory over the limit,
+    the least recently used files (by mtime, refreshed on every hit) are
+    evicted first. The entry just written is always kept, so an array set
+    larger than max_bytes is still served until the next write.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.root = Path(cache_dir)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def _path_for_key(self, key: str) -> Path:
+        h = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.root / f"{h}.npz"
+
+    def get(self, key: str) -> Optional[dict[str, np.ndarray]]:
+        path = self._path_for_key(key)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+            os.utime(path)  # mark as recently used
+            return arrays
+        except Exception:
+            # corrupt cache file: ignore
+            return None
+
+    def set(self, key: str, arrays: dict[str, np.ndarray]) -> None:
+        path = self._path_for_key(key)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, path)
+        self._evict(keep=path)
+
+    def _evict(self, keep: Path) -> None:
+        files = sorted(self.root.glob("*.npz"), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in files)
+        for path in files:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
@@ -132,7 +132,7 @@ def main() -> None:
     p_slate.add_argument(
         "--join-odds",
         action="store_true",
-        help="Join with market odds from overtime_ncaab_odds_{date}.csv",
+        help="Join with market odds from overtime_ncaab_odds_{date}.csv.gz",
     )
     p_slate.add_argument(
         "--home-adv",
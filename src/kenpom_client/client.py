@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import math
+from datetime import date
 from typing import Any, Dict, List, Optional
 
 import httpx
@@ -23,6 +25,18 @@ from .models import (
 log = logging.getLogger(__name__)
 
 
+def _immutable_ttl(endpoint: str, params: Dict[str, Any]) -> Optional[float]:
+    """Return math.inf for responses that can no longer change, else None (default TTL).
+
+    Archive ratings are snapshots as of date d, so once d is in the past the
+    response is final and can be served from disk indefinitely.
+    """
+    d = params.get("d")
+    if endpoint == "archive" and isinstance(d, str) and d < date.today().isoformat():
+        return math.inf
+    return None
+
+
 class KenPomClient:
     """
     KenPom API wrapper around /api.php?endpoint=...
@@ -57,7 +71,7 @@ class KenPomClient:
         query = {"endpoint": endpoint, **params}
 
         cache_key = f"{self.settings.base_url}{url}?{sorted(query.items())}"
-        cached = self._cache.get(cache_key)
+        cached = self._cache.get(cache_key, ttl_seconds=_immutable_ttl(endpoint, params))
         if cached is not None:
             return cached
 
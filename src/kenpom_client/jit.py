@@ -0,0 +1,17 @@
+"""Optional numba JIT decorator shared by the numeric kernels.
+
+``njit`` is numba.njit when numba is installed and a no-op decorator
+otherwise, so kernels stay plain Python/NumPy without the dependency.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is not a hard dependency
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -9,11 +9,13 @@ from __future__ import annotations
 
 import logging
 import re
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,16 @@ _hca_snapshot_cache: Optional["HCASnapshot"] = None
 # Default HCA when no team-specific data is available
 DEFAULT_HCA = 3.5
 
+# Numeric encodings of the categorical style signals (unknown values map to
+# the neutral entry). Precomputed on MatchupFeatures so prediction code never
+# compares strings.
+PACE_SIGN = {"home_controls": 1.0, "away_controls": -1.0, "neutral": 0.0}
+STYLE_VARIANCE_MULTIPLIER = {"3pt_vs_interior": 1.10, "similar": 1.0}
+
+# One team's snapshot row: a pd.Series, or a plain dict such as one record of
+# df.to_dict("records") (dict lookups are much cheaper than Series indexing)
+TeamData = Union[pd.Series, Mapping[str, Any]]
+
 
 @dataclass(frozen=True)
 class MatchupFeatures:
@@ -71,12 +83,24 @@ class MatchupFeatures:
     # Metadata
     feature_version: str  # "1.0" for tracking feature evolution
 
+    # Derived numeric encodings (set in __post_init__, not constructor args)
+    pace_sign: float = field(init=False)  # +1.0 home / -1.0 away / 0.0 neutral
+    style_variance_multiplier: float = field(init=False)  # 1.10 for 3pt_vs_interior
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "pace_sign", PACE_SIGN.get(self.pace_control, 0.0))
+        object.__setattr__(
+            self,
+            "style_variance_multiplier",
+            STYLE_VARIANCE_MULTIPLIER.get(self.style_clash, 1.0),
+        )
+
 
-def _safe_get(row: pd.Series, key: str, default: float) -> float:
-    """Safely get value from pandas Series, handling None and missing keys.
+def _safe_get(row: TeamData, key: str, default: float) -> float:
+    """Safely get value from team data, handling None and missing keys.
 
     Args:
-        row: Pandas Series (team data)
+        row: Team data (pandas Series or dict)
         key: Column name to retrieve
         default: Default value if missing or None
 
@@ -90,7 +114,7 @@ def _safe_get(row: pd.Series, key: str, default: float) -> float:
 
 
 def calculate_matchup_features(
-    away: pd.Series, home: pd.Series, game_context: Optional["GameContext"] = None
+    away: TeamData, home: TeamData, game_context: Optional["GameContext"] = None
 ) -> MatchupFeatures:
     """Calculate matchup-specific features from team data.
 
@@ -102,8 +126,8 @@ def calculate_matchup_features(
     - Rest advantage and travel distance (if game_context provided)
 
     Args:
-        away: Team data for away team (pandas Series from enriched snapshot)
-        home: Team data for home team (pandas Series from enriched snapshot)
+        away: Team data for away team (Series or dict row from enriched snapshot)
+        home: Team data for home team (Series or dict row from enriched snapshot)
         game_context: Optional game context with rest days and venue info
 
     Returns:
@@ -227,6 +251,233 @@ def calculate_matchup_features(
     )
 
 
+@dataclass(frozen=True, slots=True)
+class TeamFeatureVector:
+    """Per-team inputs to calculate_matchup_features, extracted once per snapshot.
+
+    Missing/None/NaN snapshot values are already replaced with the same
+    defaults calculate_matchup_features uses, so matchup features can be
+    derived from two vectors by subtraction alone.
+    """
+
+    adj_em: float
+    adj_oe: float
+    adj_de: float
+    adj_tempo: float
+    efg_pct: float
+    defg_pct: float
+    to_pct: float
+    dto_pct: float
+    or_pct: float
+    dor_pct: float
+    off_fg3: float
+    home_court_factor: float  # Used when this team is the home side
+
+
+def team_feature_vector(
+    team: TeamData, hca_snapshot: Optional["HCASnapshot"] = None
+) -> TeamFeatureVector:
+    """Extract one team's matchup inputs from a snapshot row.
+
+    Args:
+        team: Team data (Series or dict row from enriched snapshot)
+        hca_snapshot: Optional pre-loaded HCA snapshot (loads from disk if None)
+
+    Returns:
+        TeamFeatureVector with defaults applied
+    """
+    return TeamFeatureVector(
+        adj_em=_safe_get(team, "adj_em", 0.0),
+        adj_oe=_safe_get(team, "adj_oe", 105.0),
+        adj_de=_safe_get(team, "adj_de", 100.0),
+        adj_tempo=_safe_get(team, "adj_tempo", 68.0),
+        efg_pct=_safe_get(team, "efg_pct", 50.0),
+        defg_pct=_safe_get(team, "defg_pct", 50.0),
+        to_pct=_safe_get(team, "to_pct", 20.0),
+        dto_pct=_safe_get(team, "dto_pct", 20.0),
+        or_pct=_safe_get(team, "or_pct", 30.0),
+        dor_pct=_safe_get(team, "dor_pct", 30.0),
+        off_fg3=_safe_get(team, "off_fg3", 30.0),
+        home_court_factor=calculate_home_court_factor(team, hca_snapshot),
+    )
+
+
+def precompute_team_features(snapshot_df: pd.DataFrame) -> dict[str, TeamFeatureVector]:
+    """Build a TeamFeatureVector for every team in a snapshot.
+
+    Do this once per slate or simulation; each matchup is then a cheap
+    calculate_matchup_features_from_cached call instead of re-reading two
+    Series and re-resolving the home team's HCA.
+
+    Args:
+        snapshot_df: Enriched snapshot DataFrame with a 'team' column
+
+    Returns:
+        Dict mapping team name to its TeamFeatureVector
+
+    Example:
+        >>> team_features = precompute_team_features(df)
+        >>> matchup = calculate_matchup_features_from_cached(
+        ...     team_features["Oregon"], team_features["Gonzaga"]
+        ... )
+    """
+    hca_snapshot = load_hca_snapshot()
+    return {
+        str(row["team"]): team_feature_vector(row, hca_snapshot)
+        for _, row in snapshot_df.iterrows()
+    }
+
+
+def calculate_matchup_features_from_cached(
+    away: TeamFeatureVector, home: TeamFeatureVector
+) -> MatchupFeatures:
+    """calculate_matchup_features from precomputed team vectors.
+
+    Same formulas and thresholds as calculate_matchup_features (without game
+    context), but only the delta arithmetic runs per matchup.
+
+    Args:
+        away: Away team vector (from precompute_team_features)
+        home: Home team vector (from precompute_team_features)
+
+    Returns:
+        MatchupFeatures dataclass with all comparative metrics
+    """
+    delta_tempo = away.adj_tempo - home.adj_tempo
+    tempo_mismatch = abs(delta_tempo)
+    if tempo_mismatch > 5.0:
+        pace_control = "away_controls" if delta_tempo > 0 else "home_controls"
+    else:
+        pace_control = "neutral"
+
+    if abs(home.off_fg3 - away.off_fg3) > 10.0:
+        style_clash = "3pt_vs_interior"
+    else:
+        style_clash = "similar"
+
+    return MatchupFeatures(
+        delta_adj_em=away.adj_em - home.adj_em,
+        delta_adj_oe=away.adj_oe - home.adj_oe,
+        delta_adj_de=away.adj_de - home.adj_de,
+        delta_tempo=delta_tempo,
+        shooting_advantage=away.efg_pct - home.defg_pct,
+        shooting_defense_advantage=home.efg_pct - away.defg_pct,
+        turnover_advantage=home.dto_pct - away.to_pct,
+        rebounding_advantage=away.or_pct - home.dor_pct,
+        tempo_mismatch=tempo_mismatch,
+        pace_control=pace_control,
+        home_3pt_reliance=home.off_fg3,
+        away_3pt_reliance=away.off_fg3,
+        style_clash=style_clash,
+        home_court_factor=home.home_court_factor,
+        rest_advantage=None,
+        travel_distance=None,
+        feature_version="1.0",
+    )
+
+
+def _column(df: pd.DataFrame, key: str, default: float) -> np.ndarray:
+    """Vectorized _safe_get: column as float64 with missing/None/NaN -> default."""
+    if key not in df:
+        return np.full(len(df), default, dtype=np.float64)
+    return pd.to_numeric(df[key], errors="coerce").fillna(default).to_numpy(dtype=np.float64)
+
+
+def calculate_matchup_features_frame(away_df: pd.DataFrame, home_df: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized calculate_matchup_features for a whole slate.
+
+    Row i of away_df/home_df describes game i (aligned by position). Applies
+    the same formulas, defaults, and thresholds as calculate_matchup_features
+    on NumPy columns instead of one Series pair at a time. Game context (rest,
+    travel) is not supported here and is left as None.
+
+    Args:
+        away_df: Away team rows (from enriched snapshot)
+        home_df: Home team rows (from enriched snapshot)
+
+    Returns:
+        DataFrame (indexed like away_df) with one column per MatchupFeatures field
+
+    Example:
+        >>> features = calculate_matchup_features_frame(away_df, home_df)
+        >>> features[["tempo_mismatch", "pace_control"]]
+    """
+    # A. Efficiency deltas
+    delta_adj_em = _column(away_df, "adj_em", 0.0) - _column(home_df, "adj_em", 0.0)
+    delta_adj_oe = _column(away_df, "adj_oe", 105.0) - _column(home_df, "adj_oe", 105.0)
+    delta_adj_de = _column(away_df, "adj_de", 100.0) - _column(home_df, "adj_de", 100.0)
+    delta_tempo = _column(away_df, "adj_tempo", 68.0) - _column(home_df, "adj_tempo", 68.0)
+
+    # B. Shooting matchup
+    shooting_advantage = _column(away_df, "efg_pct", 50.0) - _column(home_df, "defg_pct", 50.0)
+    shooting_defense_advantage = _column(home_df, "efg_pct", 50.0) - _column(
+        away_df, "defg_pct", 50.0
+    )
+
+    # C. Ball control signals
+    turnover_advantage = _column(home_df, "dto_pct", 20.0) - _column(away_df, "to_pct", 20.0)
+    rebounding_advantage = _column(away_df, "or_pct", 30.0) - _column(home_df, "dor_pct", 30.0)
+
+    # D. Tempo & pace control
+    tempo_mismatch = np.abs(delta_tempo)
+    pace_mismatch = tempo_mismatch > 5.0
+    away_faster = delta_tempo > 0
+    pace_control = np.where(
+        pace_mismatch, np.where(away_faster, "away_controls", "home_controls"), "neutral"
+    )
+    pace_sign = np.where(
+        pace_mismatch,
+        np.where(away_faster, PACE_SIGN["away_controls"], PACE_SIGN["home_controls"]),
+        PACE_SIGN["neutral"],
+    )
+
+    # E. Style classification
+    home_3pt_reliance = _column(home_df, "off_fg3", 30.0)
+    away_3pt_reliance = _column(away_df, "off_fg3", 30.0)
+    style_mismatch = np.abs(home_3pt_reliance - away_3pt_reliance) > 10.0
+    style_clash = np.where(style_mismatch, "3pt_vs_interior", "similar")
+    style_variance_multiplier = np.where(
+        style_mismatch,
+        STYLE_VARIANCE_MULTIPLIER["3pt_vs_interior"],
+        STYLE_VARIANCE_MULTIPLIER["similar"],
+    )
+
+    # F. Home court (single snapshot load shared by every row)
+    hca_snapshot = load_hca_snapshot() if "team" in home_df else None
+    if hca_snapshot is None:
+        home_court_factor = np.full(len(home_df), DEFAULT_HCA, dtype=np.float64)
+    else:
+        home_court_factor = np.array(
+            [calculate_home_court_factor({"team": team}, hca_snapshot) for team in home_df["team"]],
+            dtype=np.float64,
+        )
+
+    return pd.DataFrame(
+        {
+            "delta_adj_em": delta_adj_em,
+            "delta_adj_oe": delta_adj_oe,
+            "delta_adj_de": delta_adj_de,
+            "delta_tempo": delta_tempo,
+            "shooting_advantage": shooting_advantage,
+            "shooting_defense_advantage": shooting_defense_advantage,
+            "turnover_advantage": turnover_advantage,
+            "rebounding_advantage": rebounding_advantage,
+            "tempo_mismatch": tempo_mismatch,
+            "pace_control": pace_control,
+            "home_3pt_reliance": home_3pt_reliance,
+            "away_3pt_reliance": away_3pt_reliance,
+            "style_clash": style_clash,
+            "home_court_factor": home_court_factor,
+            "rest_advantage": None,
+            "travel_distance": None,
+            "feature_version": "1.0",
+            "pace_sign": pace_sign,
+            "style_variance_multiplier": style_variance_multiplier,
+        },
+        index=away_df.index,
+    )
+
+
 def load_hca_snapshot() -> Optional["HCASnapshot"]:
     """Load the most recent HCA snapshot from disk.
 
@@ -288,7 +539,7 @@ def clear_hca_cache() -> None:
 
 
 def calculate_home_court_factor(
-    home: pd.Series, hca_snapshot: Optional["HCASnapshot"] = None
+    home: TeamData, hca_snapshot: Optional["HCASnapshot"] = None
 ) -> float:
     """Calculate team-specific home court advantage.
 
@@ -297,7 +548,7 @@ def calculate_home_court_factor(
     is available.
 
     Args:
-        home: Team data for home team (pandas Series with 'team' column)
+        home: Team data for home team (Series or dict with 'team' key)
         hca_snapshot: Optional pre-loaded HCA snapshot (loads from disk if None)
 
     Returns:
@@ -308,7 +559,7 @@ def calculate_home_court_factor(
         >>> hca = calculate_home_court_factor(home_team)
         >>> print(f"Kansas HCA: {hca:.2f}")  # Phog Allen is legendary
     """
-    # Get team name from Series
+    # Get team name from team data
     team_name = home.get("team")
     if team_name is None:
         return DEFAULT_HCA
@@ -6,6 +6,8 @@ overtime.ag for NCAA Men's Basketball games.
 
 from __future__ import annotations
 
+import json
+import logging
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -18,6 +20,17 @@ from playwright.sync_api import Page, sync_playwright
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Persistent Chromium profile so the HTTP/service-worker caches survive between runs
+CHROME_PROFILE_DIR = Path("data/.chrome-profile")
+
+# Chromium disk cache size (bytes) for the persistent profile
+CHROME_DISK_CACHE_BYTES = 100 * 1024 * 1024
+
+# Last Angular scope path (e.g. "root.child.sibling") that held Leagues
+SCOPE_PATH_CACHE = Path("data/.overtime_scope.json")
+
 
 @dataclass
 class GameOdds:
@@ -67,6 +80,7 @@ class OvertimeScraper:
         customer_id: Optional[str] = None,
         password: Optional[str] = None,
         headless: bool = True,
+        debug: bool = False,
     ):
         """Initialize the scraper.
 
@@ -74,16 +88,48 @@ class OvertimeScraper:
             customer_id: overtime.ag customer ID (from env if None)
             password: overtime.ag password (from env if None)
             headless: Run browser in headless mode
+            debug: Run diagnostic-only steps (Angular scope tree dump, page dumps)
         """
         self.customer_id = customer_id or os.getenv("OV_CUSTOMER_ID")
         self.password = password or os.getenv("OV_PASSWORD")
         self.headless = headless
+        self.debug = debug
 
         if not self.customer_id or not self.password:
             raise ValueError(
                 "OV_CUSTOMER_ID and OV_PASSWORD required (set in .env or pass as args)"
             )
 
+        # Failure screenshots are always written, the routine per-run page dump
+        # only when debug is enabled; the directory is created on first write
+        self._screenshots_dir = Path("data/screenshots")
+
+        self._scope_path = self._load_scope_path()
+
+    def _screenshot_path(self, filename: str) -> Path:
+        """Path for a debug artifact, creating data/screenshots if needed."""
+        self._screenshots_dir.mkdir(parents=True, exist_ok=True)
+        return self._screenshots_dir / filename
+
+    @staticmethod
+    def _load_scope_path() -> Optional[str]:
+        """Load the cached Angular scope path from a previous run."""
+        try:
+            return json.loads(SCOPE_PATH_CACHE.read_text()).get("scope_path")
+        except Exception:
+            return None
+
+    def _save_scope_path(self, scope_path: str) -> None:
+        """Remember the Angular scope path that held Leagues for the next run."""
+        if scope_path == self._scope_path:
+            return
+        self._scope_path = scope_path
+        try:
+            SCOPE_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            SCOPE_PATH_CACHE.write_text(json.dumps({"scope_path": scope_path}))
+        except OSError as e:
+            logger.warning("Could not cache scope path: %s", e)
+
     def login(self, page: Page) -> bool:
         """Log in to overtime.ag.
 
@@ -94,9 +140,18 @@ class OvertimeScraper:
             True if login successful, False otherwise
         """
         try:
-            print("Navigating to overtime.ag...")
-            page.goto("https://overtime.ag/sports#/", wait_until="networkidle")
-            page.wait_for_timeout(2000)
+            logger.info("Navigating to overtime.ag...")
+            # The sportsbook holds long-poll/websocket connections open for live odds,
+            # so "networkidle" never fires; wait for the DOM plus the login form instead.
+            page.goto("https://overtime.ag/sports#/", wait_until="domcontentloaded")
+            try:
+                page.wait_for_selector(
+                    'input[placeholder*="Customer"], input[name="customerid"], '
+                    'input[name="customerId"]',
+                    timeout=10000,
+                )
+            except Exception:
+                logger.warning("Customer ID field not detected, trying fallback selectors...")
 
             # Find username field
             username_selectors = [
@@ -117,7 +172,7 @@ class OvertimeScraper:
                     continue
 
             if not username_field:
-                print("ERROR: Could not find username field")
+                logger.error("Could not find username field")
                 return False
 
             # Fill login form
@@ -148,11 +203,11 @@ class OvertimeScraper:
 
             # Wait for login to complete
             page.wait_for_timeout(3000)
-            print("Login successful")
+            logger.info("Login successful")
             return True
 
         except Exception as e:
-            print(f"Login failed: {e}")
+            logger.error("Login failed: %s", e)
             return False
 
     def navigate_to_ncaab(self, page: Page, section: str = "College Basketball") -> bool:
@@ -166,10 +221,15 @@ class OvertimeScraper:
             True if navigation successful, False otherwise
         """
         try:
-            print(f"Navigating to {section} section...")
+            logger.info("Navigating to %s section...", section)
 
-            # Wait for page to fully load after login
-            page.wait_for_load_state("networkidle", timeout=10000)
+            # Wait for the sport menu rather than "networkidle" (live-odds long-polls
+            # keep the network busy, so networkidle only resolves on timeout)
+            page.wait_for_load_state("domcontentloaded", timeout=10000)
+            try:
+                page.wait_for_selector("#img_Basketball, [id*='Basketball']", timeout=10000)
+            except Exception:
+                logger.warning("Basketball menu not detected yet, continuing...")
 
             # Check if Basketball submenu is already expanded
             # (avoid toggling it closed by clicking again)
@@ -178,7 +238,7 @@ class OvertimeScraper:
                 submenu = page.locator("#sp_Basketball")
                 submenu_visible = submenu.is_visible(timeout=1000)
                 if submenu_visible:
-                    print("Basketball submenu already expanded")
+                    logger.debug("Basketball submenu already expanded")
             except Exception:
                 pass
 
@@ -198,14 +258,14 @@ class OvertimeScraper:
                         if basketball_icon.is_visible(timeout=2000):
                             basketball_icon.click()
                             page.wait_for_timeout(1500)
-                            print(f"Clicked Basketball section (selector: {selector})")
+                            logger.debug("Clicked Basketball section (selector: %s)", selector)
                             basketball_clicked = True
                             break
                     except Exception:
                         continue
 
                 if not basketball_clicked:
-                    print("WARNING: Could not click Basketball icon, trying direct navigation...")
+                    logger.warning("Could not click Basketball icon, trying direct navigation...")
 
             # Wait for the Basketball submenu to expand
             page.wait_for_timeout(1000)
@@ -240,7 +300,7 @@ class OvertimeScraper:
                         return Array.from(items).map(l => l.textContent.trim());
                     }
                 """)
-                print(f"Available Basketball menu items: {menu_items}")
+                logger.debug("Available Basketball menu items: %s", menu_items)
             except Exception:
                 pass
 
@@ -254,25 +314,66 @@ class OvertimeScraper:
                             college_bball.element_handle(),
                         )
                         page.wait_for_timeout(2000)
-                        print(f"Navigated to {section} (selector: {selector})")
+                        logger.info("Navigated to %s (selector: %s)", section, selector)
                         return True
                 except Exception as e:
                     # Only log failures for text-based selectors (reduce noise)
                     if "nth-child" not in selector:
-                        print(f"Selector {selector} failed: {e}")
+                        logger.debug("Selector %s failed: %s", selector, e)
                     continue
 
             # Save debug screenshot on failure
-            screenshot_dir = Path("data/screenshots")
-            screenshot_dir.mkdir(parents=True, exist_ok=True)
-            page.screenshot(path=str(screenshot_dir / "navigation_failed.png"))
-            print(f"Debug screenshot saved to {screenshot_dir / 'navigation_failed.png'}")
+            screenshot_path = self._screenshot_path("navigation_failed.png")
+            page.screenshot(path=screenshot_path)
+            logger.info("Debug screenshot saved to %s", screenshot_path)
 
-            print(f"ERROR: Could not navigate to {section}")
+            logger.error("Could not navigate to %s", section)
             return False
 
         except Exception as e:
-            print(f"Navigation failed: {e}")
+            logger.error("Navigation failed: %s", e)
+            return False
+
+    def _save_page_dump(self, page: Page) -> None:
+        """Save a screenshot and the page HTML for inspection."""
+        screenshot_path = self._screenshot_path("overtime_ncaab_games.png")
+        page.screenshot(path=screenshot_path)
+        logger.info("Screenshot saved to %s", screenshot_path)
+
+        html_path = self._screenshot_path("overtime_ncaab_games.html")
+        html_path.write_text(page.content(), encoding="utf-8")
+        logger.info("HTML saved to %s", html_path)
+
+    def _wait_for_angular_leagues(self, page: Page, timeout: int = 15000) -> bool:
+        """Wait until the Angular scope has populated ``Leagues``.
+
+        Polls inside the browser, so it returns as soon as the odds data is
+        bound instead of sleeping for a fixed interval.
+
+        Args:
+            page: Playwright page object
+            timeout: Maximum time to wait in milliseconds
+
+        Returns:
+            True if Leagues were populated, False on timeout
+        """
+        try:
+            page.wait_for_function(
+                """
+                () => {
+                    if (!window.angular) return false;
+                    const s = angular.element(document.body).scope();
+                    if (s && s.Leagues && s.Leagues.length) return true;
+                    const el = document.getElementById('gamesAccordion');
+                    const s2 = el ? angular.element(el).scope() : null;
+                    return !!(s2 && s2.Leagues && s2.Leagues.length);
+                }
+                """,
+                timeout=timeout,
+            )
+            return True
+        except Exception:
+            logger.warning("Angular scope Leagues not populated before timeout")
             return False
 
     def _extract_from_dom(self, page: Page) -> list[dict]:
@@ -407,10 +508,10 @@ class OvertimeScraper:
         games = []
 
         try:
-            print("Scraping games...")
+            logger.info("Scraping games...")
 
-            # Wait for games to load (longer wait for Angular)
-            page.wait_for_timeout(5000)
+            # Wait for Angular to bind the games (returns as soon as data is present)
+            self._wait_for_angular_leagues(page)
 
             # Try to expand College Basketball section if collapsed
             try:
@@ -418,89 +519,120 @@ class OvertimeScraper:
                 if expand_btn.is_visible(timeout=1000):
                     expand_btn.click()
                     page.wait_for_timeout(2000)
-                    print("Expanded College Basketball section")
+                    logger.debug("Expanded College Basketball section")
             except Exception:
                 pass
 
             # Scroll down to ensure all games are loaded
             page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(2000)
-
-            # Save screenshot for debugging
-            screenshots_dir = Path("data/screenshots")
-            screenshots_dir.mkdir(exist_ok=True)
-            screenshot_path = screenshots_dir / "overtime_ncaab_games.png"
-            page.screenshot(path=screenshot_path)
-            print(f"Screenshot saved to {screenshot_path}")
 
-            # Save HTML for inspection
-            html_content = page.content()
-            html_path = screenshots_dir / "overtime_ncaab_games.html"
-            html_path.write_text(html_content, encoding="utf-8")
-            print(f"HTML saved to {html_path}")
+            if self.debug:
+                self._save_page_dump(page)
 
             # Extract game data from Angular scope
             # overtime.ag uses AngularJS, so data is in scope
-            scope_debug = page.evaluate("""
-                () => {
-                    // Find all scopes and check for Leagues
-                    const allScopes = [];
-                    let currentScope = angular.element(document.body).scope();
-
-                    // Traverse scope tree
-                    function findLeagues(scope, path = 'root', depth = 0) {
-                        if (depth > 10) return null;  // Prevent infinite loops
-
-                        if (scope && scope.Leagues) {
-                            return {
-                                path: path,
-                                count: scope.Leagues.length,
-                                leagues: scope.Leagues.map(
-                                    l => l.LeagueName || 'unnamed'
-                                ),
-                            };
-                        }
+            # (the scope tree dump is diagnostic only - skip the extra round trip in production)
+            if self.debug:
+                scope_debug = page.evaluate("""
+                    () => {
+                        // Find all scopes and check for Leagues
+                        const allScopes = [];
+                        let currentScope = angular.element(document.body).scope();
 
-                        // Check children
-                        if (scope.$$childHead) {
-                            const result = findLeagues(
-                                scope.$$childHead,
-                                path + '.child',
-                                depth + 1
-                            );
-                            if (result) return result;
-                        }
+                        // Traverse scope tree
+                        function findLeagues(scope, path = 'root', depth = 0) {
+                            if (depth > 10) return null;  // Prevent infinite loops
+
+                            if (scope && scope.Leagues) {
+                                return {
+                                    path: path,
+                                    count: scope.Leagues.length,
+                                    leagues: scope.Leagues.map(
+                                        l => l.LeagueName || 'unnamed'
+                                    ),
+                                };
+                            }
+
+                            // Check children
+                            if (scope.$$childHead) {
+                                const result = findLeagues(
+                                    scope.$$childHead,
+                                    path + '.child',
+                                    depth + 1
+                                );
+                                if (result) return result;
+                            }
+
+                            // Check siblings
+                            if (scope.$$nextSibling) {
+                                const result = findLeagues(
+                                    scope.$$nextSibling,
+                                    path + '.sibling',
+                                    depth + 1
+                                );
+                                if (result) return result;
+                            }
 
-                        // Check siblings
-                        if (scope.$$nextSibling) {
-                            const result = findLeagues(
-                                scope.$$nextSibling,
-                                path + '.sibling',
-                                depth + 1
-                            );
-                            if (result) return result;
+                            return null;
                         }
 
-                        return null;
+                        const result = findLeagues(currentScope);
+                        return result || {error: 'Leagues not found in scope tree'};
                     }
+                """)
+                logger.debug("Angular scope search: %s", scope_debug)
 
-                    const result = findLeagues(currentScope);
-                    return result || {error: 'Leagues not found in scope tree'};
-                }
-            """)
-            print(f"\nAngular scope search: {scope_debug}")
-
-            game_data = page.evaluate("""
-                () => {
+            # Lookup order: body scope, cached path from a previous run,
+            # gamesAccordion, then a bounded walk of the scope tree
+            extraction = page.evaluate(
+                """
+                (cachedPath) => {
                     const games = [];
+                    const root = angular.element(document.body).scope();
+
+                    // Follow a path like "root.child.sibling" from the root scope
+                    function followPath(path) {
+                        let s = root;
+                        for (const step of path.split('.').slice(1)) {
+                            if (!s) return null;
+                            s = (step === 'child') ? s.$$childHead : s.$$nextSibling;
+                        }
+                        return s;
+                    }
+
+                    function findLeagues(s, path, depth) {
+                        if (!s || depth > 10) return null;  // Prevent infinite loops
+                        if (s.Leagues) return {scope: s, path: path};
+                        return findLeagues(s.$$childHead, path + '.child', depth + 1)
+                            || findLeagues(s.$$nextSibling, path + '.sibling', depth + 1);
+                    }
+
                     // Try body scope first (usually has root controller)
-                    let scope = angular.element(document.body).scope();
+                    let scope = root;
+                    let path = 'root';
+
+                    if ((!scope || !scope.Leagues) && cachedPath) {
+                        const cached = followPath(cachedPath);
+                        if (cached && cached.Leagues) {
+                            scope = cached;
+                            path = cachedPath;
+                        }
+                    }
 
                     // Fallback to gamesAccordion
                     if (!scope || !scope.Leagues) {
                         scope = angular.element(
                             document.getElementById('gamesAccordion')
                         ).scope();
+                        path = null;
+                    }
+
+                    if ((!scope || !scope.Leagues) && root) {
+                        const found = findLeagues(root, 'root', 0);
+                        if (found) {
+                            scope = found.scope;
+                            path = found.path;
+                        }
                     }
 
                     if (scope && scope.Leagues) {
@@ -532,17 +664,24 @@ class OvertimeScraper:
                             }
                         });
                     }
-                    return games;
+                    return {games: games, path: path};
                 }
-            """)
+                """,
+                self._scope_path,
+            )
+            game_data = extraction["games"]
+            if game_data and extraction["path"]:
+                self._save_scope_path(extraction["path"])
 
-            print(f"\nExtracted {len(game_data)} games from Angular scope")
+            logger.info("Extracted %d games from Angular scope", len(game_data))
 
             # If Angular extraction failed, try DOM-based extraction
             if not game_data:
-                print("\nAngular extraction failed. Trying DOM-based extraction...")
+                logger.warning("Angular extraction failed. Trying DOM-based extraction...")
                 game_data = self._extract_from_dom(page)
-                print(f"Extracted {len(game_data)} games from DOM")
+                logger.info("Extracted %d games from DOM", len(game_data))
+                if not game_data and not self.debug:
+                    self._save_page_dump(page)
 
             # Helper to parse spread values (handles PK=0 and explicit 0 values)
             def parse_spread(value) -> Optional[float]:
@@ -582,15 +721,14 @@ class OvertimeScraper:
                         game_time=game["game_time"],
                     )
                     games.append(odds)
-                    print(f"  {odds.away_team} @ {odds.home_team}")
+                    logger.debug("  %s @ %s", odds.away_team, odds.home_team)
                 except Exception as e:
-                    print(f"  Error parsing game: {e}")
-                    print(f"  Data: {game}")
+                    logger.warning("Error parsing game: %s (data: %s)", e, game)
 
             return games
 
         except Exception as e:
-            print(f"Scraping failed: {e}")
+            logger.error("Scraping failed: %s", e)
             return games
 
     def fetch_ncaab_odds(self, include_extra: bool = True) -> pd.DataFrame:
@@ -610,9 +748,14 @@ class OvertimeScraper:
             - sport: Sport identifier (NCAAB)
         """
         with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            context = browser.new_context()
-            page = context.new_page()
+            # Persistent profile: static JS/CSS bundles are served from disk cache on reruns
+            CHROME_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            context = p.chromium.launch_persistent_context(
+                str(CHROME_PROFILE_DIR),
+                headless=self.headless,
+                args=[f"--disk-cache-size={CHROME_DISK_CACHE_BYTES}"],
+            )
+            page = context.pages[0] if context.pages else context.new_page()
 
             try:
                 # Login
@@ -624,18 +767,17 @@ class OvertimeScraper:
                 # Navigate to NCAA Basketball and scrape
                 if self.navigate_to_ncaab(page, "College Basketball"):
                     games = self.scrape_games(page)
-                    print(f"\nScraped {len(games)} games from College Basketball")
+                    logger.info("Scraped %d games from College Basketball", len(games))
                     all_games.extend(games)
 
                 # Also scrape College Extra if requested
                 if include_extra:
-                    print("\n" + "=" * 50)
                     if self.navigate_to_ncaab(page, "College Extra"):
                         extra_games = self.scrape_games(page)
-                        print(f"\nScraped {len(extra_games)} games from College Extra")
+                        logger.info("Scraped %d games from College Extra", len(extra_games))
                         all_games.extend(extra_games)
                     else:
-                        print("College Extra section not found or empty")
+                        logger.info("College Extra section not found or empty")
 
                 # Convert to DataFrame
                 if all_games:
@@ -663,26 +805,35 @@ class OvertimeScraper:
                 return df
 
             finally:
-                browser.close()
+                context.close()
 
 
 def main():
-    """CLI entry point for scraping overtime.ag odds."""
+    """CLI entry point for scraping overtime.ag odds.
+
+    Odds are written gzip-compressed (team names and prices compress 5-8x).
+    pandas reads them back transparently:
+
+        >>> df = pd.read_csv("data/overtime_ncaab_odds_2025-01-15.csv.gz")
+    """
     from datetime import date
 
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s - %(message)s"
+    )
+
     scraper = OvertimeScraper(headless=True)  # Headless for production/CI
     df = scraper.fetch_ncaab_odds(include_extra=True)  # Scrape both sections
 
     if not df.empty:
         today = date.today().isoformat()
-        output_path = Path(f"data/overtime_ncaab_odds_{today}.csv")
+        output_path = Path(f"data/overtime_ncaab_odds_{today}.csv.gz")
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(output_path, index=False)
-        print(f"\n{'=' * 50}")
-        print(f"TOTAL: {len(df)} unique games scraped")
-        print(f"Odds exported to: {output_path}")
+        df.to_csv(output_path, index=False, compression="gzip")
+        logger.info("TOTAL: %d unique games scraped", len(df))
+        logger.info("Odds exported to: %s", output_path)
     else:
-        print("\nNo games scraped. Check screenshots to debug.")
+        logger.warning("No games scraped. Check screenshots to debug.")
 
 
 if __name__ == "__main__":
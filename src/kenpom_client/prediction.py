@@ -12,18 +12,52 @@ Key Features:
 - Score projection: Individual team scores using OE/DE crossover
 - Luck regression: Adjusts for unsustainable performance
 - ML-ready architecture: Coefficients replaceable for machine learning
+- Batch prediction: Vectorized NumPy path for whole slates
+- Bracket matrix: N x N pairwise predictions for simulation
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import math
-from dataclasses import dataclass
-from typing import Optional, Union
+import os
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Optional, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+from kenpom_client.cache import ArrayCache
+from kenpom_client.jit import njit
+from kenpom_client.matchup import (
+    PACE_SIGN,
+    STYLE_VARIANCE_MULTIPLIER,
+    MatchupFeatures,
+    TeamData,
+    TeamFeatureVector,
+    calculate_matchup_features,
+    calculate_matchup_features_frame,
+    calculate_matchup_features_from_cached,
+    load_hca_snapshot,
+    precompute_team_features,
+)
+from kenpom_client.models import ArchiveRating
+
+if TYPE_CHECKING:
+    from kenpom_client.models import Rating
+
+try:
+    # Optional: C implementations of the standard normal CDF and the logistic
+    # sigmoid (scalar + array)
+    from scipy.special import expit as _expit
+    from scipy.special import ndtr as _ndtr
+except ImportError:  # pragma: no cover - scipy is not a hard dependency
+    _expit = None
+    _ndtr = None
 
-from kenpom_client.matchup import MatchupFeatures
-from kenpom_client.models import ArchiveRating, Rating
 
 # Default home court advantage in college basketball (points)
 # This is used as a fallback when team-specific HCA data is not available
@@ -48,13 +82,27 @@ LUCK_REGRESSION_FACTOR = 0.5
 # Formula: HCA_EFF = HCA_POINTS * 100 / avg_possessions ≈ 3.5 * 100 / 70 = 5.0
 HCA_EFFICIENCY_BOOST = 5.0
 
+# 1/sqrt(2) for the erf-based normal CDF (multiply instead of sqrt + divide)
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
+# Batched/grid predictions default to float32: inputs are ratings/sigmas with
+# ~0.1 pt resolution, so single precision (~1e-7 relative) loses nothing that
+# matters while halving memory traffic and doubling SIMD lanes. The scalar
+# single-game API stays float64.
+_BATCH_DTYPE = np.float32
+
+# Per-user cache for predict_bracket_matrix_cached (independent of the cwd)
+PREDICTION_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "kenpom_client", "predictions"
+)
+
 
 # =============================================================================
 # Score Projection (Individual Team Scores)
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoreProjection:
     """Projected scores for a game using OE/DE crossover method.
 
@@ -94,11 +142,39 @@ def sigmoid_winprob(margin: float, k: float = DEFAULT_SIGMOID_K) -> float:
 
     Example:
         >>> sigmoid_winprob(10.0)  # 10-point favorite
-        0.7109...
+        0.7128...
         >>> sigmoid_winprob(0.0)   # Even game
         0.5
     """
-    return 1.0 / (1.0 + math.exp(-margin / k))
+    x = margin / k
+    if x >= 0.0:
+        return 1.0 / (1.0 + math.exp(-x))
+    # Stable form for large negative margins (math.exp(-x) would overflow)
+    e = math.exp(x)
+    return e / (1.0 + e)
+
+
+def sigmoid_winprob_vec(margin: np.ndarray, k: float = DEFAULT_SIGMOID_K) -> np.ndarray:
+    """Vectorized sigmoid_winprob over an array of margins.
+
+    Uses scipy.special.expit when scipy is installed, otherwise the
+    overflow-safe form exp(-logaddexp(0, -x)) evaluated with NumPy.
+
+    Args:
+        margin: Array of point spreads (positive = home favored)
+        k: Scaling factor (default 11.0)
+
+    Returns:
+        Array of home win probabilities [0, 1], in the margin's floating
+        dtype (float64 for integer or object input)
+    """
+    x = np.asarray(margin)
+    if not np.issubdtype(x.dtype, np.floating):
+        x = x.astype(np.float64)
+    x = x / k
+    if _expit is not None:
+        return _expit(x)
+    return np.exp(-np.logaddexp(0.0, -x))
 
 
 def project_scores(
@@ -159,10 +235,11 @@ def project_scores(
     win_prob_home = sigmoid_winprob(proj_margin, k)
     win_prob_visitor = 1.0 - win_prob_home
 
-    # Determine method and feature source
-    method = "archive" if isinstance(home, ArchiveRating) else "ratings"
+    # Determine method and feature source (one type check for both)
+    is_archive = isinstance(home, ArchiveRating)
+    method = "archive" if is_archive else "ratings"
     if feature_source is None:
-        if isinstance(home, ArchiveRating):
+        if is_archive:
             feature_source = f"archive:{home.ArchiveDate}"
         else:
             feature_source = f"ratings:{home.DataThrough}"
@@ -182,12 +259,96 @@ def project_scores(
     )
 
 
+def ratings_to_soa(
+    ratings: Sequence[Union[Rating, ArchiveRating]],
+) -> dict[str, np.ndarray]:
+    """Convert a list of ratings to structure-of-arrays form.
+
+    Args:
+        ratings: Rating or ArchiveRating records (e.g., client.ratings(y=2025))
+
+    Returns:
+        Dict with float64 arrays AdjTempo, AdjOE, AdjDE, Luck (one entry per
+        team, in input order; Luck is NaN where unavailable, e.g. archives)
+
+    Example:
+        >>> soa = ratings_to_soa(client.ratings(y=2025))
+        >>> soa["AdjOE"].mean()
+    """
+    return {
+        "AdjTempo": np.fromiter((r.AdjTempo for r in ratings), np.float64, len(ratings)),
+        "AdjOE": np.fromiter((r.AdjOE for r in ratings), np.float64, len(ratings)),
+        "AdjDE": np.fromiter((r.AdjDE for r in ratings), np.float64, len(ratings)),
+        "Luck": np.fromiter(
+            (np.nan if (luck := getattr(r, "Luck", None)) is None else luck for r in ratings),
+            np.float64,
+            len(ratings),
+        ),
+    }
+
+
+def project_scores_batch(
+    home_soa: dict[str, np.ndarray],
+    visitor_soa: dict[str, np.ndarray],
+    home_adv: float = DEFAULT_HOME_COURT_ADVANTAGE,
+    k: float = DEFAULT_SIGMOID_K,
+    dtype: type[np.floating] = _BATCH_DTYPE,
+) -> dict[str, np.ndarray]:
+    """Vectorized project_scores for every home x visitor pairing.
+
+    Broadcasts the OE/DE crossover method over all pairs at once: entry
+    [i, j] of each result array is project_scores(home[i], visitor[j]).
+
+    Args:
+        home_soa: Home teams from ratings_to_soa (length H)
+        visitor_soa: Visitor teams from ratings_to_soa (length V)
+        home_adv: Home court advantage in points (default 3.5)
+        k: Sigmoid scaling factor for win probability (default 11.0)
+        dtype: Floating dtype for the computation (default float32; pass
+               np.float64 for full precision)
+
+    Returns:
+        Dict of (H, V) arrays: proj_home, proj_visitor, proj_total,
+        proj_margin, possessions, win_prob_home, win_prob_visitor
+
+    Example:
+        >>> soa = ratings_to_soa(ratings)
+        >>> grid = project_scores_batch(soa, soa)  # every team hosting every team
+        >>> grid["proj_margin"][duke_idx, unc_idx]
+    """
+    home_tempo = home_soa["AdjTempo"].astype(dtype, copy=False)[:, None]
+    home_oe = home_soa["AdjOE"].astype(dtype, copy=False)[:, None]
+    home_de = home_soa["AdjDE"].astype(dtype, copy=False)[:, None]
+    visitor_tempo = visitor_soa["AdjTempo"].astype(dtype, copy=False)[None, :]
+    visitor_oe = visitor_soa["AdjOE"].astype(dtype, copy=False)[None, :]
+    visitor_de = visitor_soa["AdjDE"].astype(dtype, copy=False)[None, :]
+
+    poss = (home_tempo + visitor_tempo) / 2.0
+    e_home = (home_oe + visitor_de) / 2.0
+    e_visitor = (visitor_oe + home_de) / 2.0
+
+    proj_home = poss * e_home / 100.0 + (home_adv / 2.0)
+    proj_visitor = poss * e_visitor / 100.0 - (home_adv / 2.0)
+    proj_margin = proj_home - proj_visitor
+    win_prob_home = sigmoid_winprob_vec(proj_margin, k)
+
+    return {
+        "proj_home": proj_home,
+        "proj_visitor": proj_visitor,
+        "proj_total": proj_home + proj_visitor,
+        "proj_margin": proj_margin,
+        "possessions": poss,
+        "win_prob_home": win_prob_home,
+        "win_prob_visitor": 1.0 - win_prob_home,
+    }
+
+
 # =============================================================================
 # Enhanced Score Projection (Log-Linear Formula)
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnhancedScoreProjection:
     """Projected scores using log-linear efficiency formula.
 
@@ -250,6 +411,44 @@ def calculate_luck_adjustment(luck: Optional[float]) -> float:
     return -luck * LUCK_REGRESSION_FACTOR * 10.0
 
 
+@njit(cache=True)
+def _loglinear_kernel(
+    poss: float,
+    home_oe: float,
+    home_de: float,
+    visitor_oe: float,
+    visitor_de: float,
+    luck_adj_home: float,
+    luck_adj_visitor: float,
+    home_adv: float,
+) -> tuple[float, float, float, float, float, float, float]:
+    """Log-linear projection arithmetic on plain floats (numba-compiled if available).
+
+    Returns:
+        Tuple of (proj_home, proj_visitor, proj_total, proj_margin,
+        hca_efficiency, eff_home_raw, eff_visitor_raw)
+    """
+    # Log-linear efficiencies: E = OE + DE - 100
+    eff_home_raw = home_oe + visitor_de - D1_AVERAGE_EFFICIENCY
+    eff_visitor_raw = visitor_oe + home_de - D1_AVERAGE_EFFICIENCY
+
+    # HCA on efficiency adds poss * (home_adv * 100 / poss) / 100 == home_adv
+    # points, so add it to the score directly; the efficiency form is only
+    # reported for diagnostics
+    proj_home = poss * (eff_home_raw + luck_adj_home) / 100.0 + home_adv
+    proj_visitor = poss * (eff_visitor_raw + luck_adj_visitor) / 100.0
+    hca_efficiency = home_adv * 100.0 / poss
+    return (
+        proj_home,
+        proj_visitor,
+        proj_home + proj_visitor,
+        proj_home - proj_visitor,
+        hca_efficiency,
+        eff_home_raw,
+        eff_visitor_raw,
+    )
+
+
 def project_scores_loglinear(
     home: Union[Rating, ArchiveRating],
     visitor: Union[Rating, ArchiveRating],
@@ -304,41 +503,40 @@ def project_scores_loglinear(
     else:
         poss = (home.AdjTempo + visitor.AdjTempo) / 2.0
 
-    # Step 2: Compute expected efficiencies using LOG-LINEAR formula
-    # E = OE + DE - 100 (not simple average)
-    # This correctly combines efficiencies relative to D1 average baseline
-    eff_home_raw = home.AdjOE + visitor.AdjDE - D1_AVERAGE_EFFICIENCY
-    eff_visitor_raw = visitor.AdjOE + home.AdjDE - D1_AVERAGE_EFFICIENCY
-
-    # Step 3: Apply luck regression (if available and enabled)
+    # Step 2: Apply luck regression (if available and enabled)
+    # Luck only exists on Rating; one type check per team replaces a getattr
+    # that raises and swallows AttributeError on ArchiveRating
+    is_archive = isinstance(home, ArchiveRating)
     luck_adj_home = 0.0
     luck_adj_visitor = 0.0
 
     if apply_luck_regression:
-        # Get luck values (only available in Rating, not ArchiveRating)
-        home_luck = getattr(home, "Luck", None)
-        visitor_luck = getattr(visitor, "Luck", None)
-
-        luck_adj_home = calculate_luck_adjustment(home_luck)
-        luck_adj_visitor = calculate_luck_adjustment(visitor_luck)
-
-    # Step 4: Apply HCA to efficiency (not just score)
-    # Convert point-based HCA to efficiency-based HCA
-    # HCA_efficiency = HCA_points * 100 / possessions
-    hca_efficiency = home_adv * 100.0 / poss
-
-    # Home team gets offensive efficiency boost
-    # Visitor team gets no adjustment (or equivalently, faces tougher defense)
-    eff_home = eff_home_raw + hca_efficiency + luck_adj_home
-    eff_visitor = eff_visitor_raw + luck_adj_visitor
-
-    # Step 5: Compute projected scores
-    proj_home = poss * eff_home / 100.0
-    proj_visitor = poss * eff_visitor / 100.0
-
-    # Step 6: Compute derived outputs
-    proj_total = proj_home + proj_visitor
-    proj_margin = proj_home - proj_visitor
+        if not is_archive:
+            luck_adj_home = calculate_luck_adjustment(home.Luck)
+        if not isinstance(visitor, ArchiveRating):
+            luck_adj_visitor = calculate_luck_adjustment(visitor.Luck)
+
+    # Steps 3-6: Log-linear efficiencies (E = OE + DE - 100, relative to the
+    # D1 baseline), HCA applied to home offensive efficiency, projected
+    # scores, and derived outputs -- one kernel call on plain floats
+    (
+        proj_home,
+        proj_visitor,
+        proj_total,
+        proj_margin,
+        hca_efficiency,
+        eff_home_raw,
+        eff_visitor_raw,
+    ) = _loglinear_kernel(
+        poss,
+        home.AdjOE,
+        home.AdjDE,
+        visitor.AdjOE,
+        visitor.AdjDE,
+        luck_adj_home,
+        luck_adj_visitor,
+        home_adv,
+    )
 
     # Step 7: Compute win probability using normal CDF
     # More accurate than sigmoid for point spreads
@@ -346,7 +544,6 @@ def project_scores_loglinear(
     win_prob_visitor = 1.0 - win_prob_home
 
     # Determine method and feature source
-    is_archive = isinstance(home, ArchiveRating)
     method = "loglinear_archive" if is_archive else "loglinear"
 
     if feature_source is None:
@@ -375,10 +572,96 @@ def project_scores_loglinear(
     )
 
 
+def project_scores_loglinear_batch(
+    home_soa: dict[str, np.ndarray],
+    visitor_soa: dict[str, np.ndarray],
+    home_adv: float = DEFAULT_HOME_COURT_ADVANTAGE,
+    k: float = DEFAULT_SIGMOID_K,
+    apply_luck_regression: bool = True,
+    dtype: type[np.floating] = _BATCH_DTYPE,
+) -> dict[str, np.ndarray]:
+    """Vectorized project_scores_loglinear for every home x visitor pairing.
+
+    Broadcasts the log-linear formula over all pairs at once: entry [i, j]
+    of each result array is project_scores_loglinear(home[i], visitor[j]).
+    Possessions are always the average of the team tempos (no PredTempo).
+
+    Args:
+        home_soa: Home teams from ratings_to_soa (length H)
+        visitor_soa: Visitor teams from ratings_to_soa (length V)
+        home_adv: Home court advantage in points (default 3.5)
+        k: Sigma for win probability calculation (default 11.0)
+        apply_luck_regression: Whether to apply luck adjustment (default True)
+        dtype: Floating dtype for the computation (default float32)
+
+    Returns:
+        Dict of arrays broadcastable to (H, V): proj_home, proj_visitor,
+        proj_total, proj_margin, possessions, hca_efficiency, eff_home_raw,
+        eff_visitor_raw, luck_adjustment_home, luck_adjustment_visitor,
+        win_prob_home, win_prob_visitor
+
+    Example:
+        >>> soa = ratings_to_soa(client.ratings(y=2025))
+        >>> grid = project_scores_loglinear_batch(soa, soa)
+        >>> grid["proj_margin"][gonzaga_idx, bucknell_idx]
+    """
+
+    def column(soa: dict[str, np.ndarray], name: str) -> np.ndarray:
+        return soa[name].astype(dtype, copy=False)
+
+    home_tempo = column(home_soa, "AdjTempo")[:, None]
+    visitor_tempo = column(visitor_soa, "AdjTempo")[None, :]
+    poss = (home_tempo + visitor_tempo) / 2.0
+
+    # Log-linear efficiencies: E = OE + DE - 100
+    eff_home_raw = (
+        column(home_soa, "AdjOE")[:, None]
+        + column(visitor_soa, "AdjDE")[None, :]
+        - D1_AVERAGE_EFFICIENCY
+    )
+    eff_visitor_raw = (
+        column(visitor_soa, "AdjOE")[None, :]
+        + column(home_soa, "AdjDE")[:, None]
+        - D1_AVERAGE_EFFICIENCY
+    )
+
+    # Luck regression (missing luck -> no adjustment, as in calculate_luck_adjustment)
+    if apply_luck_regression:
+        luck_scale = -LUCK_REGRESSION_FACTOR * 10.0
+        luck_adj_home = np.nan_to_num(column(home_soa, "Luck") * luck_scale)[:, None]
+        luck_adj_visitor = np.nan_to_num(column(visitor_soa, "Luck") * luck_scale)[None, :]
+    else:
+        luck_adj_home = np.zeros((len(home_soa["AdjTempo"]), 1), dtype=dtype)
+        luck_adj_visitor = np.zeros((1, len(visitor_soa["AdjTempo"])), dtype=dtype)
+
+    # HCA on efficiency is home_adv points on the score (see _loglinear_kernel)
+    proj_home = poss * (eff_home_raw + luck_adj_home) / 100.0 + home_adv
+    proj_visitor = poss * (eff_visitor_raw + luck_adj_visitor) / 100.0
+    hca_efficiency = home_adv * 100.0 / poss
+    proj_margin = proj_home - proj_visitor
+    win_prob_home = normal_cdf_array(proj_margin / k)
+
+    return {
+        "proj_home": proj_home,
+        "proj_visitor": proj_visitor,
+        "proj_total": proj_home + proj_visitor,
+        "proj_margin": proj_margin,
+        "possessions": poss,
+        "hca_efficiency": hca_efficiency,
+        "eff_home_raw": eff_home_raw,
+        "eff_visitor_raw": eff_visitor_raw,
+        "luck_adjustment_home": luck_adj_home,
+        "luck_adjustment_visitor": luck_adj_visitor,
+        "win_prob_home": win_prob_home,
+        "win_prob_visitor": 1.0 - win_prob_home,
+    }
+
+
 def normal_cdf(x: float) -> float:
     """Approximate the cumulative distribution function of standard normal.
 
-    Uses the error function approximation for faster calculation without scipy.
+    Uses scipy.special.ndtr when scipy is installed, otherwise falls back to
+    the error function formula 0.5 * (1 + erf(x / sqrt(2))).
 
     Args:
         x: Standard score (z-score)
@@ -386,7 +669,9 @@ def normal_cdf(x: float) -> float:
     Returns:
         Probability that a standard normal variable is less than x
     """
-    return (1.0 + math.erf(x / math.sqrt(2.0))) / 2.0
+    if _ndtr is not None:
+        return float(_ndtr(x))
+    return 0.5 * (1.0 + math.erf(x * _INV_SQRT2))
 
 
 # Heuristic coefficients for enhanced margin model
@@ -415,12 +700,24 @@ VARIANCE_COEFFICIENTS = {
     "tempo_mismatch_factor": 0.015,
     # Style clash increases variance
     # Research: 3PT vs interior matchups have 12-18% higher variance
-    "style_clash_3pt_vs_interior_boost": 1.10,
-    "style_clash_similar_boost": 1.0,
+    # (values shared with MatchupFeatures.style_variance_multiplier)
+    "style_clash_3pt_vs_interior_boost": STYLE_VARIANCE_MULTIPLIER["3pt_vs_interior"],
+    "style_clash_similar_boost": STYLE_VARIANCE_MULTIPLIER["similar"],
 }
 
+# Default coefficients bound to floats so the default path skips dict lookups
+_C_PACE = HEURISTIC_COEFFICIENTS["pace_control_per_5_tempo"]
+_C_EFG = HEURISTIC_COEFFICIENTS["shooting_matchup_per_5_efg"]
+_C_TO = HEURISTIC_COEFFICIENTS["turnover_battle_per_2_to"]
+_C_OR = HEURISTIC_COEFFICIENTS["rebounding_edge_per_3_or"]
+_C_CAP = HEURISTIC_COEFFICIENTS["max_total_adjustment"]
+_V_TEMPO = VARIANCE_COEFFICIENTS["tempo_mismatch_factor"]
+_V_STYLE_3PT = VARIANCE_COEFFICIENTS["style_clash_3pt_vs_interior_boost"]
+_V_STYLE_SIM = VARIANCE_COEFFICIENTS["style_clash_similar_boost"]
+_DEFAULT_COEFFICIENT_FLOATS = (_C_PACE, _C_EFG, _C_TO, _C_OR, _C_CAP)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MarginPrediction:
     """Complete prediction output with baseline and enhanced models.
 
@@ -495,77 +792,260 @@ def calculate_sigma_baseline(away_sigma: float, home_sigma: float) -> float:
     return (away_sigma + home_sigma) / 2.0
 
 
-def _adjust_for_pace(matchup_features: MatchupFeatures, coefficients: dict[str, float]) -> float:
-    """Calculate pace control adjustment.
+@njit(cache=True)
+def _adjustment_kernel(
+    delta_tempo: float,
+    pace_sign: float,
+    net_shooting: float,
+    turnover_advantage: float,
+    rebounding_advantage: float,
+    c_pace: float,
+    c_shooting: float,
+    c_turnover: float,
+    c_rebounding: float,
+    max_adjustment: float,
+) -> tuple[float, float, float, float, float]:
+    """Capped heuristic adjustment on plain floats (numba-compiled if available).
 
     Args:
-        matchup_features: Computed matchup features
-        coefficients: Heuristic coefficients
+        delta_tempo: Tempo difference from matchup features
+        pace_sign: +1.0 home controls pace, -1.0 away controls, 0.0 neutral
+        net_shooting: shooting_defense_advantage - shooting_advantage
+        turnover_advantage: Turnover advantage from matchup features
+        rebounding_advantage: Rebounding advantage from matchup features
+        c_pace: Points per 5 tempo of pace control
+        c_shooting: Points per 5% eFG of net shooting
+        c_turnover: Points per 2% TO of turnover advantage
+        c_rebounding: Points per 3% OR of rebounding advantage
+        max_adjustment: Hard cap on the total adjustment (± points)
 
     Returns:
-        Pace control adjustment in points (positive = home advantage)
-    """
-    if matchup_features.pace_control == "home_controls":
-        # Home team plays faster, small advantage
-        pace_diff = abs(matchup_features.delta_tempo)
-        return (pace_diff / 5.0) * coefficients["pace_control_per_5_tempo"]
-    elif matchup_features.pace_control == "away_controls":
-        # Away team plays faster, home loses advantage
-        pace_diff = abs(matchup_features.delta_tempo)
-        return -(pace_diff / 5.0) * coefficients["pace_control_per_5_tempo"]
-    else:  # "neutral"
-        return 0.0
+        Tuple of (total_adjustment, pace, shooting, turnover, rebounding)
+    """
+    # Pace control: faster team controlling tempo helps it (sign from pace_control)
+    adj_pace = pace_sign * (abs(delta_tempo) / 5.0) * c_pace
+    # Net shooting (home perspective): home offense vs away D minus away offense vs home D
+    adj_shooting = (net_shooting / 5.0) * c_shooting
+    # Positive turnover_advantage = home forces TOs better than away commits
+    adj_turnover = (turnover_advantage / 2.0) * c_turnover
+    # Positive rebounding_advantage = away gets offensive boards (hurts home)
+    adj_rebounding = -(rebounding_advantage / 3.0) * c_rebounding
 
+    # Sum and apply hard cap (±max_adjustment)
+    total = adj_pace + adj_shooting + adj_turnover + adj_rebounding
+    total_adjustment = min(max(total, -max_adjustment), max_adjustment)
+    return total_adjustment, adj_pace, adj_shooting, adj_turnover, adj_rebounding
 
-def _adjust_for_shooting(
-    matchup_features: MatchupFeatures, coefficients: dict[str, float]
-) -> float:
-    """Calculate shooting matchup adjustment.
+
+@njit(cache=True)
+def _enhanced_kernel(
+    home_adj_em: float,
+    away_adj_em: float,
+    home_court_factor: float,
+    delta_tempo: float,
+    pace_sign: float,
+    net_shooting: float,
+    turnover_advantage: float,
+    rebounding_advantage: float,
+    c_pace: float,
+    c_shooting: float,
+    c_turnover: float,
+    c_rebounding: float,
+    max_adjustment: float,
+) -> tuple[float, float, float, float, float]:
+    """Enhanced margin arithmetic on plain floats (numba-compiled if available).
 
     Args:
-        matchup_features: Computed matchup features
-        coefficients: Heuristic coefficients
+        home_adj_em: Home team adjusted efficiency margin
+        away_adj_em: Away team adjusted efficiency margin
+        home_court_factor: Team-specific home court advantage (points)
+        delta_tempo, pace_sign, net_shooting, turnover_advantage,
+        rebounding_advantage, c_*, max_adjustment: As in _adjustment_kernel
 
     Returns:
-        Shooting matchup adjustment in points (positive = home advantage)
+        Tuple of (margin_enhanced, pace, shooting, turnover, rebounding)
     """
-    # Net shooting advantage (home perspective)
-    # shooting_defense_advantage = home offense vs away defense
-    # shooting_advantage = away offense vs home defense
-    net_shooting = matchup_features.shooting_defense_advantage - matchup_features.shooting_advantage
-    return (net_shooting / 5.0) * coefficients["shooting_matchup_per_5_efg"]
-
+    total_adjustment, adj_pace, adj_shooting, adj_turnover, adj_rebounding = _adjustment_kernel(
+        delta_tempo,
+        pace_sign,
+        net_shooting,
+        turnover_advantage,
+        rebounding_advantage,
+        c_pace,
+        c_shooting,
+        c_turnover,
+        c_rebounding,
+        max_adjustment,
+    )
+    margin_enhanced = home_adj_em - away_adj_em + home_court_factor + total_adjustment
+    return margin_enhanced, adj_pace, adj_shooting, adj_turnover, adj_rebounding
 
-def _adjust_for_turnovers(
-    matchup_features: MatchupFeatures, coefficients: dict[str, float]
-) -> float:
-    """Calculate turnover battle adjustment.
 
-    Args:
-        matchup_features: Computed matchup features
-        coefficients: Heuristic coefficients
+@njit(cache=True)
+def _sigma_kernel(
+    away_sigma: float,
+    home_sigma: float,
+    tempo_mismatch: float,
+    style_multiplier: float,
+    tempo_factor: float,
+) -> tuple[float, float, float, float, float]:
+    """Game sigma arithmetic on plain floats (numba-compiled if available).
 
     Returns:
-        Turnover battle adjustment in points (positive = home advantage)
+        Tuple of (sigma_game, var_away, var_home, var_interaction, var_total)
     """
-    # Positive turnover_advantage = home forces TOs better than away commits
-    return (matchup_features.turnover_advantage / 2.0) * coefficients["turnover_battle_per_2_to"]
+    var_away = away_sigma * away_sigma
+    var_home = home_sigma * home_sigma
+    var_interaction = tempo_factor * (tempo_mismatch * tempo_mismatch) * style_multiplier
+    var_total = var_away + var_home + var_interaction
+    # Game variance can't be less than team variance
+    sigma_game = max(math.sqrt(var_total), away_sigma, home_sigma)
+    return sigma_game, var_away, var_home, var_interaction, var_total
 
 
-def _adjust_for_rebounding(
-    matchup_features: MatchupFeatures, coefficients: dict[str, float]
-) -> float:
-    """Calculate rebounding edge adjustment.
-
-    Args:
-        matchup_features: Computed matchup features
-        coefficients: Heuristic coefficients
+@njit(cache=True)
+def _predict_kernel(
+    home_adj_em: float,
+    away_adj_em: float,
+    home_sigma: float,
+    away_sigma: float,
+    hca: float,
+    delta_tempo: float,
+    pace_sign: float,
+    net_shooting: float,
+    to_adv: float,
+    or_adv: float,
+    tempo_mismatch: float,
+    style_multiplier: float,
+    c_pace: float,
+    c_shooting: float,
+    c_turnover: float,
+    c_rebounding: float,
+    max_adjustment: float,
+) -> tuple[float, ...]:
+    """Whole-game prediction arithmetic on plain floats (numba-compiled if available).
 
     Returns:
-        Rebounding edge adjustment in points (positive = home advantage)
+        Tuple of (margin_baseline, sigma_baseline, margin_enhanced, pace,
+        shooting, turnover, rebounding, sigma_game, var_away, var_home,
+        var_interaction, var_total)
     """
-    # Positive rebounding_advantage = away gets offensive boards (hurts home)
-    return -(matchup_features.rebounding_advantage / 3.0) * coefficients["rebounding_edge_per_3_or"]
+    margin_baseline = home_adj_em - away_adj_em + hca
+    sigma_baseline = (away_sigma + home_sigma) / 2.0
+    # Enhanced margin reuses margin_baseline instead of recomputing it
+    total_adjustment, adj_pace, adj_shooting, adj_turnover, adj_rebounding = _adjustment_kernel(
+        delta_tempo,
+        pace_sign,
+        net_shooting,
+        to_adv,
+        or_adv,
+        c_pace,
+        c_shooting,
+        c_turnover,
+        c_rebounding,
+        max_adjustment,
+    )
+    margin_enhanced = margin_baseline + total_adjustment
+    sigma_game, var_away, var_home, var_interaction, var_total = _sigma_kernel(
+        away_sigma, home_sigma, tempo_mismatch, style_multiplier, _V_TEMPO
+    )
+    return (
+        margin_baseline,
+        sigma_baseline,
+        margin_enhanced,
+        adj_pace,
+        adj_shooting,
+        adj_turnover,
+        adj_rebounding,
+        sigma_game,
+        var_away,
+        var_home,
+        var_interaction,
+        var_total,
+    )
+
+
+def _coefficient_floats(
+    coefficients: Optional[dict[str, float]],
+) -> tuple[float, float, float, float, float]:
+    """Return (pace, shooting, turnover, rebounding, cap) coefficient floats."""
+    if not coefficients:
+        return _DEFAULT_COEFFICIENT_FLOATS
+    return (
+        coefficients["pace_control_per_5_tempo"],
+        coefficients["shooting_matchup_per_5_efg"],
+        coefficients["turnover_battle_per_2_to"],
+        coefficients["rebounding_edge_per_3_or"],
+        coefficients.get("max_total_adjustment", 2.0),
+    )
+
+
+def _matchup_floats(
+    matchup_features: MatchupFeatures,
+) -> tuple[float, float, float, float, float, float]:
+    """Return (hca, delta_tempo, pace_sign, net_shooting, to_adv, or_adv)."""
+    mf = matchup_features
+    return (
+        mf.home_court_factor,
+        mf.delta_tempo,
+        mf.pace_sign,
+        mf.shooting_defense_advantage - mf.shooting_advantage,
+        mf.turnover_advantage,
+        mf.rebounding_advantage,
+    )
+
+
+def _enhanced_default(
+    home_adj_em: float,
+    away_adj_em: float,
+    hca: float,
+    delta_tempo: float,
+    pace_sign: float,
+    net_shooting: float,
+    to_adv: float,
+    or_adv: float,
+) -> tuple[float, float, float, float, float]:
+    """Enhanced margin with the heuristic coefficients (no dict access)."""
+    return _enhanced_kernel(
+        home_adj_em,
+        away_adj_em,
+        hca,
+        delta_tempo,
+        pace_sign,
+        net_shooting,
+        to_adv,
+        or_adv,
+        _C_PACE,
+        _C_EFG,
+        _C_TO,
+        _C_OR,
+        _C_CAP,
+    )
+
+
+def _enhanced_custom(
+    coefficients: dict[str, float],
+    home_adj_em: float,
+    away_adj_em: float,
+    hca: float,
+    delta_tempo: float,
+    pace_sign: float,
+    net_shooting: float,
+    to_adv: float,
+    or_adv: float,
+) -> tuple[float, float, float, float, float]:
+    """Enhanced margin with caller-supplied (e.g. ML-learned) coefficients."""
+    return _enhanced_kernel(
+        home_adj_em,
+        away_adj_em,
+        hca,
+        delta_tempo,
+        pace_sign,
+        net_shooting,
+        to_adv,
+        or_adv,
+        *_coefficient_floats(coefficients),
+    )
 
 
 def calculate_margin_enhanced(
@@ -573,7 +1053,8 @@ def calculate_margin_enhanced(
     away_adj_em: float,
     matchup_features: MatchupFeatures,
     coefficients: Optional[dict[str, float]] = None,
-) -> tuple[float, dict[str, float]]:
+    return_breakdown: bool = True,
+) -> tuple[float, Optional[dict[str, float]]]:
     """Calculate enhanced margin with heuristic adjustments.
 
     Applies conservative adjustments (±1-2 pts max) using matchup features.
@@ -585,9 +1066,12 @@ def calculate_margin_enhanced(
         matchup_features: Computed matchup features (includes team-specific HCA)
         coefficients: Optional learned coefficients (for ML model replacement)
                      If None, uses HEURISTIC_COEFFICIENTS
+        return_breakdown: Build the per-component breakdown dict (set False in
+                          hot loops that only need the margin)
 
     Returns:
-        Tuple of (enhanced_margin, adjustment_breakdown)
+        Tuple of (enhanced_margin, adjustment_breakdown); the breakdown is None
+        when return_breakdown is False
 
     Example:
         >>> matchup = MatchupFeatures(...)
@@ -595,32 +1079,22 @@ def calculate_margin_enhanced(
         >>> print(f"Enhanced margin: {margin:.2f}")
         >>> print(f"Pace adjustment: {breakdown['pace_control']:.2f}")
     """
-    coef = coefficients or HEURISTIC_COEFFICIENTS
-
-    # Start with baseline using team-specific HCA from matchup features
-    margin_baseline = calculate_margin_baseline(
-        home_adj_em, away_adj_em, matchup_features.home_court_factor
-    )
+    floats = _matchup_floats(matchup_features)
+    if coefficients:
+        components = _enhanced_custom(coefficients, home_adj_em, away_adj_em, *floats)
+    else:
+        components = _enhanced_default(home_adj_em, away_adj_em, *floats)
+    margin_enhanced, adj_pace, adj_shooting, adj_turnover, adj_rebounding = components
+    if not return_breakdown:
+        return margin_enhanced, None
 
-    # Calculate individual adjustments
     adjustments = {
-        "pace_control": _adjust_for_pace(matchup_features, coef),
-        "shooting_matchup": _adjust_for_shooting(matchup_features, coef),
-        "turnover_battle": _adjust_for_turnovers(matchup_features, coef),
-        "rebounding_edge": _adjust_for_rebounding(matchup_features, coef),
+        "pace_control": adj_pace,
+        "shooting_matchup": adj_shooting,
+        "turnover_battle": adj_turnover,
+        "rebounding_edge": adj_rebounding,
     }
 
-    # Sum all adjustments
-    total_adjustment = sum(adjustments.values())
-
-    # Apply hard cap (±2 points maximum)
-    max_adjustment = coef.get("max_total_adjustment", 2.0)
-    if abs(total_adjustment) > max_adjustment:  # type: ignore[arg-type]
-        total_adjustment = math.copysign(max_adjustment, total_adjustment)
-
-    # Enhanced margin
-    margin_enhanced = margin_baseline + total_adjustment
-
     return margin_enhanced, adjustments
 
 
@@ -649,20 +1123,16 @@ def calculate_sigma_game(
         >>> print(f"Game sigma: {sigma:.2f}")
         >>> print(f"Interaction variance: {components['var_interaction']:.2f}")
     """
-    coef = VARIANCE_COEFFICIENTS
-
     # Base variances (sigma squared)
-    var_away = away_sigma**2
-    var_home = home_sigma**2
+    var_away = away_sigma * away_sigma
+    var_home = home_sigma * home_sigma
 
     # Interaction variance from tempo mismatch
-    tempo_var = coef["tempo_mismatch_factor"] * (matchup_features.tempo_mismatch**2)
+    tempo_mismatch = matchup_features.tempo_mismatch
+    tempo_var = _V_TEMPO * (tempo_mismatch * tempo_mismatch)
 
-    # Style clash multiplier
-    if matchup_features.style_clash == "3pt_vs_interior":
-        style_multiplier = coef["style_clash_3pt_vs_interior_boost"]
-    else:
-        style_multiplier = coef["style_clash_similar_boost"]
+    # Style clash multiplier (precomputed on MatchupFeatures)
+    style_multiplier = matchup_features.style_variance_multiplier
 
     # Total interaction variance
     var_interaction = tempo_var * style_multiplier
@@ -685,11 +1155,50 @@ def calculate_sigma_game(
     return sigma_game, components
 
 
+def enrich_snapshot_with_variance(df: pd.DataFrame) -> pd.DataFrame:
+    """Add a sigma_sq column (per-team variance) to an enriched snapshot.
+
+    Run once per snapshot before simulations that call
+    calculate_sigma_game_pre many times per team.
+
+    Args:
+        df: Enriched snapshot DataFrame with a sigma column
+
+    Returns:
+        Copy of df with sigma_sq = sigma**2
+    """
+    return df.assign(sigma_sq=df["sigma"] ** 2)
+
+
+def calculate_sigma_game_pre(
+    away_var: float, home_var: float, tempo_mismatch: float, style_multiplier: float
+) -> float:
+    """calculate_sigma_game from precomputed team variances (sigma_sq).
+
+    Same additive variance model and team-variance floor as
+    calculate_sigma_game, without squaring the team sigmas or building the
+    components dict.
+
+    Args:
+        away_var: Away team sigma_sq (from enrich_snapshot_with_variance)
+        home_var: Home team sigma_sq (from enrich_snapshot_with_variance)
+        tempo_mismatch: MatchupFeatures.tempo_mismatch
+        style_multiplier: MatchupFeatures.style_variance_multiplier
+
+    Returns:
+        Game-level sigma
+    """
+    var_total = away_var + home_var + _V_TEMPO * tempo_mismatch * tempo_mismatch * style_multiplier
+    # Floor on variance (sqrt is monotonic, so same as the sigma floor)
+    return math.sqrt(max(var_total, away_var, home_var))
+
+
 def predict_game(
-    away: pd.Series,
-    home: pd.Series,
+    away: TeamData,
+    home: TeamData,
     matchup_features: Optional[MatchupFeatures] = None,
     coefficients: Optional[dict[str, float]] = None,
+    team_features: Optional[Mapping[str, TeamFeatureVector]] = None,
 ) -> MarginPrediction:
     """Complete game prediction with baseline and enhanced models.
 
@@ -697,10 +1206,13 @@ def predict_game(
     baseline (current formula) and enhanced (with adjustments) predictions.
 
     Args:
-        away: Away team data (from enriched snapshot)
-        home: Home team data (from enriched snapshot)
+        away: Away team data (Series or dict row from enriched snapshot; dict
+              rows from df.to_dict("records") avoid Series indexing in loops)
+        home: Home team data (Series or dict row from enriched snapshot)
         matchup_features: Pre-computed matchup features (computed if None)
         coefficients: Optional ML coefficients (uses heuristics if None)
+        team_features: Optional slate-level cache from precompute_team_features;
+                       used to derive matchup features when both teams are in it
 
     Returns:
         MarginPrediction with complete baseline and enhanced predictions
@@ -714,44 +1226,692 @@ def predict_game(
         >>> print(f"Enhanced: {prediction.margin_enhanced:.1f}")
         >>> print(f"Adjustment: {prediction.margin_adjustment:+.1f}")
     """
-    # Compute matchup features if not provided
+    # Compute matchup features if not provided (cheaply, from the slate cache if given)
+    if matchup_features is None and team_features is not None:
+        away_vec = team_features.get(str(away.get("team")))
+        home_vec = team_features.get(str(home.get("team")))
+        if away_vec is not None and home_vec is not None:
+            matchup_features = calculate_matchup_features_from_cached(away_vec, home_vec)
     if matchup_features is None:
-        from kenpom_client.matchup import calculate_matchup_features
-
         matchup_features = calculate_matchup_features(away, home)
 
-    # Baseline predictions (now uses team-specific HCA from matchup_features)
-    margin_baseline = calculate_margin_baseline(
-        home["adj_em"], away["adj_em"], matchup_features.home_court_factor
+    return predict_game_scalar(
+        home["adj_em"], away["adj_em"], home["sigma"], away["sigma"], matchup_features, coefficients
     )
-    sigma_baseline = calculate_sigma_baseline(away["sigma"], home["sigma"])
-    win_prob_baseline = normal_cdf(margin_baseline / sigma_baseline)
 
-    # Enhanced predictions
-    margin_enhanced, adjustment_breakdown = calculate_margin_enhanced(
-        home["adj_em"], away["adj_em"], matchup_features, coefficients
-    )
 
-    sigma_game, sigma_components = calculate_sigma_game(
-        away["sigma"], home["sigma"], matchup_features
-    )
+def predict_game_scalar(
+    home_adj_em: float,
+    away_adj_em: float,
+    home_sigma: float,
+    away_sigma: float,
+    matchup_features: MatchupFeatures,
+    coefficients: Optional[dict[str, float]] = None,
+) -> MarginPrediction:
+    """Complete game prediction from plain floats (fast core of predict_game).
+
+    Computes both margins, both sigmas, and both win probabilities in one
+    function body (same formulas as calculate_margin_baseline,
+    calculate_margin_enhanced, and calculate_sigma_game). Use this when
+    looping over many games: extract the team columns once with
+    df["adj_em"].to_numpy() instead of indexing a pd.Series per game.
+
+    Args:
+        home_adj_em: Home team adjusted efficiency margin
+        away_adj_em: Away team adjusted efficiency margin
+        home_sigma: Home team sigma from snapshot
+        away_sigma: Away team sigma from snapshot
+        matchup_features: Computed matchup features (includes team-specific HCA)
+        coefficients: Optional ML coefficients (uses heuristics if None)
 
-    win_prob_enhanced = normal_cdf(margin_enhanced / sigma_game)
+    Returns:
+        MarginPrediction with complete baseline and enhanced predictions
+
+    Example:
+        >>> matchup = calculate_matchup_features(oregon, gonzaga)
+        >>> prediction = predict_game_scalar(22.0, 12.3, 11.2, 10.5, matchup)
+        >>> print(f"Enhanced: {prediction.margin_enhanced:.1f}")
+    """
+    # Read each matchup feature exactly once
+    mf = matchup_features
+    hca = mf.home_court_factor
+    delta_tempo = mf.delta_tempo
+    pace_sign = mf.pace_sign
+    net_shooting = mf.shooting_defense_advantage - mf.shooting_advantage
+    to_adv = mf.turnover_advantage
+    or_adv = mf.rebounding_advantage
+    tempo_mm = mf.tempo_mismatch
+    style_multiplier = mf.style_variance_multiplier
+
+    (
+        margin_baseline,
+        sigma_baseline,
+        margin_enhanced,
+        adj_pace,
+        adj_shooting,
+        adj_turnover,
+        adj_rebounding,
+        sigma_game,
+        var_away,
+        var_home,
+        var_interaction,
+        var_total,
+    ) = _predict_kernel(
+        home_adj_em,
+        away_adj_em,
+        home_sigma,
+        away_sigma,
+        hca,
+        delta_tempo,
+        pace_sign,
+        net_shooting,
+        to_adv,
+        or_adv,
+        tempo_mm,
+        style_multiplier,
+        *_coefficient_floats(coefficients),
+    )
 
     return MarginPrediction(
         # Baseline
         margin_baseline=margin_baseline,
         sigma_baseline=sigma_baseline,
-        win_prob_baseline=win_prob_baseline,
+        win_prob_baseline=normal_cdf(margin_baseline / sigma_baseline),
         # Enhanced
         margin_enhanced=margin_enhanced,
         margin_adjustment=margin_enhanced - margin_baseline,
-        adjustment_breakdown=adjustment_breakdown,
+        adjustment_breakdown={
+            "pace_control": adj_pace,
+            "shooting_matchup": adj_shooting,
+            "turnover_battle": adj_turnover,
+            "rebounding_edge": adj_rebounding,
+        },
         # Game sigma
         sigma_game=sigma_game,
-        sigma_components=sigma_components,
+        sigma_components={
+            "var_away": var_away,
+            "var_home": var_home,
+            "var_interaction": var_interaction,
+            "var_total": var_total,
+        },
         # Enhanced win probability
-        win_prob_enhanced=win_prob_enhanced,
+        win_prob_enhanced=normal_cdf(margin_enhanced / sigma_game),
         # Metadata
         prediction_version="1.0",
     )
+
+
+def predict_win_prob(
+    home_adj_em: float,
+    away_adj_em: float,
+    home_sigma: float,
+    away_sigma: float,
+    matchup_features: MatchupFeatures,
+    coefficients: Optional[dict[str, float]] = None,
+) -> float:
+    """Enhanced home win probability only (no MarginPrediction, no dicts).
+
+    Same math as predict_game_scalar(...).win_prob_enhanced, for callers that
+    evaluate many hypothetical matchups (Monte Carlo, bracket simulation).
+
+    Args:
+        home_adj_em: Home team adjusted efficiency margin
+        away_adj_em: Away team adjusted efficiency margin
+        home_sigma: Home team sigma from snapshot
+        away_sigma: Away team sigma from snapshot
+        matchup_features: Computed matchup features (includes team-specific HCA)
+        coefficients: Optional ML coefficients (uses heuristics if None)
+
+    Returns:
+        Home team win probability [0, 1]
+    """
+    floats = _matchup_floats(matchup_features)
+    if coefficients:
+        margin_enhanced = _enhanced_custom(coefficients, home_adj_em, away_adj_em, *floats)[0]
+    else:
+        margin_enhanced = _enhanced_default(home_adj_em, away_adj_em, *floats)[0]
+
+    sigma_game = _sigma_kernel(
+        away_sigma,
+        home_sigma,
+        matchup_features.tempo_mismatch,
+        matchup_features.style_variance_multiplier,
+        _V_TEMPO,
+    )[0]
+    return normal_cdf(margin_enhanced / sigma_game)
+
+
+class SnapshotProxy:
+    """Handle on an enriched snapshot for predict_game_cached.
+
+    Converts the snapshot once into per-team dict rows and precomputed
+    TeamFeatureVectors, carries a content hash of the data, and holds the
+    memoized predictions for that data. The memo lives and dies with the
+    proxy, so build a new proxy when the snapshot is reloaded and drop the
+    old one to free its cached results.
+
+    Example:
+        >>> snapshot = SnapshotProxy(load_enriched_snapshot(path))
+        >>> prediction = predict_game_cached("Gonzaga", "Oregon", snapshot)
+        >>> snapshot.hits, snapshot.misses
+    """
+
+    __slots__ = ("_predictions", "_rows", "hits", "misses", "snapshot_hash", "team_features")
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self._rows = {str(row["team"]): row for row in df.to_dict("records")}
+        self.team_features = precompute_team_features(df)
+        digest = hashlib.sha256(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        digest.update("|".join(str(c) for c in df.columns).encode("utf-8"))
+        self.snapshot_hash = digest.hexdigest()
+        self._predictions: dict[tuple[str, str], MarginPrediction] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, team: str) -> dict:
+        """Return the snapshot row for a team (KeyError if not present)."""
+        return self._rows[team]
+
+    def __hash__(self) -> int:
+        return hash(self.snapshot_hash)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SnapshotProxy) and other.snapshot_hash == self.snapshot_hash
+
+
+def predict_game_cached(
+    home_team: str, away_team: str, snapshot: SnapshotProxy
+) -> MarginPrediction:
+    """predict_game memoized on (home_team, away_team) within a snapshot.
+
+    For interactive workflows (what-ifs, fanmatch scenarios) that request
+    the same pairing repeatedly. Uses the default heuristic coefficients;
+    the returned MarginPrediction is frozen and shared between callers.
+    Results are stored on the SnapshotProxy (see its hits/misses counters)
+    and are freed with it.
+
+    Args:
+        home_team: Home team name (as in the snapshot 'team' column)
+        away_team: Away team name
+        snapshot: SnapshotProxy wrapping the enriched snapshot
+
+    Returns:
+        MarginPrediction, identical to predict_game on the same rows
+    """
+    key = (home_team, away_team)
+    prediction = snapshot._predictions.get(key)
+    if prediction is not None:
+        snapshot.hits += 1
+        return prediction
+
+    prediction = predict_game(
+        snapshot.get(away_team), snapshot.get(home_team), team_features=snapshot.team_features
+    )
+    snapshot.misses += 1
+    snapshot._predictions[key] = prediction
+    return prediction
+
+
+# =============================================================================
+# Batch Prediction (Vectorized)
+# =============================================================================
+
+# Normal CDF lookup table over z in [-6, 6] (4096 intervals, linear interp,
+# max error ~3e-7). numpy has no erf ufunc, so this replaces a per-element
+# math.erf loop when scipy is unavailable (~6x faster on 10k-game arrays).
+# The scalar normal_cdf keeps math.erf: in CPython one libm call beats the
+# index/interp arithmetic.
+_CDF_Z_MAX = 6.0
+_CDF_STEPS = 4096
+_CDF_INV_STEP = _CDF_STEPS / (2.0 * _CDF_Z_MAX)
+_CDF_TABLE = np.array(
+    [
+        0.5 * (1.0 + math.erf(z * _INV_SQRT2))
+        for z in np.linspace(-_CDF_Z_MAX, _CDF_Z_MAX, _CDF_STEPS + 1)
+    ]
+)
+
+
+def _normal_cdf_table(x: np.ndarray) -> np.ndarray:
+    """Normal CDF via _CDF_TABLE lookup + linear interpolation (clamped at ±6)."""
+    pos = np.clip((x + _CDF_Z_MAX) * _CDF_INV_STEP, 0.0, float(_CDF_STEPS))
+    idx = np.minimum(pos.astype(np.intp), _CDF_STEPS - 1)
+    lower = _CDF_TABLE[idx]
+    return lower + (_CDF_TABLE[idx + 1] - lower) * (pos - idx)
+
+
+def normal_cdf_array(x: np.ndarray) -> np.ndarray:
+    """Vectorized standard normal CDF (array counterpart of normal_cdf).
+
+    Uses scipy.special.ndtr directly on the array when scipy is installed,
+    otherwise a precomputed lookup table with linear interpolation.
+    Floating-point inputs keep their dtype on the ndtr path (float32 in,
+    float32 out).
+
+    Args:
+        x: Array of standard scores (z-scores)
+
+    Returns:
+        Array of probabilities that a standard normal variable is less than x
+    """
+    x = np.asarray(x)
+    if x.dtype.kind != "f":
+        x = x.astype(np.float64)
+    if _ndtr is not None:
+        return _ndtr(x)
+    return _normal_cdf_table(x)
+
+
+@dataclass(frozen=True, slots=True)
+class MarginPredictionArrays:
+    """Columnar MarginPrediction for many games (element i = game i).
+
+    Returned by predict_games_arrays so bulk callers never materialize one
+    MarginPrediction per game. adjustment_breakdown is flattened to adj_*
+    arrays and sigma_components to var_* arrays.
+    """
+
+    margin_baseline: np.ndarray
+    sigma_baseline: np.ndarray
+    win_prob_baseline: np.ndarray
+    margin_enhanced: np.ndarray
+    margin_adjustment: np.ndarray
+    adj_pace_control: np.ndarray
+    adj_shooting_matchup: np.ndarray
+    adj_turnover_battle: np.ndarray
+    adj_rebounding_edge: np.ndarray
+    sigma_game: np.ndarray
+    var_away: np.ndarray
+    var_home: np.ndarray
+    var_interaction: np.ndarray
+    var_total: np.ndarray
+    win_prob_enhanced: np.ndarray
+    prediction_version: str = "1.0"
+
+    def __len__(self) -> int:
+        return len(self.margin_baseline)
+
+    def to_dict(self) -> dict[str, Union[np.ndarray, str]]:
+        """Return {field name: array} (prediction_version as a plain str)."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def to_frame(self, index: Optional[pd.Index] = None) -> pd.DataFrame:
+        """Return a DataFrame with one column per field."""
+        return pd.DataFrame(self.to_dict(), index=index)
+
+
+def _predict_arrays(
+    home_em: np.ndarray,
+    away_em: np.ndarray,
+    home_sigma: np.ndarray,
+    away_sigma: np.ndarray,
+    hca: np.ndarray,
+    delta_tempo: np.ndarray,
+    net_shooting: np.ndarray,
+    turnover_adv: np.ndarray,
+    rebounding_adv: np.ndarray,
+    tempo_mismatch: np.ndarray,
+    pace_sign: np.ndarray,
+    style_multiplier: np.ndarray,
+    coefficients: Optional[dict[str, float]],
+) -> MarginPredictionArrays:
+    """Vectorized prediction kernel shared by the pandas and Arrow batch APIs."""
+    c_pace, c_shooting, c_turnover, c_rebounding, max_adjustment = _coefficient_floats(coefficients)
+
+    # Baseline model
+    margin_baseline = home_em - away_em + hca
+    sigma_baseline = (away_sigma + home_sigma) / 2.0
+    win_prob_baseline = normal_cdf_array(margin_baseline / sigma_baseline)
+
+    # Heuristic adjustments (same formulas as _enhanced_kernel)
+    adj_pace = pace_sign * (np.abs(delta_tempo) / 5.0) * c_pace
+    adj_shooting = (net_shooting / 5.0) * c_shooting
+    adj_turnover = (turnover_adv / 2.0) * c_turnover
+    adj_rebounding = -(rebounding_adv / 3.0) * c_rebounding
+
+    total_adjustment = np.clip(
+        adj_pace + adj_shooting + adj_turnover + adj_rebounding, -max_adjustment, max_adjustment
+    )
+    margin_enhanced = margin_baseline + total_adjustment
+
+    # Game-level sigma (additive variance model)
+    var_away = away_sigma**2
+    var_home = home_sigma**2
+    var_interaction = _V_TEMPO * tempo_mismatch**2 * style_multiplier
+    var_total = var_away + var_home + var_interaction
+    sigma_game = np.maximum(np.sqrt(var_total), np.maximum(away_sigma, home_sigma))
+
+    win_prob_enhanced = normal_cdf_array(margin_enhanced / sigma_game)
+
+    return MarginPredictionArrays(
+        margin_baseline=margin_baseline,
+        sigma_baseline=sigma_baseline,
+        win_prob_baseline=win_prob_baseline,
+        margin_enhanced=margin_enhanced,
+        margin_adjustment=margin_enhanced - margin_baseline,
+        adj_pace_control=adj_pace,
+        adj_shooting_matchup=adj_shooting,
+        adj_turnover_battle=adj_turnover,
+        adj_rebounding_edge=adj_rebounding,
+        sigma_game=sigma_game,
+        var_away=var_away,
+        var_home=var_home,
+        var_interaction=var_interaction,
+        var_total=var_total,
+        win_prob_enhanced=win_prob_enhanced,
+    )
+
+
+def predict_games_batch(
+    away_df: pd.DataFrame,
+    home_df: pd.DataFrame,
+    matchup_df: Optional[pd.DataFrame] = None,
+    coefficients: Optional[dict[str, float]] = None,
+    dtype: type[np.floating] = _BATCH_DTYPE,
+) -> pd.DataFrame:
+    """Vectorized predict_game over many games at once.
+
+    Row i of each input frame describes game i (rows are aligned by position).
+    All margins, sigmas, and win probabilities are computed on NumPy columns
+    in a single pass instead of one Python call chain per game.
+
+    Computation runs in float32 by default (see _BATCH_DTYPE); results agree
+    with the float64 scalar path to within ~1e-6 relative. Pass
+    dtype=np.float64 when exact agreement (e.g. after rounding) matters.
+
+    Args:
+        away_df: Away team rows (from enriched snapshot; needs adj_em, sigma)
+        home_df: Home team rows (from enriched snapshot; needs adj_em, sigma)
+        matchup_df: One row per game with MatchupFeatures fields as columns
+                    (derived with calculate_matchup_features_frame if None)
+        coefficients: Optional ML coefficients (uses heuristics if None)
+        dtype: Floating dtype for the computation (default float32)
+
+    Returns:
+        DataFrame (indexed like matchup_df) with the MarginPrediction fields as
+        columns. adjustment_breakdown is flattened to adj_* columns and
+        sigma_components to var_* columns.
+
+    Example:
+        >>> from dataclasses import asdict
+        >>> features = [calculate_matchup_features(a, h) for a, h in pairs]
+        >>> matchup_df = pd.DataFrame([asdict(f) for f in features])
+        >>> preds = predict_games_batch(away_df, home_df, matchup_df)
+        >>> preds[["margin_enhanced", "win_prob_enhanced"]]
+        >>> # Or let the features be derived in the same vectorized pass
+        >>> preds = predict_games_batch(away_df, home_df)
+    """
+    if matchup_df is None:
+        matchup_df = calculate_matchup_features_frame(away_df, home_df)
+    return predict_games_arrays(away_df, home_df, matchup_df, coefficients, dtype).to_frame(
+        index=matchup_df.index
+    )
+
+
+def predict_games_arrays(
+    away_df: pd.DataFrame,
+    home_df: pd.DataFrame,
+    matchup_df: Optional[pd.DataFrame] = None,
+    coefficients: Optional[dict[str, float]] = None,
+    dtype: type[np.floating] = _BATCH_DTYPE,
+) -> MarginPredictionArrays:
+    """Same as predict_games_batch but returns bare NumPy arrays.
+
+    Skips DataFrame construction for simulation-style callers that consume
+    the result columns directly.
+
+    Args:
+        away_df: Away team rows (from enriched snapshot; needs adj_em, sigma)
+        home_df: Home team rows (from enriched snapshot; needs adj_em, sigma)
+        matchup_df: One row per game with MatchupFeatures fields as columns
+                    (derived with calculate_matchup_features_frame if None)
+        coefficients: Optional ML coefficients (uses heuristics if None)
+        dtype: Floating dtype for the computation (default float32)
+
+    Returns:
+        MarginPredictionArrays with one element per game
+    """
+    if matchup_df is None:
+        matchup_df = calculate_matchup_features_frame(away_df, home_df)
+
+    # Frames built from asdict(MatchupFeatures) carry the precomputed encodings;
+    # otherwise map the string columns through the same tables
+    if "pace_sign" in matchup_df:
+        pace_sign = matchup_df["pace_sign"].to_numpy(dtype=dtype)
+    else:
+        pace_sign = matchup_df["pace_control"].map(PACE_SIGN).fillna(0.0).to_numpy(dtype)
+    if "style_variance_multiplier" in matchup_df:
+        style_multiplier = matchup_df["style_variance_multiplier"].to_numpy(dtype=dtype)
+    else:
+        style_multiplier = (
+            matchup_df["style_clash"].map(STYLE_VARIANCE_MULTIPLIER).fillna(1.0).to_numpy(dtype)
+        )
+
+    return _predict_arrays(
+        home_em=home_df["adj_em"].to_numpy(dtype=dtype),
+        away_em=away_df["adj_em"].to_numpy(dtype=dtype),
+        home_sigma=home_df["sigma"].to_numpy(dtype=dtype),
+        away_sigma=away_df["sigma"].to_numpy(dtype=dtype),
+        hca=matchup_df["home_court_factor"].to_numpy(dtype=dtype),
+        delta_tempo=matchup_df["delta_tempo"].to_numpy(dtype=dtype),
+        net_shooting=matchup_df["shooting_defense_advantage"].to_numpy(dtype=dtype)
+        - matchup_df["shooting_advantage"].to_numpy(dtype=dtype),
+        turnover_adv=matchup_df["turnover_advantage"].to_numpy(dtype=dtype),
+        rebounding_adv=matchup_df["rebounding_advantage"].to_numpy(dtype=dtype),
+        tempo_mismatch=matchup_df["tempo_mismatch"].to_numpy(dtype=dtype),
+        pace_sign=pace_sign,
+        style_multiplier=style_multiplier,
+        coefficients=coefficients,
+    )
+
+
+def predict_from_arrow(
+    table: pa.Table,
+    coefficients: Optional[dict[str, float]] = None,
+    dtype: type[np.floating] = _BATCH_DTYPE,
+) -> pa.Table:
+    """Vectorized prediction over a pyarrow Table (no pandas round-trip).
+
+    Expects one row per game with team columns home_adj_em, away_adj_em,
+    home_sigma, away_sigma plus the MatchupFeatures fields. Numeric columns
+    are converted to NumPy arrays of the requested dtype (copied and cast
+    unless already single-chunk, null-free, and of that dtype) and run
+    through the same kernel as predict_games_batch.
+
+    Args:
+        table: Arrow table with one row per game
+        coefficients: Optional ML coefficients (uses heuristics if None)
+        dtype: Floating dtype for the computation (default float32)
+
+    Returns:
+        Arrow table with the same result columns as predict_games_batch
+
+    Example:
+        >>> import pyarrow.parquet as pq
+        >>> games = pq.read_table("data/slate_features.parquet")
+        >>> preds = predict_from_arrow(games)
+        >>> preds.column("win_prob_enhanced")
+    """
+
+    def col(name: str) -> np.ndarray:
+        return table.column(name).to_numpy().astype(dtype, copy=False)
+
+    if "pace_sign" in table.column_names:
+        pace_sign = col("pace_sign")
+    else:
+        pace_sign = np.array(
+            [PACE_SIGN.get(v, 0.0) for v in table.column("pace_control").to_pylist()],
+            dtype=dtype,
+        )
+    if "style_variance_multiplier" in table.column_names:
+        style_multiplier = col("style_variance_multiplier")
+    else:
+        style_multiplier = np.array(
+            [
+                STYLE_VARIANCE_MULTIPLIER.get(v, 1.0)
+                for v in table.column("style_clash").to_pylist()
+            ],
+            dtype=dtype,
+        )
+
+    result = _predict_arrays(
+        home_em=col("home_adj_em"),
+        away_em=col("away_adj_em"),
+        home_sigma=col("home_sigma"),
+        away_sigma=col("away_sigma"),
+        hca=col("home_court_factor"),
+        delta_tempo=col("delta_tempo"),
+        net_shooting=col("shooting_defense_advantage") - col("shooting_advantage"),
+        turnover_adv=col("turnover_advantage"),
+        rebounding_adv=col("rebounding_advantage"),
+        tempo_mismatch=col("tempo_mismatch"),
+        pace_sign=pace_sign,
+        style_multiplier=style_multiplier,
+        coefficients=coefficients,
+    )
+    columns = {
+        name: pa.array(values)
+        if isinstance(values, np.ndarray)
+        else pa.array([values] * len(result))
+        for name, values in result.to_dict().items()
+    }
+    return pa.table(columns)
+
+
+def predict_bracket_matrix(
+    teams_df: pd.DataFrame,
+    neutral_site: bool = False,
+    coefficients: Optional[dict[str, float]] = None,
+    dtype: type[np.floating] = _BATCH_DTYPE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Enhanced margin and win probability for every pairing of N teams.
+
+    Builds the N x N matchup inputs by broadcasting per-team vectors (home
+    teams along rows, away teams along columns) and runs them through the
+    same vectorized kernel as predict_games_batch. Only NumPy arrays are
+    returned, so bracket/Monte Carlo simulators can index the matrices
+    instead of calling predict_game per game. Diagonal entries (a team
+    against itself) are not meaningful.
+
+    Args:
+        teams_df: One row per team (from enriched snapshot; needs team,
+                  adj_em, sigma)
+        neutral_site: Zero out home court advantage (tournament games)
+        coefficients: Optional ML coefficients (uses heuristics if None)
+        dtype: Floating dtype for the computation (default float32)
+
+    Returns:
+        Tuple of (margin_mat, win_prob_mat), each (N, N); entry [i, j] is
+        predict_game(away=teams_df.iloc[j], home=teams_df.iloc[i])
+
+    Example:
+        >>> field = df[df["team"].isin(tournament_teams)].reset_index(drop=True)
+        >>> margin_mat, win_prob_mat = predict_bracket_matrix(field, neutral_site=True)
+        >>> win_prob_mat[duke_idx, unc_idx]
+    """
+    team_features = precompute_team_features(teams_df)
+    vectors = [team_features[str(team)] for team in teams_df["team"]]
+    n = len(vectors)
+
+    def attr(name: str) -> np.ndarray:
+        return np.fromiter((getattr(v, name) for v in vectors), dtype, n)
+
+    tempo = attr("adj_tempo")
+    efg = attr("efg_pct")
+    defg = attr("defg_pct")
+    fg3 = attr("off_fg3")
+    adj_em = attr("adj_em")
+    sigma = teams_df["sigma"].to_numpy(dtype=dtype)
+    if neutral_site:
+        hca = np.zeros((n, 1), dtype=dtype)
+    else:
+        hca = attr("home_court_factor")[:, None]
+
+    # Rows = home team, columns = away team (MatchupFeatures deltas are away - home)
+    delta_tempo = tempo[None, :] - tempo[:, None]
+    tempo_mismatch = np.abs(delta_tempo)
+    pace_sign = np.where(
+        tempo_mismatch > 5.0,
+        np.where(delta_tempo > 0, PACE_SIGN["away_controls"], PACE_SIGN["home_controls"]),
+        PACE_SIGN["neutral"],
+    ).astype(dtype)
+    style_multiplier = np.where(
+        np.abs(fg3[:, None] - fg3[None, :]) > 10.0,
+        STYLE_VARIANCE_MULTIPLIER["3pt_vs_interior"],
+        STYLE_VARIANCE_MULTIPLIER["similar"],
+    ).astype(dtype)
+
+    result = _predict_arrays(
+        home_em=adj_em[:, None],
+        away_em=adj_em[None, :],
+        home_sigma=sigma[:, None],
+        away_sigma=sigma[None, :],
+        hca=hca,
+        delta_tempo=delta_tempo,
+        net_shooting=(efg[:, None] - defg[None, :]) - (efg[None, :] - defg[:, None]),
+        turnover_adv=attr("dto_pct")[:, None] - attr("to_pct")[None, :],
+        rebounding_adv=attr("or_pct")[None, :] - attr("dor_pct")[:, None],
+        tempo_mismatch=tempo_mismatch,
+        pace_sign=pace_sign,
+        style_multiplier=style_multiplier,
+        coefficients=coefficients,
+    )
+    return result.margin_enhanced, result.win_prob_enhanced
+
+
+def predict_bracket_matrix_cached(
+    teams_df: pd.DataFrame,
+    neutral_site: bool = False,
+    coefficients: Optional[dict[str, float]] = None,
+    dtype: type[np.floating] = _BATCH_DTYPE,
+    cache_dir: str = PREDICTION_CACHE_DIR,
+    max_bytes: int = 256 * 1024 * 1024,
+) -> tuple[np.ndarray, np.ndarray]:
+    """predict_bracket_matrix with a persistent on-disk cache.
+
+    The cache key hashes the snapshot contents (values, index, and column
+    names), the prediction options, and the HCA snapshot date, so identical
+    inputs (e.g. dashboard reloads) load the saved matrices instead of
+    recomputing them.
+
+    Args:
+        teams_df: One row per team (from enriched snapshot; needs team,
+                  adj_em, sigma)
+        neutral_site: Zero out home court advantage (tournament games)
+        coefficients: Optional ML coefficients (uses heuristics if None)
+        dtype: Floating dtype for the computation (default float32)
+        cache_dir: Directory for cached .npz files (default
+                   ~/.cache/kenpom_client/predictions)
+        max_bytes: Cache size bound (least recently used files evicted first)
+
+    Returns:
+        Tuple of (margin_mat, win_prob_mat), as from predict_bracket_matrix
+
+    Example:
+        >>> margin_mat, win_prob_mat = predict_bracket_matrix_cached(field, neutral_site=True)
+    """
+    hca_snapshot = None if neutral_site else load_hca_snapshot()
+    digest = hashlib.sha256(pd.util.hash_pandas_object(teams_df, index=True).to_numpy().tobytes())
+    key = json.dumps(
+        {
+            "snapshot": digest.hexdigest(),
+            "columns": [str(c) for c in teams_df.columns],
+            "neutral_site": neutral_site,
+            "coefficients": coefficients,
+            "dtype": np.dtype(dtype).name,
+            "hca_snapshot": hca_snapshot.date if hca_snapshot is not None else None,
+            "prediction_version": "1.0",
+        },
+        sort_keys=True,
+    )
+
+    cache = ArrayCache(cache_dir, max_bytes)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached["margin_mat"], cached["win_prob_mat"]
+
+    margin_mat, win_prob_mat = predict_bracket_matrix(
+        teams_df, neutral_site=neutral_site, coefficients=coefficients, dtype=dtype
+    )
+    cache.set(key, {"margin_mat": margin_mat, "win_prob_mat": win_prob_mat})
+    return margin_mat, win_prob_mat
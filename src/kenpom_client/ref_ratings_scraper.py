@@ -13,21 +13,32 @@ Reference: https://kenpom.substack.com/p/a-path-to-slightly-more-consistent
 from __future__ import annotations
 
 import json
+import logging
 import os
-from dataclasses import asdict, dataclass
+import random
+import time
+from dataclasses import asdict, dataclass, field
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Union
 
 import pandas as pd
 from dotenv import load_dotenv
-from playwright.sync_api import Page, sync_playwright
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright, Route, sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Saved login session (cookies + localStorage); reused while younger than the max age
+SESSION_PATH = Path("data/.kenpom_session.json")
+SESSION_MAX_AGE_SECONDS = 24 * 60 * 60
+
+
+@dataclass(frozen=True, slots=True)
 class RefRating:
     """Rating data for a single referee."""
 
@@ -39,6 +50,19 @@ class RefRating:
     conference: Optional[str] = None  # Primary conference association (if available)
 
 
+# DataFrame schema for RefRatingsSnapshot.to_dataframe (column order matches RefRating)
+_REF_COLUMNS = ["name", "faa", "rank", "games", "rating", "conference"]
+_REF_DTYPES = {"faa": "float32", "rank": "int32", "games": "Int32", "rating": "float32"}
+
+
+def _initial_last_key(name_lower: str) -> Optional[tuple[str, str]]:
+    """Return (first initial, last name) for a lowercased full name, if it has both."""
+    parts = name_lower.replace(".", " ").split()
+    if len(parts) < 2:
+        return None
+    return parts[0][0], parts[-1]
+
+
 @dataclass
 class RefRatingsSnapshot:
     """Snapshot of all referee FAA ratings."""
@@ -46,12 +70,33 @@ class RefRatingsSnapshot:
     date: str  # Date of snapshot (YYYY-MM-DD)
     season: int  # Season year (e.g., 2025)
     avg_faa: float  # Average FAA (should be ~0 by definition)
-    refs: list[RefRating]  # All referee ratings
+    refs: tuple[RefRating, ...]  # All referee ratings (lists are converted to a tuple)
+
+    # Lookup indexes built once from the immutable refs
+    _exact: dict[str, float] = field(init=False, repr=False, compare=False)
+    _lowered: list[tuple[str, float]] = field(init=False, repr=False, compare=False)
+    _initial_last: dict[tuple[str, str], float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.refs = tuple(self.refs)
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """Precompute lowercased names so lookups never re-lower every ref."""
+        self._lowered = [(r.name.lower(), r.faa) for r in self.refs]
+        # First occurrence wins, matching the original linear scan
+        self._exact = {}
+        self._initial_last = {}
+        for name_lower, faa in self._lowered:
+            self._exact.setdefault(name_lower, faa)
+            key = _initial_last_key(name_lower)
+            if key is not None:
+                self._initial_last.setdefault(key, faa)
 
     def to_dataframe(self) -> pd.DataFrame:
         """Convert to pandas DataFrame."""
-        data = [asdict(r) for r in self.refs]
-        df = pd.DataFrame(data)
+        records = ((r.name, r.faa, r.rank, r.games, r.rating, r.conference) for r in self.refs)
+        df = pd.DataFrame.from_records(records, columns=_REF_COLUMNS).astype(_REF_DTYPES)
         df["snapshot_date"] = self.date
         df["season"] = self.season
         return df
@@ -67,15 +112,20 @@ class RefRatingsSnapshot:
         """
         ref_lower = ref_name.lower()
 
-        # Try exact match first
-        for r in self.refs:
-            if r.name.lower() == ref_lower:
-                return r.faa
+        # Try exact match first (O(1) index)
+        faa = self._exact.get(ref_lower)
+        if faa is not None:
+            return faa
 
         # Try partial match (last name)
-        for r in self.refs:
-            if ref_lower in r.name.lower() or r.name.lower() in ref_lower:
-                return r.faa
+        for name_lower, faa in self._lowered:
+            if ref_lower in name_lower or name_lower in ref_lower:
+                return faa
+
+        # Try first initial + last name ("K. Kissinger" -> "Kipp Kissinger")
+        key = _initial_last_key(ref_lower)
+        if key is not None:
+            return self._initial_last.get(key)
 
         return None
 
@@ -95,8 +145,8 @@ class RefRatingsSnapshot:
                 total += faa
         return total
 
-    def to_json(self) -> str:
-        """Serialize to JSON."""
+    def to_json(self, indent: bool = False) -> str:
+        """Serialize to JSON (compact unless indent=True)."""
         return json.dumps(
             {
                 "date": self.date,
@@ -104,14 +154,24 @@ class RefRatingsSnapshot:
                 "avg_faa": self.avg_faa,
                 "refs": [asdict(r) for r in self.refs],
             },
-            indent=2,
+            indent=2 if indent else None,
         )
 
     @classmethod
-    def from_json(cls, json_str: str) -> "RefRatingsSnapshot":
-        """Deserialize from JSON."""
+    def from_json(cls, json_str: Union[str, bytes]) -> "RefRatingsSnapshot":
+        """Deserialize from JSON (text or raw UTF-8 bytes)."""
         data = json.loads(json_str)
-        refs = [RefRating(**r) for r in data["refs"]]
+        refs = tuple(
+            RefRating(
+                r["name"],
+                r["faa"],
+                r["rank"],
+                r.get("games"),
+                r.get("rating"),
+                r.get("conference"),
+            )
+            for r in data["refs"]
+        )
         return cls(
             date=data["date"],
             season=data["season"],
@@ -120,6 +180,189 @@ class RefRatingsSnapshot:
         )
 
 
+# Cloudflare challenge markers. "text=" entries are matched against the rendered
+# page text; the rest are CSS selectors. Both are checked in one page.evaluate call.
+_CLOUDFLARE_INDICATORS = (
+    "text=Verifying you are human",
+    "text=Verify you are human",
+    "text=Checking your browser",
+    "text=needs to review the security",
+    "text=Just a moment",
+    "text=completing the action below",
+    "#challenge-running",
+    "#challenge-stage",
+    "iframe[src*='challenges.cloudflare.com']",
+    "iframe[src*='turnstile']",
+)
+
+_TURNSTILE_INDICATORS = (
+    "iframe[src*='challenges.cloudflare.com']",
+    "iframe[src*='turnstile']",
+    "text=completing the action below",
+)
+
+_ANY_VISIBLE_JS = """([texts, sels]) => {
+    const body = document.body ? document.body.innerText.toLowerCase() : "";
+    if (texts.some(t => body.includes(t))) return true;
+    return sels.some(s => {
+        const el = document.querySelector(s);
+        return !!el && el.getClientRects().length > 0;
+    });
+}"""
+
+
+# Resources the scraper never reads; aborting them cuts page-load traffic
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+_BLOCKED_HOSTS = ("google-analytics.com", "doubleclick.net", "googletagmanager.com")
+
+
+def _block_nonessential(route: Route) -> None:
+    """Abort images, fonts, CSS, media and tracker requests; let everything else through."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        host in request.url for host in _BLOCKED_HOSTS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+# Referee table extraction shared by the primary ("table") and fallback ("rows") paths.
+# officials.php rows look like | Rank | Name + FAA subscript | Rating | Gms | Last Game |,
+# with FAA as subscript text after the name (e.g., "Kipp Kissinger -0.4"). Refs come back
+# sorted by FAA descending (highest FAA = most fouls) and re-ranked.
+_EXTRACT_REFS_JS = """(mode) => {
+    const FAA_RE = /([+-]?\\d+\\.\\d+)\\s*$/;
+    const result = { refs: [], avg_faa: 0, count: 0 };
+
+    let root = document;
+    if (mode === 'table') {
+        // Prefer the table with Rating/Gms headers, else the first table with many rows
+        const tables = Array.from(document.querySelectorAll('table'));
+        root = tables.find(t => {
+            const headerText = t.textContent.toLowerCase();
+            return headerText.includes('rating') && headerText.includes('gms');
+        }) || tables.find(t => t.querySelectorAll('tr').length > 5);
+        if (!root) return result;
+    }
+
+    let faaSum = 0;
+    root.querySelectorAll('tr').forEach(row => {
+        if (mode === 'table' && row.querySelector('th')) return;
+
+        const cells = row.querySelectorAll('td');
+        // Need at least: rank, name+faa, rating, gms
+        if (cells.length < 4) return;
+
+        const nameCell = cells[1];
+        const nameLink = nameCell.querySelector('a');
+        if (!nameLink) return;
+        const name = nameLink.textContent.trim();
+        if (!name || name.length < 2) return;
+
+        // FAA is the signed decimal at the end of the full cell text
+        const faaMatch = nameCell.textContent.trim().match(FAA_RE);
+        if (!faaMatch) return;
+        const faa = parseFloat(faaMatch[1]);
+        if (isNaN(faa)) return;
+
+        const rating = parseFloat(cells[2].textContent.trim());
+        const games = parseInt(cells[3].textContent.trim(), 10);
+
+        faaSum += faa;
+        result.refs.push({
+            name: name,
+            faa: faa,
+            rank: result.refs.length + 1,
+            games: isNaN(games) ? null : games,
+            rating: isNaN(rating) ? null : rating,
+        });
+    });
+
+    result.count = result.refs.length;
+    if (result.count > 0) {
+        result.avg_faa = faaSum / result.count;
+        result.refs.sort((a, b) => b.faa - a.faa);
+        result.refs.forEach((r, idx) => { r.rank = idx + 1; });
+    }
+    return result;
+}"""
+
+
+# True once none of the indicators passed to _ANY_VISIBLE_JS remain on the page
+_CLOUDFLARE_CLEARED_JS = f"(arg) => !({_ANY_VISIBLE_JS})(arg)"
+
+# Scrolls to the bottom on every poll and reports true once the table row count has
+# held steady for three consecutive polls after the document finished loading.
+_ROWS_SETTLED_JS = """() => {
+    window.scrollTo(0, document.body.scrollHeight);
+    const count = document.querySelectorAll('table tr').length;
+    if (document.readyState !== 'complete' || count !== window.__refRowsPrev) {
+        window.__refRowsPrev = count;
+        window.__refRowsStable = 0;
+        return false;
+    }
+    window.__refRowsStable += 1;
+    return window.__refRowsStable >= 3;
+}"""
+
+
+class _RateLimited(Exception):
+    """Navigation answered with HTTP 429; carries the Retry-After delay if given."""
+
+    def __init__(self, retry_after: Optional[float]):
+        super().__init__("Rate limited (HTTP 429)")
+        self.retry_after = retry_after
+
+
+def _goto_with_retry(
+    page: Page,
+    url: str,
+    max_retries: int = 4,
+    backoff_base: float = 1.0,
+) -> None:
+    """Navigate with exponential backoff on timeouts and HTTP 429.
+
+    Waits 1s, 2s, 4s, 8s (plus up to 10% jitter) between attempts, or the
+    server's Retry-After delay when a 429 supplies one. Other errors propagate
+    immediately, as does the last error once retries are exhausted.
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            response = page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            if response is not None and response.status == 429:
+                retry_after = response.headers.get("retry-after")
+                raise _RateLimited(
+                    float(retry_after) if retry_after and retry_after.isdigit() else None
+                )
+            return
+        except (PlaywrightTimeoutError, _RateLimited) as e:
+            if attempt > max_retries:
+                raise
+            sleep_s = backoff_base * (2 ** (attempt - 1))
+            sleep_s += random.uniform(0, sleep_s * 0.1)
+            if isinstance(e, _RateLimited) and e.retry_after is not None:
+                sleep_s = e.retry_after
+            logger.warning(
+                "Navigation to %s failed (%s). Retry %s/%s in %.1fs",
+                url,
+                type(e).__name__,
+                attempt,
+                max_retries,
+                sleep_s,
+            )
+            time.sleep(sleep_s)
+
+
+def _split_indicators(indicators: tuple[str, ...]) -> tuple[list[str], list[str]]:
+    """Split indicator selectors into (lowercased text needles, CSS selectors)."""
+    texts = [s[len("text=") :].lower() for s in indicators if s.startswith("text=")]
+    css = [s for s in indicators if not s.startswith("text=")]
+    return texts, css
+
+
 class RefRatingsScraper:
     """Scraper for KenPom Referee Ratings data."""
 
@@ -128,6 +371,9 @@ class RefRatingsScraper:
         username: Optional[str] = None,
         password: Optional[str] = None,
         headless: bool = True,
+        session_path: Optional[Path] = SESSION_PATH,
+        force_login: bool = False,
+        debug: bool = False,
     ):
         """Initialize the scraper.
 
@@ -135,70 +381,92 @@ class RefRatingsScraper:
             username: KenPom username/email (from KENPOM_EMAIL env if None)
             password: KenPom password (from KENPOM_PASSWORD env if None)
             headless: Run browser in headless mode
+            session_path: File for the saved login session (None disables persistence)
+            force_login: Ignore any saved session and log in again
+            debug: Save page screenshots to data/screenshots for troubleshooting
         """
         self.username = username or os.getenv("KENPOM_EMAIL")
         self.password = password or os.getenv("KENPOM_PASSWORD")
         self.headless = headless
+        self.session_path = session_path
+        self.force_login = force_login
+        self.debug = debug
+
+        # Shared browser (see __enter__) and logged-in session reused across fetches
+        self._pw: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._storage_state: Optional[Any] = None if force_login else self._saved_session()
 
         if not self.username or not self.password:
             raise ValueError(
                 "KENPOM_EMAIL and KENPOM_PASSWORD required (set in .env or pass as args)"
             )
 
+    @staticmethod
+    def _any_visible(page: Page, indicators: tuple[str, ...]) -> bool:
+        """Return True if any indicator is present, using a single browser round-trip.
+
+        Args:
+            page: Playwright page object
+            indicators: Selectors in Playwright "text=..." or CSS form
+
+        Returns:
+            True if any indicator matched, False otherwise (including on errors)
+        """
+        try:
+            return bool(page.evaluate(_ANY_VISIBLE_JS, list(_split_indicators(indicators))))
+        except Exception:
+            return False
+
+    def _screenshot(self, page: Page, filename: str) -> None:
+        """Save a page screenshot to data/screenshots when debug is enabled."""
+        if not self.debug:
+            return
+        screenshots_dir = Path("data/screenshots")
+        screenshots_dir.mkdir(parents=True, exist_ok=True)
+        page.screenshot(path=str(screenshots_dir / filename))
+        logger.debug("Screenshot saved to %s", screenshots_dir / filename)
+
+    @staticmethod
+    def _wait_cloudflare_cleared(page: Page, timeout_ms: int) -> bool:
+        """Wait in the browser until no Cloudflare indicator remains.
+
+        Args:
+            page: Playwright page object
+            timeout_ms: Maximum time to wait in milliseconds
+
+        Returns:
+            True once the challenge is gone, False if it is still showing at timeout
+        """
+        try:
+            page.wait_for_function(
+                _CLOUDFLARE_CLEARED_JS,
+                arg=list(_split_indicators(_CLOUDFLARE_INDICATORS)),
+                polling=250,
+                timeout=timeout_ms,
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
     def _handle_cloudflare(self, page: Page) -> None:
         """Handle Cloudflare verification challenge.
 
         Waits for automatic verification or prompts user if stuck.
         """
-        cloudflare_indicators = [
-            "text=Verifying you are human",
-            "text=Verify you are human",
-            "text=Checking your browser",
-            "text=needs to review the security",
-            "text=Just a moment",
-            "text=completing the action below",
-            "#challenge-running",
-            "#challenge-stage",
-            "iframe[src*='challenges.cloudflare.com']",
-            "iframe[src*='turnstile']",
-        ]
-
-        is_cloudflare = False
-        for selector in cloudflare_indicators:
-            try:
-                if page.locator(selector).is_visible(timeout=1000):
-                    is_cloudflare = True
-                    break
-            except Exception:
-                continue
+        is_cloudflare = self._any_visible(page, _CLOUDFLARE_INDICATORS)
 
         if not is_cloudflare:
             return
 
-        print("\n" + "=" * 60)
-        print("CLOUDFLARE VERIFICATION DETECTED")
-        print("=" * 60)
-        print("Waiting for automatic verification...")
+        logger.info("Cloudflare verification detected, waiting for automatic verification...")
 
         # Wait up to 10 seconds for automatic verification
         for i in range(10):
             page.wait_for_timeout(1000)
 
             # Check if a clickable checkbox appeared (Turnstile)
-            turnstile_selectors = [
-                "iframe[src*='challenges.cloudflare.com']",
-                "iframe[src*='turnstile']",
-                "text=completing the action below",
-            ]
-
-            checkbox_appeared = False
-            for selector in turnstile_selectors:
-                try:
-                    if page.locator(selector).is_visible(timeout=500):
-                        checkbox_appeared = True
-                        break
-                except Exception:
-                    continue
+            checkbox_appeared = self._any_visible(page, _TURNSTILE_INDICATORS)
 
             if checkbox_appeared and not self.headless:
                 print("\n" + "=" * 60)
@@ -208,41 +476,24 @@ class RefRatingsScraper:
                 print("DO NOT close the browser!")
                 print("=" * 60)
                 input("\nPress ENTER after clicking the checkbox...")
-                page.wait_for_timeout(3000)
 
-                still_verifying = False
-                for selector in cloudflare_indicators:
-                    try:
-                        if page.locator(selector).is_visible(timeout=1000):
-                            still_verifying = True
-                            break
-                    except Exception:
-                        continue
-
-                if not still_verifying:
-                    print("Cloudflare verification completed!")
+                if self._wait_cloudflare_cleared(page, timeout_ms=15000):
+                    logger.info("Cloudflare verification completed")
                     return
                 continue
 
-            still_verifying = False
-            for selector in cloudflare_indicators:
-                try:
-                    if page.locator(selector).is_visible(timeout=500):
-                        still_verifying = True
-                        break
-                except Exception:
-                    continue
+            still_verifying = self._any_visible(page, _CLOUDFLARE_INDICATORS)
 
             if not still_verifying:
-                print("Cloudflare verification completed!")
+                logger.info("Cloudflare verification completed")
                 page.wait_for_timeout(2000)
                 return
 
             if i == 5:
-                print("Still waiting...")
+                logger.info("Still waiting for Cloudflare verification...")
 
         # If still stuck, try refreshing
-        print("Verification stuck, trying page refresh...")
+        logger.warning("Cloudflare verification stuck, trying page refresh...")
         page.reload(wait_until="domcontentloaded", timeout=60000)
         page.wait_for_timeout(5000)
 
@@ -256,8 +507,8 @@ class RefRatingsScraper:
             True if login successful, False otherwise
         """
         try:
-            print("Navigating to KenPom login page...")
-            page.goto("https://kenpom.com/", wait_until="domcontentloaded", timeout=60000)
+            logger.info("Navigating to KenPom login page...")
+            _goto_with_retry(page, "https://kenpom.com/")
             page.wait_for_timeout(2000)
 
             # Handle Cloudflare verification if present
@@ -266,15 +517,12 @@ class RefRatingsScraper:
             # Check if already logged in
             try:
                 if page.locator("a:has-text('Logout')").is_visible(timeout=2000):
-                    print("Already logged in")
+                    logger.info("Already logged in")
                     return True
             except Exception:
                 pass
 
-            print("Looking for login form on main page...")
-
-            screenshots_dir = Path("data/screenshots")
-            screenshots_dir.mkdir(parents=True, exist_ok=True)
+            logger.debug("Looking for login form on main page...")
 
             # Try multiple selectors for email field
             email_selectors = [
@@ -291,14 +539,14 @@ class RefRatingsScraper:
                     field = page.locator(selector)
                     if field.is_visible(timeout=2000):
                         email_field = field
-                        print(f"Found email field with selector: {selector}")
+                        logger.debug("Found email field with selector: %s", selector)
                         break
                 except Exception:
                     continue
 
             if not email_field:
-                print("Could not find email field.")
-                page.screenshot(path=str(screenshots_dir / "ref_ratings_login_failed.png"))
+                logger.warning("Could not find email field")
+                self._screenshot(page, "ref_ratings_login_failed.png")
 
                 if not self.headless:
                     print("\n" + "=" * 60)
@@ -312,7 +560,7 @@ class RefRatingsScraper:
 
                     try:
                         if page.locator("a:has-text('Logout')").is_visible(timeout=3000):
-                            print("Manual login successful!")
+                            logger.info("Manual login successful")
                             return True
                     except Exception:
                         pass
@@ -333,230 +581,112 @@ class RefRatingsScraper:
                 submit_button = page.locator('input[type="submit"], button[type="submit"]').first
 
             submit_button.click()
-            print("Submitted login form...")
+            logger.debug("Submitted login form...")
 
             page.wait_for_timeout(3000)
 
             # Verify login success
             try:
                 if page.locator("a:has-text('Logout')").is_visible(timeout=3000):
-                    print("Login successful")
+                    logger.info("Login successful")
                     return True
             except Exception:
                 pass
 
-            print("WARNING: May still be on login page, proceeding anyway...")
+            logger.warning("May still be on login page, proceeding anyway...")
             return True
 
-        except Exception as e:
-            print(f"Login failed: {e}")
-            import traceback
-
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Login failed")
             return False
 
-    def scrape_ref_ratings(self, page: Page, season: int = 2025) -> Optional[RefRatingsSnapshot]:
+    def scrape_ref_ratings(
+        self, page: Page, season: int = 2025, use_menu: bool = True
+    ) -> Optional[RefRatingsSnapshot]:
         """Scrape referee ratings from kenpom.com/officials.php.
 
         Args:
             page: Playwright page object
             season: Season year to scrape
+            use_menu: Try the Miscellany menu before the direct URL. The menu always
+                opens the current season, so pass False for past seasons.
 
         Returns:
             RefRatingsSnapshot with all referee ratings, or None on failure
         """
         try:
-            print(f"Navigating to Ref Ratings page for season {season}...")
+            logger.info("Navigating to Ref Ratings page for season %s...", season)
 
             # Try menu navigation first (Miscellany menu -> Ref Ratings)
-            try:
-                print("Attempting menu navigation to Ref Ratings...")
-                misc_menu = page.locator('a:has-text("Miscellany")')
-                if misc_menu.is_visible(timeout=3000):
-                    misc_menu.hover()
-                    page.wait_for_timeout(500)
-
-                    ref_link = page.locator('a:has-text("Ref Ratings")')
-                    if ref_link.is_visible(timeout=2000):
-                        ref_link.click()
-                        page.wait_for_timeout(3000)
-                        print("Successfully navigated via Miscellany menu")
+            navigated = False
+            if use_menu:
+                try:
+                    logger.debug("Attempting menu navigation to Ref Ratings...")
+                    misc_menu = page.locator('a:has-text("Miscellany")')
+                    if misc_menu.is_visible(timeout=3000):
+                        misc_menu.hover()
+                        page.wait_for_timeout(500)
+
+                        ref_link = page.locator('a:has-text("Ref Ratings")')
+                        if ref_link.is_visible(timeout=2000):
+                            ref_link.click()
+                            page.wait_for_timeout(3000)
+                            navigated = True
+                            logger.debug("Navigated via Miscellany menu")
+                        else:
+                            raise Exception("Ref Ratings link not visible in menu")
                     else:
-                        raise Exception("Ref Ratings link not visible in menu")
-                else:
-                    raise Exception("Miscellany menu not visible")
-            except Exception as e:
-                print(f"Menu navigation failed ({e}), using direct URL...")
-                page.goto(
-                    f"https://kenpom.com/officials.php?y={season}",
-                    wait_until="domcontentloaded",
-                    timeout=60000,
-                )
+                        raise Exception("Miscellany menu not visible")
+                except Exception as e:
+                    logger.debug("Menu navigation failed (%s), using direct URL...", e)
+
+            if not navigated:
+                _goto_with_retry(page, f"https://kenpom.com/officials.php?y={season}")
                 page.wait_for_timeout(3000)
 
-            # Take screenshot for debugging
-            screenshots_dir = Path("data/screenshots")
-            screenshots_dir.mkdir(parents=True, exist_ok=True)
-            page.screenshot(path=str(screenshots_dir / "kenpom_ref_ratings_page.png"))
-            print(f"Screenshot saved to {screenshots_dir / 'kenpom_ref_ratings_page.png'}")
+            self._screenshot(page, "kenpom_ref_ratings_page.png")
 
-            # Scroll to load all referees
-            print("Scrolling to load all referees...")
-            prev_count = 0
-            for scroll_attempt in range(10):
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                page.wait_for_timeout(500)
+            # Scroll to load all referees (polled inside the browser, one round-trip)
+            logger.debug("Scrolling to load all referees...")
+            try:
+                page.wait_for_function(_ROWS_SETTLED_JS, polling=250, timeout=15000)
+                logger.debug("All referees loaded")
+            except Exception:
+                prev_count = 0
+                for scroll_attempt in range(10):
+                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                    page.wait_for_timeout(500)
 
-                current_count = page.evaluate("() => document.querySelectorAll('table tr').length")
+                    current_count = page.evaluate(
+                        "() => document.querySelectorAll('table tr').length"
+                    )
 
-                if current_count == prev_count and scroll_attempt > 2:
-                    print(f"All referees loaded ({current_count} rows)")
-                    break
-                prev_count = current_count
+                    if current_count == prev_count and scroll_attempt > 2:
+                        logger.debug("All referees loaded (%s rows)", current_count)
+                        break
+                    prev_count = current_count
 
             page.evaluate("window.scrollTo(0, 0)")
             page.wait_for_timeout(500)
 
-            # Extract referee data from table
-            # Table structure from officials.php:
-            # | Rank | Name + FAA subscript | Rating | Gms | Last Game |
-            # FAA is shown as subscript text after the name (e.g., "Kipp Kissinger -0.4")
-            ref_data = page.evaluate("""
-                () => {
-                    const result = {
-                        refs: [],
-                        avg_faa: 0,
-                    };
-
-                    // Find the main data table (the one with "Officials Rankings" data)
-                    const tables = document.querySelectorAll('table');
-                    console.log('Found', tables.length, 'tables');
-
-                    // Find table with referee data - look for Rating/Gms headers
-                    let table = null;
-                    for (const t of tables) {
-                        const headerText = t.textContent.toLowerCase();
-                        if (headerText.includes('rating') && headerText.includes('gms')) {
-                            table = t;
-                            break;
-                        }
-                    }
-
-                    if (!table) {
-                        // Fallback to first table with multiple rows
-                        for (const t of tables) {
-                            if (t.querySelectorAll('tr').length > 5) {
-                                table = t;
-                                break;
-                            }
-                        }
-                    }
-
-                    if (!table) {
-                        console.log('No table found');
-                        return result;
-                    }
-
-                    // Table structure: | Rank | Name + FAA subscript | Rating | Gms | Last Game |
-                    // The FAA is embedded in the name cell as subscript text (e.g., "Kipp Kissinger -0.4")
-
-                    const allRows = table.querySelectorAll('tr');
-                    console.log('Total rows:', allRows.length);
-
-                    let faaSum = 0;
-
-                    allRows.forEach((row, idx) => {
-                        // Skip header rows
-                        if (row.querySelector('th')) return;
-
-                        const cells = Array.from(row.querySelectorAll('td'));
-                        // Need at least: rank, name+faa, rating, gms
-                        if (cells.length < 4) return;
-
-                        // Cell 0: Rank number (we'll use our own counter)
-                        // Cell 1: Name cell with FAA as subscript
-                        // Cell 2: Rating
-                        // Cell 3: Gms (games count)
-
-                        const nameCell = cells[1];
-                        if (!nameCell) return;
-
-                        // Get the referee name from the anchor tag
-                        const nameLink = nameCell.querySelector('a');
-                        if (!nameLink) return;
-                        const name = nameLink.textContent.trim();
-                        if (!name || name.length < 2) return;
-
-                        // Get FAA from the full cell text (includes subscript)
-                        // Full text is like "Kipp Kissinger -0.4" or "Paul Szelc +1.8"
-                        const fullText = nameCell.textContent.trim();
-
-                        // Extract FAA: it's the signed number at the end after the name
-                        // Pattern: name followed by space and signed decimal like " -0.4" or " +1.8"
-                        const faaMatch = fullText.match(/([+-]?\\d+\\.\\d+)\\s*$/);
-                        if (!faaMatch) {
-                            console.log('No FAA found in:', fullText);
-                            return;
-                        }
-                        const faa = parseFloat(faaMatch[1]);
-                        if (isNaN(faa)) return;
-
-                        // Get Rating from cell 2
-                        const ratingText = cells[2]?.textContent.trim();
-                        const rating = parseFloat(ratingText);
-
-                        // Get Games from cell 3
-                        const gamesText = cells[3]?.textContent.trim();
-                        const games = parseInt(gamesText, 10);
-
-                        faaSum += faa;
-                        result.refs.push({
-                            name: name,
-                            faa: faa,
-                            rank: result.refs.length + 1,
-                            games: isNaN(games) ? null : games,
-                            rating: isNaN(rating) ? null : rating,
-                            conference: null,
-                        });
-                    });
-
-                    // Calculate average FAA
-                    if (result.refs.length > 0) {
-                        result.avg_faa = faaSum / result.refs.length;
-                    }
-
-                    // Sort by FAA descending (highest FAA = most fouls)
-                    result.refs.sort((a, b) => b.faa - a.faa);
-                    // Re-rank after sorting
-                    result.refs.forEach((r, idx) => { r.rank = idx + 1; });
-
-                    console.log('Extracted', result.refs.length, 'referees');
-                    return result;
-                }
-            """)
+            # Extract referee data from the officials table
+            ref_data = page.evaluate(_EXTRACT_REFS_JS, "table")
 
-            print(f"Extracted {len(ref_data['refs'])} referees from table")
+            logger.info("Extracted %s referees from table", ref_data["count"])
 
-            if not ref_data["refs"]:
-                print("Primary extraction failed, trying alternative method...")
+            if ref_data["count"] == 0:
+                logger.warning("Primary extraction failed, trying alternative method...")
                 ref_data = self._extract_refs_alternative(page)
 
-            if not ref_data["refs"]:
-                print("ERROR: Could not extract referee data")
+            if ref_data["count"] == 0:
+                logger.error("Could not extract referee data")
                 return None
 
-            # Convert to RefRating objects
-            refs = [
-                RefRating(
-                    name=r["name"],
-                    faa=r["faa"],
-                    rank=r["rank"],
-                    games=r.get("games"),
-                    rating=r.get("rating"),
-                    conference=r.get("conference"),
-                )
+            # Refs arrive sorted by FAA and ranked; build RefRating objects positionally
+            refs = tuple(
+                RefRating(r["name"], r["faa"], r["rank"], r["games"], r["rating"], None)
                 for r in ref_data["refs"]
-            ]
+            )
 
             return RefRatingsSnapshot(
                 date=date.today().isoformat(),
@@ -565,93 +695,100 @@ class RefRatingsScraper:
                 refs=refs,
             )
 
-        except Exception as e:
-            print(f"Referee ratings scraping failed: {e}")
-            import traceback
-
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Referee ratings scraping failed")
             return None
 
     def _extract_refs_alternative(self, page: Page) -> dict:
         """Alternative extraction method using simpler DOM parsing."""
-        return page.evaluate("""
-            () => {
-                const result = {
-                    refs: [],
-                    avg_faa: 0,
-                };
-
-                const allRows = document.querySelectorAll('tr');
-                let faaSum = 0;
-
-                allRows.forEach(row => {
-                    const cells = row.querySelectorAll('td');
-                    // Need at least: rank, name+faa, rating, gms
-                    if (cells.length < 4) return;
-
-                    // Cell 1 has name + FAA subscript
-                    const nameCell = cells[1];
-                    if (!nameCell) return;
-
-                    const nameLink = nameCell.querySelector('a');
-                    if (!nameLink) return;
-                    const name = nameLink.textContent.trim();
-                    if (!name || name.length < 2) return;
-
-                    // Extract FAA from full cell text
-                    const fullText = nameCell.textContent.trim();
-                    const faaMatch = fullText.match(/([+-]?\\d+\\.\\d+)\\s*$/);
-                    if (!faaMatch) return;
-
-                    const faa = parseFloat(faaMatch[1]);
-                    if (isNaN(faa)) return;
-
-                    // Get Rating from cell 2
-                    const rating = parseFloat(cells[2]?.textContent.trim());
-
-                    // Get Games from cell 3
-                    const games = parseInt(cells[3]?.textContent.trim(), 10);
-
-                    faaSum += faa;
-                    result.refs.push({
-                        name: name,
-                        faa: faa,
-                        rank: result.refs.length + 1,
-                        games: isNaN(games) ? null : games,
-                        rating: isNaN(rating) ? null : rating,
-                        conference: null,
-                    });
-                });
-
-                if (result.refs.length > 0) {
-                    result.avg_faa = faaSum / result.refs.length;
-                    // Sort by FAA descending
-                    result.refs.sort((a, b) => b.faa - a.faa);
-                    result.refs.forEach((r, idx) => { r.rank = idx + 1; });
-                }
+        return page.evaluate(_EXTRACT_REFS_JS, "rows")
+
+    def __enter__(self) -> "RefRatingsScraper":
+        self._start_browser()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _start_browser(self) -> Browser:
+        """Launch Chromium once and keep it open until close()."""
+        if self._browser is None:
+            self._pw = sync_playwright().start()
+            self._browser = self._pw.chromium.launch(
+                headless=self.headless,
+                args=[
+                    "--disable-blink-features=AutomationControlled",
+                    "--no-sandbox",
+                    "--disable-dev-shm-usage",
+                ],
+            )
+        return self._browser
+
+    def close(self) -> None:
+        """Close the shared browser and stop Playwright."""
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            self._pw.stop()
+            self._pw = None
+
+    def _saved_session(self) -> Optional[str]:
+        """Return the saved session file if it exists and is fresh enough to reuse."""
+        if self.session_path is None or not self.session_path.exists():
+            return None
+        age = time.time() - self.session_path.stat().st_mtime
+        if age > SESSION_MAX_AGE_SECONDS:
+            return None
+        return str(self.session_path)
 
-                return result;
-            }
-        """)
+    def _save_session(self, context: BrowserContext) -> None:
+        """Keep the logged-in session for later fetches and, if enabled, on disk."""
+        if self.session_path is None:
+            self._storage_state = context.storage_state()
+            return
+        self.session_path.parent.mkdir(parents=True, exist_ok=True)
+        self._storage_state = context.storage_state(path=self.session_path)
 
     def fetch_ref_ratings(self, season: int = 2025) -> Optional[RefRatingsSnapshot]:
         """Fetch referee ratings for a season.
 
+        Inside a ``with RefRatingsScraper(...)`` block the browser is launched once
+        and reused across calls, and the logged-in session is carried over so later
+        calls skip the login form. Outside a ``with`` block each call launches and
+        closes its own browser.
+
+        The session is also saved to ``session_path`` and reused by later runs for
+        up to 24 hours; login() then sees the Logout link and returns immediately.
+
         Args:
             season: Season year (e.g., 2025)
 
         Returns:
             RefRatingsSnapshot with all referee ratings, or None on failure
         """
-        with sync_playwright() as p:
-            browser = p.chromium.launch(
-                headless=self.headless,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                ],
-            )
+        return self._fetch([season], use_menu=True)[season]
+
+    def fetch_ref_ratings_many(self, seasons: list[int]) -> dict[int, Optional[RefRatingsSnapshot]]:
+        """Fetch referee ratings for several seasons with a single login.
+
+        Seasons are scraped one after another on the same logged-in page; the
+        Playwright sync API is bound to the thread that started it, so pages on a
+        shared browser cannot be driven from a thread pool.
+
+        Args:
+            seasons: Season years to scrape
+
+        Returns:
+            Dict mapping each season to its snapshot (None where scraping failed)
+        """
+        return self._fetch(seasons, use_menu=False)
+
+    def _fetch(self, seasons: list[int], use_menu: bool) -> dict[int, Optional[RefRatingsSnapshot]]:
+        """Log in once on the shared browser and scrape each season in turn."""
+        owns_browser = self._browser is None
+        browser = self._start_browser()
+        try:
             context = browser.new_context(
                 user_agent=(
                     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -659,17 +796,24 @@ class RefRatingsScraper:
                 ),
                 viewport={"width": 1920, "height": 1080},
                 locale="en-US",
+                storage_state=self._storage_state,
             )
-            page = context.new_page()
-
             try:
+                context.route("**/*", _block_nonessential)
+                page = context.new_page()
                 if not self.login(page):
                     raise RuntimeError("Login failed")
+                self._save_session(context)
 
-                return self.scrape_ref_ratings(page, season)
-
+                return {
+                    season: self.scrape_ref_ratings(page, season, use_menu=use_menu)
+                    for season in seasons
+                }
             finally:
-                browser.close()
+                context.close()
+        finally:
+            if owns_browser:
+                self.close()
 
 
 def load_ref_ratings_snapshot(snapshot_path: Path) -> Optional[RefRatingsSnapshot]:
@@ -685,10 +829,45 @@ def load_ref_ratings_snapshot(snapshot_path: Path) -> Optional[RefRatingsSnapsho
         return None
 
     try:
-        return RefRatingsSnapshot.from_json(snapshot_path.read_text())
+        return RefRatingsSnapshot.from_json(snapshot_path.read_bytes())
     except Exception as e:
-        print(f"Error loading referee ratings snapshot: {e}")
+        logger.error("Error loading referee ratings snapshot: %s", e)
+        return None
+
+
+def _latest_ref_file() -> Optional[tuple[Path, int]]:
+    """Return (path, mtime_ns) of the newest referee ratings snapshot, if any."""
+    ref_files = sorted(Path("data").glob("kenpom_ref_ratings_*.json"), reverse=True)
+    if not ref_files:
+        return None
+    return ref_files[0], ref_files[0].stat().st_mtime_ns
+
+
+@lru_cache(maxsize=4)
+def _load_cached(path_str: str, mtime_ns: int) -> Optional[RefRatingsSnapshot]:
+    """Parse a snapshot file once per (path, mtime); a rewritten file is reloaded."""
+    return load_ref_ratings_snapshot(Path(path_str))
+
+
+def load_latest_ref_ratings_snapshot() -> Optional[RefRatingsSnapshot]:
+    """Load the most recent referee ratings snapshot from data/.
+
+    Parsed snapshots are cached by path and modification time, so scoring
+    many games reads and decodes the file once.
+
+    Returns:
+        RefRatingsSnapshot or None if no snapshot file exists
+    """
+    latest = _latest_ref_file()
+    if latest is None:
         return None
+    path, mtime_ns = latest
+    return _load_cached(str(path), mtime_ns)
+
+
+def clear_ref_ratings_cache() -> None:
+    """Clear the cached referee ratings snapshots (useful for testing)."""
+    _load_cached.cache_clear()
 
 
 def get_ref_faa(ref_name: str, snapshot: Optional[RefRatingsSnapshot] = None) -> Optional[float]:
@@ -702,10 +881,7 @@ def get_ref_faa(ref_name: str, snapshot: Optional[RefRatingsSnapshot] = None) ->
         FAA value, or None if not found
     """
     if snapshot is None:
-        data_dir = Path("data")
-        ref_files = sorted(data_dir.glob("kenpom_ref_ratings_*.json"), reverse=True)
-        if ref_files:
-            snapshot = load_ref_ratings_snapshot(ref_files[0])
+        snapshot = load_latest_ref_ratings_snapshot()
 
     if snapshot is None:
         return None
@@ -724,10 +900,7 @@ def get_crew_faa(ref_names: list[str], snapshot: Optional[RefRatingsSnapshot] =
         Sum of FAA values for the crew (0.0 if no snapshot)
     """
     if snapshot is None:
-        data_dir = Path("data")
-        ref_files = sorted(data_dir.glob("kenpom_ref_ratings_*.json"), reverse=True)
-        if ref_files:
-            snapshot = load_ref_ratings_snapshot(ref_files[0])
+        snapshot = load_latest_ref_ratings_snapshot()
 
     if snapshot is None:
         return 0.0
@@ -735,6 +908,43 @@ def get_crew_faa(ref_names: list[str], snapshot: Optional[RefRatingsSnapshot] =
     return snapshot.get_crew_faa(ref_names)
 
 
+def score_crews_dataframe(
+    games_df: pd.DataFrame, snapshot: Optional[RefRatingsSnapshot] = None
+) -> pd.Series:
+    """Get combined crew FAA for every game in a slate at once.
+
+    Exact (case-insensitive) names are resolved with one vectorized lookup; only
+    the distinct names left over go through the partial and initial+last-name
+    matching of RefRatingsSnapshot.get_ref_faa.
+
+    Args:
+        games_df: One row per (game_id, ref_name) pair
+        snapshot: Referee ratings snapshot (loads latest if None)
+
+    Returns:
+        Series of crew FAA sums indexed by game_id (0.0 where no ref matched,
+        matching get_crew_faa)
+    """
+    if snapshot is None:
+        snapshot = load_latest_ref_ratings_snapshot()
+
+    if snapshot is None:
+        return pd.Series(
+            0.0, index=pd.Index(games_df["game_id"].unique(), name="game_id"), name="crew_faa"
+        )
+
+    names = games_df["ref_name"].str.strip().str.lower()
+    faa = names.map(snapshot._exact)
+
+    # Missing officials (None/NaN) count as unmatched refs and contribute nothing
+    unmatched = faa.isna() & names.notna()
+    if unmatched.any():
+        fallback = {name: snapshot.get_ref_faa(name) for name in names[unmatched].unique()}
+        faa[unmatched] = names[unmatched].map(fallback)
+
+    return faa.astype(float).groupby(games_df["game_id"]).sum().rename("crew_faa")
+
+
 def main():
     """CLI entry point for scraping KenPom referee ratings."""
     import argparse
@@ -754,9 +964,31 @@ def main():
         default=2025,
         help="Season year (default: 2025)",
     )
+    parser.add_argument(
+        "--force-login",
+        action="store_true",
+        help="Ignore the saved login session and log in again",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Verbose logging and page screenshots in data/screenshots",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print the JSON snapshot (default: compact)",
+    )
     args = parser.parse_args()
 
-    scraper = RefRatingsScraper(headless=args.headless)
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s - %(message)s",
+    )
+
+    scraper = RefRatingsScraper(
+        headless=args.headless, force_login=args.force_login, debug=args.debug
+    )
     print(f"Running in {'headless' if args.headless else 'headed'} mode")
     print("If CAPTCHA appears, complete it in the browser window")
     print("-" * 50)
@@ -768,7 +1000,7 @@ def main():
         today = date.today().isoformat()
         json_path = Path(f"data/kenpom_ref_ratings_{today}.json")
         json_path.parent.mkdir(parents=True, exist_ok=True)
-        json_path.write_text(snapshot.to_json())
+        json_path.write_text(snapshot.to_json(indent=args.pretty))
         print(f"Referee ratings snapshot saved to: {json_path}")
 
         # Also save as CSV
@@ -777,6 +1009,11 @@ def main():
         df.to_csv(csv_path, index=False)
         print(f"Referee ratings CSV saved to: {csv_path}")
 
+        # And as Parquet for fast typed reloads
+        parquet_path = Path(f"data/kenpom_ref_ratings_{today}.parquet")
+        df.to_parquet(parquet_path, index=False, compression="zstd")
+        print(f"Referee ratings Parquet saved to: {parquet_path}")
+
         # Print summary
         print(f"\n{'=' * 60}")
         print(f"KENPOM REFEREE RATINGS (FAA) - {today}")
@@ -17,14 +17,16 @@ The log-linear method better matches KenPom's official predictions by:
 from __future__ import annotations
 
 import logging
-import math
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, cast
 
+import numpy as np
 import pandas as pd
 
 from .client import KenPomClient
 from .config import Settings
+from .jit import njit
 from .prediction import D1_AVERAGE_EFFICIENCY, calculate_luck_adjustment
 
 log = logging.getLogger(__name__)
@@ -33,6 +35,36 @@ log = logging.getLogger(__name__)
 DEFAULT_K = 11.0
 DEFAULT_HOME_ADV = 3.0
 
+# Below this many slate teams, per-team ratings/archive calls beat one all-teams call
+_BULK_FETCH_MIN_TEAMS = 4
+
+# Output columns holding a handful of distinct labels
+_CATEGORICAL_COLUMNS = ("feature_source_home", "feature_source_visitor", "method")
+
+# Raw fanmatch fields copied into the slate for traceability
+_RAW_FANMATCH_KEYS = (
+    "GameID",
+    "HomeRank",
+    "VisitorRank",
+    "PredTempo",
+    "ThrillScore",
+    "HomePred",
+    "VisitorPred",
+    "HomeWP",
+)
+
+# Odds CSV columns carried into join_with_odds output, renamed for clarity
+_ODDS_COLUMNS = {
+    "home_spread": "odds_spread",
+    "home_spread_odds": "odds_spread_odds",
+    "home_ml": "odds_home_ml",
+    "away_ml": "odds_away_ml",
+    "total": "odds_total",
+    "over_odds": "over_odds",
+    "under_odds": "under_odds",
+    "game_time": "game_time",
+}
+
 
 # =============================================================================
 # Team Name Normalization (Overtime → KenPom)
@@ -80,17 +112,25 @@ OVERTIME_TO_KENPOM: Dict[str, str] = {
 }
 
 
+# Memoized per name; call normalize_team_name.cache_clear() after editing OVERTIME_TO_KENPOM
+@lru_cache(maxsize=4096)
 def normalize_team_name(name: str) -> str:
-    if name in OVERTIME_TO_KENPOM:
-        return OVERTIME_TO_KENPOM[name]
-    # Suffix normalization
-    if name.endswith(" State") and not name.endswith(" St."):
-        candidate = name.replace(" State", " St.")
-        if candidate != name:
-            return candidate
+    mapped = OVERTIME_TO_KENPOM.get(name)
+    if mapped is not None:
+        return mapped
+    # Suffix normalization ("Morgan State" -> "Morgan St.")
+    if name.endswith(" State"):
+        return name[: -len(" State")] + " St."
     return name
 
 
+def _normalize_team_names(names: pd.Series) -> pd.Series:
+    """Vectorized normalize_team_name over a Series of team names."""
+    mapped = names.map(OVERTIME_TO_KENPOM)
+    fixed = names.str.replace(r" State$", " St.", regex=True)
+    return mapped.where(mapped.notna(), fixed)
+
+
 # =============================================================================
 # Retry/Backoff Hooks (placeholder for custom retry logic)
 # =============================================================================
@@ -139,9 +179,71 @@ def _row(resp: Any) -> Dict[str, Any]:
     return {}
 
 
-def _sigmoid(x: float) -> float:
-    """Sigmoid function for win probability."""
-    return 1.0 / (1.0 + math.exp(-x))
+def _rows_by_team_id(resp: Any, name_to_id: Dict[str, int]) -> Dict[int, Dict[str, Any]]:
+    """Key all-teams endpoint rows by TeamID (rows carry TeamName, not TeamID)."""
+    out: Dict[int, Dict[str, Any]] = {}
+    for r in resp:
+        row = r.model_dump() if hasattr(r, "model_dump") else r
+        name = row.get("TeamName")
+        if isinstance(name, str):
+            tid = name_to_id.get(name.strip().lower())
+            if tid is not None:
+                out[tid] = row
+    return out
+
+
+@njit(cache=True)
+def _project_slate(
+    poss: np.ndarray,
+    oe_h: np.ndarray,
+    de_h: np.ndarray,
+    oe_v: np.ndarray,
+    de_v: np.ndarray,
+    luck_h: np.ndarray,
+    luck_v: np.ndarray,
+    fm_h: np.ndarray,
+    fm_v: np.ndarray,
+    home_adv: float,
+    k: float,
+    use_loglinear: bool,
+    use_fanmatch_scores: bool,
+) -> Tuple[np.ndarray, ...]:
+    """Slate projection arithmetic on float arrays (numba-compiled if available).
+
+    Returns:
+        Tuple of (score_home, score_vis, margin, total, p_home, e_home, e_vis, hca_eff)
+    """
+    # HCA as efficiency (HCA_points * 100 / possessions); only applied by log-linear
+    hca_eff = home_adv * 100.0 / poss
+
+    # Expected efficiency (points per 100 poss)
+    if use_loglinear:
+        # Log-linear formula: E = OE + DE - 100, with HCA applied to efficiency
+        # plus luck regression
+        e_home = oe_h + de_v - D1_AVERAGE_EFFICIENCY + hca_eff + luck_h
+        e_vis = oe_v + de_h - D1_AVERAGE_EFFICIENCY + luck_v
+    else:
+        # Legacy simple average formula: E = (OE + DE) / 2
+        e_home = (oe_h + de_v) / 2.0
+        e_vis = (oe_v + de_h) / 2.0
+
+    score_home = poss * (e_home / 100.0)
+    score_vis = poss * (e_vis / 100.0)
+
+    # Fanmatch scores override the model side by side (NaN = keep model)
+    if use_fanmatch_scores:
+        score_home = np.where(np.isnan(fm_h), score_home, fm_h)
+        score_vis = np.where(np.isnan(fm_v), score_vis, fm_v)
+
+    # Apply home advantage (only for legacy method - loglinear applies to efficiency)
+    if not use_loglinear:
+        score_home = score_home + home_adv / 2.0
+        score_vis = score_vis - home_adv / 2.0
+
+    margin = score_home - score_vis
+    total = score_home + score_vis
+    p_home = 1.0 / (1.0 + np.exp(-margin / k))
+    return score_home, score_vis, margin, total, p_home, e_home, e_vis, hca_eff
 
 
 def _f(obj: Dict[str, Any], *keys: str) -> float:
@@ -282,8 +384,40 @@ def fanmatch_slate_table(
                     return r, "ratings_fallback", warn
                 raise
 
-        # 5) Build output rows
-        rows: List[Dict[str, Any]] = []
+        # Prefetch the whole slate with one bulk call (the endpoint returns every team
+        # when team_id is omitted); teams it misses still go through per-team calls.
+        slate_ids = {
+            tid
+            for g in slate
+            for name in (g.get("Home"), g.get("Visitor"))
+            if isinstance(name, str) and (tid := lookup_team_id(name)) is not None
+        }
+        if len(slate_ids) >= _BULK_FETCH_MIN_TEAMS:
+            try:
+                if use_archive:
+                    bulk = _rows_by_team_id(c.archive(d=d), name_to_id)
+                    archive_cache.update(
+                        {(d, tid): bulk[tid] for tid in slate_ids if bulk.get(tid)}
+                    )
+                else:
+                    bulk = _rows_by_team_id(c.ratings(y=season), name_to_id)
+                    ratings_cache.update(
+                        {(season, tid): bulk[tid] for tid in slate_ids if bulk.get(tid)}
+                    )
+            except Exception as e:
+                log.warning("Bulk feature prefetch failed, fetching per team: %s", e)
+
+        # 5) Gather per-game inputs; the projection math runs on whole arrays below
+        # Row positions keep slate order once error rows and projected games are combined
+        error_rows: List[Dict[str, Any]] = []
+        error_pos: List[int] = []
+        games: List[Dict[str, Any]] = []
+        game_pos: List[int] = []
+        src_home: List[str] = []
+        src_vis: List[str] = []
+        game_warnings: List[Optional[str]] = []
+        inputs: List[Tuple[float, ...]] = []
+        nan = float("nan")
 
         for g in slate:
             home_name = g.get("Home")
@@ -303,19 +437,11 @@ def fanmatch_slate_table(
                     "error": "TeamID mapping failed",
                 }
                 if include_raw_fanmatch:
-                    for kk in [
-                        "GameID",
-                        "HomeRank",
-                        "VisitorRank",
-                        "PredTempo",
-                        "ThrillScore",
-                        "HomePred",
-                        "VisitorPred",
-                        "HomeWP",
-                    ]:
+                    for kk in _RAW_FANMATCH_KEYS:
                         if kk in g:
                             row[f"fanmatch_{kk}"] = g[kk]
-                rows.append(row)
+                error_pos.append(len(error_pos) + len(game_pos))
+                error_rows.append(row)
                 continue
 
             fh, src_h, warn_h = get_features(home_id)
@@ -331,62 +457,74 @@ def fanmatch_slate_table(
             else:
                 poss = (_f(fh, "AdjTempo", "Tempo") + _f(fv, "AdjTempo", "Tempo")) / 2.0
 
-            # Expected efficiency (points per 100 poss)
-            if use_loglinear:
-                # Log-linear formula: E = OE + DE - 100
-                # This correctly combines efficiencies relative to D1 average baseline
-                E_home_raw = _f(fh, "AdjOE") + _f(fv, "AdjDE") - D1_AVERAGE_EFFICIENCY
-                E_vis_raw = _f(fv, "AdjOE") + _f(fh, "AdjDE") - D1_AVERAGE_EFFICIENCY
-
-                # Apply luck regression if enabled and available
-                luck_adj_home = 0.0
-                luck_adj_vis = 0.0
-                if apply_luck_regression:
-                    try:
-                        luck_adj_home = calculate_luck_adjustment(fh.get("Luck"))
-                    except (KeyError, TypeError):
-                        pass
-                    try:
-                        luck_adj_vis = calculate_luck_adjustment(fv.get("Luck"))
-                    except (KeyError, TypeError):
-                        pass
-
-                # Apply HCA to efficiency (more accurate than score adjustment)
-                # HCA_efficiency = HCA_points * 100 / possessions
-                hca_efficiency = home_adv * 100.0 / poss
-
-                # Home team gets offensive efficiency boost + luck adjustment
-                E_home = E_home_raw + hca_efficiency + luck_adj_home
-                E_vis = E_vis_raw + luck_adj_vis
-            else:
-                # Legacy simple average formula: E = (OE + DE) / 2
-                E_home = (_f(fh, "AdjOE") + _f(fv, "AdjDE")) / 2.0
-                E_vis = (_f(fv, "AdjOE") + _f(fh, "AdjDE")) / 2.0
-                luck_adj_home = 0.0
-                luck_adj_vis = 0.0
-                hca_efficiency = 0.0
-
-            # Base projected scores
-            score_home = poss * (E_home / 100.0)
-            score_vis = poss * (E_vis / 100.0)
-
-            # Optionally use Fanmatch scores
+            # Luck regression (log-linear only) when available
+            luck_adj_home = 0.0
+            luck_adj_vis = 0.0
+            if use_loglinear and apply_luck_regression:
+                try:
+                    luck_adj_home = calculate_luck_adjustment(fh.get("Luck"))
+                except (KeyError, TypeError):
+                    pass
+                try:
+                    luck_adj_vis = calculate_luck_adjustment(fv.get("Luck"))
+                except (KeyError, TypeError):
+                    pass
+
+            # Fanmatch scores override the model side by side (NaN = keep model)
+            fm_home = fm_vis = nan
             if use_fanmatch_scores:
                 try:
-                    score_home = float(g["HomePred"])
-                    score_vis = float(g["VisitorPred"])
+                    fm_home = float(g["HomePred"])
+                    fm_vis = float(g["VisitorPred"])
                 except (KeyError, TypeError, ValueError):
                     pass
 
-            # Apply home advantage (only for legacy method - loglinear applies to efficiency)
-            if not use_loglinear:
-                score_home += home_adv / 2.0
-                score_vis -= home_adv / 2.0
+            inputs.append(
+                (
+                    poss,
+                    _f(fh, "AdjOE"),
+                    _f(fh, "AdjDE"),
+                    _f(fv, "AdjOE"),
+                    _f(fv, "AdjDE"),
+                    luck_adj_home,
+                    luck_adj_vis,
+                    fm_home,
+                    fm_vis,
+                )
+            )
 
-            margin = score_home - score_vis
-            total = score_home + score_vis
+            warnings: List[str] = []
+            if warn_h:
+                warnings.append(f"home_{warn_h}")
+            if warn_v:
+                warnings.append(f"visitor_{warn_v}")
 
-            p_home = _sigmoid(margin / k)
+            game_pos.append(len(error_pos) + len(game_pos))
+            games.append(g)
+            src_home.append(src_h)
+            src_vis.append(src_v)
+            game_warnings.append(";".join(warnings) if warnings else None)
+
+        # 6) Project every mapped game at once, straight into output columns
+        frames: List[pd.DataFrame] = []
+        if inputs:
+            arr = np.array(inputs, dtype=np.float64)
+            poss_a, oe_h, de_h, oe_v, de_v, luck_h, luck_v, fm_h, fm_v = np.ascontiguousarray(arr.T)
+            score_home, score_vis, margin, total, p_home, e_home, e_vis, hca_eff = _project_slate(
+                poss_a,
+                oe_h,
+                de_h,
+                oe_v,
+                de_v,
+                luck_h,
+                luck_v,
+                fm_h,
+                fm_v,
+                float(home_adv),
+                float(k),
+                use_loglinear,
+                use_fanmatch_scores,
+            )
             p_vis = 1.0 - p_home
 
             # Determine method string
@@ -397,59 +535,50 @@ def fanmatch_slate_table(
             else:
                 method_str = "archive_to_points" if use_archive else "ratings_to_points"
 
-            row = {
-                "date": g.get("DateOfGame", d),
+            columns: Dict[str, Any] = {
+                "date": [g.get("DateOfGame", d) for g in games],
                 "season": season,
-                "home": home_name,
-                "visitor": vis_name,
-                "proj_home": round(score_home, 1),
-                "proj_visitor": round(score_vis, 1),
-                "proj_total": round(total, 1),
-                "proj_margin": round(margin, 1),
-                "win_prob_home": round(p_home, 4),
-                "win_prob_visitor": round(p_vis, 4),
-                "possessions": round(poss, 2),
-                "eff_home_pp100": round(E_home, 2),
-                "eff_visitor_pp100": round(E_vis, 2),
-                "feature_source_home": src_h,
-                "feature_source_visitor": src_v,
+                "home": [g["Home"] for g in games],
+                "visitor": [g["Visitor"] for g in games],
+                "proj_home": np.round(score_home, 1),
+                "proj_visitor": np.round(score_vis, 1),
+                "proj_total": np.round(total, 1),
+                "proj_margin": np.round(margin, 1),
+                "win_prob_home": np.round(p_home, 4),
+                "win_prob_visitor": np.round(p_vis, 4),
+                "possessions": np.round(poss_a, 2),
+                "eff_home_pp100": np.round(e_home, 2),
+                "eff_visitor_pp100": np.round(e_vis, 2),
+                "feature_source_home": src_home,
+                "feature_source_visitor": src_vis,
                 "method": method_str,
             }
-
-            # Add enhanced formula diagnostics
+            # Enhanced formula diagnostics
             if use_loglinear:
-                row["hca_efficiency"] = round(hca_efficiency, 2)
-                row["luck_adj_home"] = round(luck_adj_home, 3)
-                row["luck_adj_visitor"] = round(luck_adj_vis, 3)
-
+                columns["hca_efficiency"] = np.round(hca_eff, 2)
+                columns["luck_adj_home"] = np.round(luck_h, 3)
+                columns["luck_adj_visitor"] = np.round(luck_v, 3)
             # Attach warnings
-            warnings: List[str] = []
-            if warn_h:
-                warnings.append(f"home_{warn_h}")
-            if warn_v:
-                warnings.append(f"visitor_{warn_v}")
-            if warnings:
-                row["warnings"] = ";".join(warnings)
-
+            if any(w is not None for w in game_warnings):
+                columns["warnings"] = game_warnings
             if include_raw_fanmatch:
-                for kk in [
-                    "GameID",
-                    "HomeRank",
-                    "VisitorRank",
-                    "PredTempo",
-                    "ThrillScore",
-                    "HomePred",
-                    "VisitorPred",
-                    "HomeWP",
-                ]:
-                    if kk in g:
-                        row[f"fanmatch_{kk}"] = g[kk]
-
-            rows.append(row)
-
-        df = pd.DataFrame(rows)
+                for kk in _RAW_FANMATCH_KEYS:
+                    if any(kk in g for g in games):
+                        columns[f"fanmatch_{kk}"] = [g.get(kk, np.nan) for g in games]
+            frames.append(pd.DataFrame(columns, index=game_pos))
+
+        if error_rows:
+            frames.append(pd.DataFrame(error_rows, index=error_pos))
+
+        if not frames:
+            return pd.DataFrame()
+        df = frames[0] if len(frames) == 1 else pd.concat(frames).sort_index()
+
+        # Low-cardinality labels: store as categorical codes rather than Python strings
+        df = df.astype({col: "category" for col in _CATEGORICAL_COLUMNS if col in df.columns})
         if "proj_margin" in df.columns and len(df) > 0:
-            df = df.sort_values(by="proj_margin", key=lambda s: s.abs(), ascending=False)
+            df["_abs_margin"] = df["proj_margin"].abs()
+            df = df.sort_values("_abs_margin", ascending=False).drop(columns="_abs_margin")
         return df
 
     finally:
@@ -466,7 +595,7 @@ def join_with_odds(
 
     Args:
         slate_df: DataFrame from fanmatch_slate_table
-        odds_path: Path to odds CSV (e.g., data/overtime_ncaab_odds_YYYY-MM-DD.csv)
+        odds_path: Path to odds CSV (e.g., data/overtime_ncaab_odds_YYYY-MM-DD.csv.gz)
         odds_date: Date for auto-locating odds file (uses first date in slate if None)
 
     Returns:
@@ -483,7 +612,10 @@ def join_with_odds(
         if odds_date is None:
             log.warning("No odds_date specified and slate has no date column")
             return slate_df
-        odds_path = Path(settings.out_dir) / f"overtime_ncaab_odds_{odds_date}.csv"
+        odds_path = Path(settings.out_dir) / f"overtime_ncaab_odds_{odds_date}.csv.gz"
+        if not odds_path.exists():
+            # Legacy uncompressed odds files
+            odds_path = odds_path.with_suffix("")
 
     if not odds_path.exists():
         log.warning(f"Odds file not found: {odds_path}")
@@ -494,45 +626,25 @@ def join_with_odds(
     odds_df = pd.read_csv(odds_path)
 
     # Normalize team names for matching
-    odds_df["home_norm"] = odds_df["home_team"].apply(normalize_team_name).str.strip().str.lower()
-    odds_df["away_norm"] = odds_df["away_team"].apply(normalize_team_name).str.strip().str.lower()
-
-    slate_df = slate_df.copy()
-    slate_df["home_norm"] = slate_df["home"].str.strip().str.lower()
-    slate_df["visitor_norm"] = slate_df["visitor"].str.strip().str.lower()
-
-    # Merge on normalized names
-    merged = slate_df.merge(
-        odds_df[
-            [
-                "home_norm",
-                "away_norm",
-                "home_spread",
-                "home_spread_odds",
-                "home_ml",
-                "away_ml",
-                "total",
-                "over_odds",
-                "under_odds",
-                "game_time",
-            ]
-        ],
-        left_on=["home_norm", "visitor_norm"],
-        right_on=["home_norm", "away_norm"],
-        how="left",
-        suffixes=("", "_odds"),
-    )
+    odds_df["home_norm"] = _normalize_team_names(odds_df["home_team"]).str.strip().str.lower()
+    odds_df["away_norm"] = _normalize_team_names(odds_df["away_team"]).str.strip().str.lower()
 
-    # Rename odds columns for clarity
-    merged = merged.rename(
-        columns={
-            "home_spread": "odds_spread",
-            "home_spread_odds": "odds_spread_odds",
-            "total": "odds_total",
-            "home_ml": "odds_home_ml",
-            "away_ml": "odds_away_ml",
-        }
+    # Hash join: index the (small) odds table by matchup once and look up each
+    # slate game, keeping the first line when a matchup is listed twice
+    odds_by_game = odds_df.drop_duplicates(["home_norm", "away_norm"]).set_index(
+        ["home_norm", "away_norm"]
+    )
+    key = pd.MultiIndex.from_arrays(
+        [
+            slate_df["home"].str.strip().str.lower(),
+            slate_df["visitor"].str.strip().str.lower(),
+        ]
     )
+    matched = odds_by_game[list(_ODDS_COLUMNS)].reindex(key)
+
+    merged = slate_df.reset_index(drop=True)
+    for src, dst in _ODDS_COLUMNS.items():
+        merged[dst] = matched[src].to_numpy()
 
     # Mark which rows got odds
     merged["odds_joined"] = merged["odds_spread"].notna()
@@ -544,9 +656,6 @@ def join_with_odds(
         # If we project home +5 and market says home -3, edge = 5 - (-3) = 8 (bet home)
         merged["spread_edge"] = merged["proj_margin"] - merged["odds_spread"].fillna(0)
 
-    # Clean up temp columns
-    merged = merged.drop(columns=["home_norm", "visitor_norm", "away_norm"], errors="ignore")
-
     return merged
 
 
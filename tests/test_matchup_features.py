@@ -9,6 +9,9 @@ from kenpom_client.matchup import (
     MatchupFeatures,
     calculate_home_court_factor,
     calculate_matchup_features,
+    calculate_matchup_features_frame,
+    calculate_matchup_features_from_cached,
+    precompute_team_features,
 )
 
 
@@ -102,6 +105,7 @@ class TestCalculateMatchupFeatures:
         assert matchup.tempo_mismatch == pytest.approx(10.0)
         assert matchup.delta_tempo == pytest.approx(10.0)
         assert matchup.pace_control == "away_controls"
+        assert matchup.pace_sign == -1.0
 
     def test_tempo_mismatch_home_controls(self):
         """Test tempo mismatch - home team controls pace."""
@@ -113,6 +117,7 @@ class TestCalculateMatchupFeatures:
         assert matchup.tempo_mismatch == pytest.approx(10.0)
         assert matchup.delta_tempo == pytest.approx(-10.0)
         assert matchup.pace_control == "home_controls"
+        assert matchup.pace_sign == 1.0
 
     def test_style_clash_similar(self):
         """Test style classification - similar teams."""
@@ -124,6 +129,7 @@ class TestCalculateMatchupFeatures:
         assert matchup.away_3pt_reliance == pytest.approx(30.0)
         assert matchup.home_3pt_reliance == pytest.approx(32.0)
         assert matchup.style_clash == "similar"
+        assert matchup.style_variance_multiplier == pytest.approx(1.0)
 
     def test_style_clash_3pt_vs_interior(self):
         """Test style classification - 3PT vs interior mismatch."""
@@ -135,6 +141,7 @@ class TestCalculateMatchupFeatures:
         assert matchup.away_3pt_reliance == pytest.approx(42.0)
         assert matchup.home_3pt_reliance == pytest.approx(25.0)
         assert matchup.style_clash == "3pt_vs_interior"
+        assert matchup.style_variance_multiplier == pytest.approx(1.10)
 
     def test_home_court_factor_constant(self):
         """Test home court factor (currently constant)."""
@@ -270,3 +277,76 @@ class TestHelperFunctions:
         hca = calculate_home_court_factor(home)
 
         assert hca == pytest.approx(3.5)  # Currently returns constant
+
+
+class TestCalculateMatchupFeaturesFrame:
+    """Test the vectorized slate-level feature builder."""
+
+    def test_frame_matches_per_game_features(self):
+        """Each row should equal calculate_matchup_features for that pair."""
+        from dataclasses import asdict
+
+        away_df = pd.DataFrame(
+            {
+                "adj_em": [12.3, 5.0, None],
+                "adj_tempo": [75.0, 66.0, 70.0],
+                "efg_pct": [52.5, 49.0, 51.0],
+                "to_pct": [17.5, 19.0, 18.0],
+                "or_pct": [32.0, 27.0, 30.0],
+                "off_fg3": [42.0, 31.0, 30.0],
+            }
+        )
+        home_df = pd.DataFrame(
+            {
+                "adj_em": [22.0, 8.0, 1.0],
+                "adj_tempo": [65.0, 72.5, 70.0],
+                "defg_pct": [47.5, 50.0, 49.0],
+                "dto_pct": [21.0, 18.0, 20.0],
+                "dor_pct": [27.0, 29.0, 31.0],
+                "off_fg3": [28.0, 33.0, 30.0],
+            }
+        )
+
+        frame = calculate_matchup_features_frame(away_df, home_df)
+
+        assert len(frame) == 3
+        for i in range(3):
+            expected = asdict(calculate_matchup_features(away_df.iloc[i], home_df.iloc[i]))
+            row = frame.iloc[i].to_dict()
+            for key, value in expected.items():
+                if isinstance(value, float):
+                    assert row[key] == pytest.approx(value), key
+                else:
+                    assert row[key] == value, key
+
+
+class TestPrecomputedTeamFeatures:
+    """Test per-team feature caching for slate sweeps."""
+
+    def test_cached_features_match_direct_computation(self):
+        """Features from cached vectors should equal calculate_matchup_features."""
+        snapshot = pd.DataFrame(
+            {
+                "team": ["Oregon", "Gonzaga", "Duke"],
+                "adj_em": [12.3, 22.0, None],
+                "adj_tempo": [75.0, 65.0, 70.0],
+                "efg_pct": [52.5, 55.0, 51.0],
+                "defg_pct": [48.0, 47.5, 49.0],
+                "to_pct": [17.5, 16.0, 18.0],
+                "dto_pct": [19.0, 21.0, 20.0],
+                "or_pct": [32.0, 30.0, 30.0],
+                "dor_pct": [28.0, 27.0, 31.0],
+                "off_fg3": [42.0, 28.0, 30.0],
+            }
+        )
+
+        team_features = precompute_team_features(snapshot)
+
+        assert set(team_features) == {"Oregon", "Gonzaga", "Duke"}
+        for away_idx, home_idx in [(0, 1), (1, 0), (2, 0)]:
+            away = snapshot.iloc[away_idx]
+            home = snapshot.iloc[home_idx]
+            cached = calculate_matchup_features_from_cached(
+                team_features[away["team"]], team_features[home["team"]]
+            )
+            assert cached == calculate_matchup_features(away, home)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -294,6 +295,41 @@ class TestMarginEnhanced:
         # Pace adjustment should be doubled: (10.0 / 5.0) * 0.20 = 0.4
         assert breakdown_custom["pace_control"] == pytest.approx(0.4, abs=0.01)
 
+    def test_repeat_calls_and_margin_only(self):
+        """Repeat calls should agree and return_breakdown=False should skip the dict."""
+        matchup = MatchupFeatures(
+            delta_adj_em=-3.0,
+            delta_adj_oe=-1.0,
+            delta_adj_de=2.0,
+            delta_tempo=4.0,
+            shooting_advantage=1.5,
+            shooting_defense_advantage=2.5,
+            turnover_advantage=1.0,
+            rebounding_advantage=-2.0,
+            tempo_mismatch=4.0,
+            pace_control="away_controls",
+            home_3pt_reliance=30.0,
+            away_3pt_reliance=30.0,
+            style_clash="similar",
+            home_court_factor=3.5,
+            rest_advantage=None,
+            travel_distance=None,
+            feature_version="1.0",
+        )
+
+        first, breakdown = calculate_margin_enhanced(18.0, 15.0, matchup)
+        second, breakdown_again = calculate_margin_enhanced(18.0, 15.0, matchup)
+
+        assert second == first
+        assert breakdown_again == breakdown
+        assert breakdown_again is not breakdown  # fresh dict per call
+
+        margin_only, no_breakdown = calculate_margin_enhanced(
+            18.0, 15.0, matchup, return_breakdown=False
+        )
+        assert margin_only == first
+        assert no_breakdown is None
+
 
 class TestSigmaGame:
     """Test additive variance sigma calculation."""
@@ -479,6 +515,48 @@ class TestSigmaGame:
         expected_interaction = 0.015 * (10.0**2) * 1.10
         assert components["var_interaction"] == pytest.approx(expected_interaction)
 
+    def test_precomputed_variance_matches(self):
+        """calculate_sigma_game_pre on sigma_sq should equal calculate_sigma_game."""
+        from kenpom_client.prediction import (
+            calculate_sigma_game_pre,
+            enrich_snapshot_with_variance,
+        )
+
+        snapshot = enrich_snapshot_with_variance(pd.DataFrame({"sigma": [10.5, 11.2, 2.0]}))
+        assert snapshot["sigma_sq"].tolist() == pytest.approx([110.25, 125.44, 4.0])
+
+        for tempo_mismatch, style, away_idx in [(8.0, "3pt_vs_interior", 0), (0.0, "similar", 2)]:
+            matchup = MatchupFeatures(
+                delta_adj_em=0.0,
+                delta_adj_oe=0.0,
+                delta_adj_de=0.0,
+                delta_tempo=tempo_mismatch,
+                shooting_advantage=0.0,
+                shooting_defense_advantage=0.0,
+                turnover_advantage=0.0,
+                rebounding_advantage=0.0,
+                tempo_mismatch=tempo_mismatch,
+                pace_control="away_controls",
+                home_3pt_reliance=30.0,
+                away_3pt_reliance=30.0,
+                style_clash=style,
+                home_court_factor=3.5,
+                rest_advantage=None,
+                travel_distance=None,
+                feature_version="1.0",
+            )
+            away, home = snapshot.iloc[away_idx], snapshot.iloc[1]
+            expected, _ = calculate_sigma_game(away["sigma"], home["sigma"], matchup)
+
+            sigma = calculate_sigma_game_pre(
+                away["sigma_sq"],
+                home["sigma_sq"],
+                matchup.tempo_mismatch,
+                matchup.style_variance_multiplier,
+            )
+
+            assert sigma == pytest.approx(expected)
+
 
 class TestPredictGame:
     """Test complete game prediction."""
@@ -606,3 +684,558 @@ class TestPredictGame:
         assert prediction1.margin_baseline == pytest.approx(prediction2.margin_baseline)
         assert prediction1.margin_enhanced == pytest.approx(prediction2.margin_enhanced)
         assert prediction1.sigma_game == pytest.approx(prediction2.sigma_game)
+
+    def test_predict_game_scalar_matches_series_api(self):
+        """predict_game_scalar on plain floats should match predict_game."""
+        from kenpom_client.matchup import calculate_matchup_features
+        from kenpom_client.prediction import predict_game_scalar
+
+        away = pd.Series({"adj_em": 12.3, "adj_tempo": 67.5, "sigma": 10.5})
+        home = pd.Series({"adj_em": 22.0, "adj_tempo": 74.0, "sigma": 11.2})
+        matchup = calculate_matchup_features(away, home)
+
+        expected = predict_game(away, home, matchup_features=matchup)
+        prediction = predict_game_scalar(22.0, 12.3, 11.2, 10.5, matchup)
+
+        assert prediction == expected
+
+    def test_predict_win_prob_matches_full_prediction(self):
+        """predict_win_prob should equal predict_game_scalar's enhanced win prob."""
+        from kenpom_client.matchup import calculate_matchup_features
+        from kenpom_client.prediction import predict_game_scalar, predict_win_prob
+
+        away = pd.Series({"adj_em": 12.3, "adj_tempo": 67.5, "off_fg3": 42.0, "sigma": 10.5})
+        home = pd.Series({"adj_em": 22.0, "adj_tempo": 74.0, "off_fg3": 28.0, "sigma": 11.2})
+        matchup = calculate_matchup_features(away, home)
+
+        full = predict_game_scalar(22.0, 12.3, 11.2, 10.5, matchup)
+
+        assert predict_win_prob(22.0, 12.3, 11.2, 10.5, matchup) == full.win_prob_enhanced
+
+    def test_predict_game_accepts_dict_rows(self):
+        """Plain dict rows (df.to_dict("records")) should predict like Series rows."""
+        snapshot = pd.DataFrame(
+            {
+                "team": ["Oregon", "Gonzaga"],
+                "adj_em": [12.3, 22.0],
+                "adj_tempo": [67.5, 74.0],
+                "efg_pct": [52.5, None],
+                "off_fg3": [42.0, 28.0],
+                "sigma": [10.5, 11.2],
+            }
+        )
+        away, home = snapshot.to_dict("records")
+
+        prediction = predict_game(away, home)
+
+        assert prediction == predict_game(snapshot.iloc[0], snapshot.iloc[1])
+
+    def test_predict_game_uses_team_feature_cache(self):
+        """predict_game with a slate cache should match the uncached prediction."""
+        from kenpom_client.matchup import precompute_team_features
+
+        snapshot = pd.DataFrame(
+            {
+                "team": ["Oregon", "Gonzaga"],
+                "adj_em": [12.3, 22.0],
+                "adj_tempo": [67.5, 74.0],
+                "off_fg3": [42.0, 28.0],
+                "sigma": [10.5, 11.2],
+            }
+        )
+        team_features = precompute_team_features(snapshot)
+        away, home = snapshot.iloc[0], snapshot.iloc[1]
+
+        cached = predict_game(away, home, team_features=team_features)
+
+        assert cached == predict_game(away, home)
+
+    def test_predict_game_cached_by_team_names(self):
+        """predict_game_cached should match predict_game and reuse results."""
+        from kenpom_client.prediction import SnapshotProxy, predict_game_cached
+
+        df = pd.DataFrame(
+            {
+                "team": ["Oregon", "Gonzaga"],
+                "adj_em": [12.3, 22.0],
+                "adj_tempo": [67.5, 74.0],
+                "sigma": [10.5, 11.2],
+            }
+        )
+        snapshot = SnapshotProxy(df)
+
+        first = predict_game_cached("Gonzaga", "Oregon", snapshot)
+        second = predict_game_cached("Gonzaga", "Oregon", snapshot)
+
+        assert first == predict_game(df.iloc[0], df.iloc[1])
+        assert second is first
+        assert (snapshot.hits, snapshot.misses) == (1, 1)
+        assert SnapshotProxy(df.copy()).snapshot_hash == snapshot.snapshot_hash
+
+
+class TestPredictGamesBatch:
+    """Test vectorized batch prediction."""
+
+    def _teams(self):
+        oregon = pd.Series(
+            {
+                "adj_em": 12.3,
+                "adj_oe": 114.5,
+                "adj_de": 102.2,
+                "adj_tempo": 67.5,
+                "efg_pct": 52.5,
+                "defg_pct": 49.8,
+                "to_pct": 17.5,
+                "or_pct": 32.0,
+                "off_fg3": 35.0,
+                "sigma": 10.5,
+            }
+        )
+        gonzaga = pd.Series(
+            {
+                "adj_em": 22.0,
+                "adj_oe": 120.8,
+                "adj_de": 98.8,
+                "adj_tempo": 74.2,
+                "efg_pct": 55.2,
+                "defg_pct": 47.5,
+                "to_pct": 15.8,
+                "or_pct": 28.5,
+                "dto_pct": 21.0,
+                "dor_pct": 27.0,
+                "off_fg3": 33.0,
+                "sigma": 11.2,
+            }
+        )
+        return oregon, gonzaga
+
+    def test_batch_matches_scalar_predictions(self):
+        """Each batch row should match predict_game for the same matchup."""
+        from dataclasses import asdict
+
+        from kenpom_client.matchup import calculate_matchup_features
+        from kenpom_client.prediction import predict_games_batch
+
+        oregon, gonzaga = self._teams()
+        pairs = [(oregon, gonzaga), (gonzaga, oregon)]
+        features = [calculate_matchup_features(a, h) for a, h in pairs]
+
+        away_df = pd.DataFrame([a for a, _ in pairs])
+        home_df = pd.DataFrame([h for _, h in pairs])
+        matchup_df = pd.DataFrame([asdict(f) for f in features])
+
+        batch = predict_games_batch(away_df, home_df, matchup_df)
+
+        assert len(batch) == 2
+        for i, (away, home) in enumerate(pairs):
+            expected = predict_game(away, home, matchup_features=features[i])
+            row = batch.iloc[i]
+            assert row["margin_baseline"] == pytest.approx(expected.margin_baseline)
+            assert row["margin_enhanced"] == pytest.approx(expected.margin_enhanced)
+            assert row["sigma_game"] == pytest.approx(expected.sigma_game)
+            assert row["win_prob_baseline"] == pytest.approx(expected.win_prob_baseline)
+            assert row["win_prob_enhanced"] == pytest.approx(expected.win_prob_enhanced)
+            assert row["adj_pace_control"] == pytest.approx(
+                expected.adjustment_breakdown["pace_control"]
+            )
+            assert row["var_interaction"] == pytest.approx(
+                expected.sigma_components["var_interaction"]
+            )
+            assert round(row["win_prob_enhanced"], 4) == round(expected.win_prob_enhanced, 4)
+
+        # Batch path runs in single precision
+        assert batch["margin_enhanced"].dtype == "float32"
+
+    def test_batch_adjustment_is_capped(self):
+        """Total adjustment should be clipped to ±max_total_adjustment."""
+        from kenpom_client.prediction import predict_games_batch
+
+        teams = pd.DataFrame({"adj_em": [10.0], "sigma": [11.0]})
+        matchup_df = pd.DataFrame(
+            {
+                "home_court_factor": [3.5],
+                "delta_tempo": [-20.0],
+                "shooting_advantage": [-20.0],
+                "shooting_defense_advantage": [20.0],
+                "turnover_advantage": [20.0],
+                "rebounding_advantage": [-20.0],
+                "tempo_mismatch": [20.0],
+                "pace_control": ["home_controls"],
+                "style_clash": ["similar"],
+            }
+        )
+
+        batch = predict_games_batch(teams, teams, matchup_df)
+
+        assert batch["margin_adjustment"].iloc[0] == pytest.approx(2.0)
+
+    def test_float32_matches_float64_win_probs(self):
+        """Default float32 batch should stay within 1e-4 of a float64 run."""
+        from kenpom_client.prediction import predict_games_arrays
+
+        oregon, gonzaga = self._teams()
+        away_df = pd.DataFrame([oregon, gonzaga]).reset_index(drop=True)
+        home_df = pd.DataFrame([gonzaga, oregon]).reset_index(drop=True)
+
+        single = predict_games_arrays(away_df, home_df)
+        double = predict_games_arrays(away_df, home_df, dtype=np.float64)
+
+        assert single.win_prob_enhanced.dtype == np.float32
+        assert double.win_prob_enhanced.dtype == np.float64
+        assert np.max(np.abs(single.win_prob_enhanced - double.win_prob_enhanced)) < 1e-4
+        assert np.max(np.abs(single.win_prob_baseline - double.win_prob_baseline)) < 1e-4
+
+    def test_arrays_container_matches_frame(self):
+        """predict_games_arrays should hold the same columns as the DataFrame API."""
+        from kenpom_client.prediction import predict_games_arrays, predict_games_batch
+
+        oregon, gonzaga = self._teams()
+        away_df = pd.DataFrame([oregon, gonzaga]).reset_index(drop=True)
+        home_df = pd.DataFrame([gonzaga, oregon]).reset_index(drop=True)
+
+        arrays = predict_games_arrays(away_df, home_df)
+        frame = predict_games_batch(away_df, home_df)
+
+        assert len(arrays) == 2
+        assert arrays.prediction_version == "1.0"
+        assert arrays.sigma_game.tolist() == frame["sigma_game"].tolist()
+        assert list(arrays.to_frame().columns) == list(frame.columns)
+
+    def test_batch_derives_matchup_features_when_missing(self):
+        """Omitting matchup_df should match passing the per-game features."""
+        from kenpom_client.prediction import predict_games_batch
+
+        oregon, gonzaga = self._teams()
+        away_df = pd.DataFrame([oregon, gonzaga]).reset_index(drop=True)
+        home_df = pd.DataFrame([gonzaga, oregon]).reset_index(drop=True)
+
+        batch = predict_games_batch(away_df, home_df)
+
+        for i in range(2):
+            expected = predict_game(away_df.iloc[i], home_df.iloc[i])
+            assert batch["margin_enhanced"].iloc[i] == pytest.approx(expected.margin_enhanced)
+            assert batch["sigma_game"].iloc[i] == pytest.approx(expected.sigma_game)
+
+
+class TestNormalCdf:
+    """Test normal CDF implementations agree."""
+
+    def test_scalar_and_array_paths_match_erf_formula(self):
+        """normal_cdf/normal_cdf_array should match (1 + erf(x/sqrt(2))) / 2."""
+        import math
+
+        import numpy as np
+
+        from kenpom_client.prediction import normal_cdf, normal_cdf_array
+
+        xs = [-3.0, -0.5, 0.0, 0.8, 2.5]
+        expected = [(1.0 + math.erf(x / math.sqrt(2.0))) / 2.0 for x in xs]
+
+        assert [normal_cdf(x) for x in xs] == pytest.approx(expected)
+        assert normal_cdf_array(np.array(xs)) == pytest.approx(expected)
+
+    def test_table_fallback_accuracy(self):
+        """The no-scipy lookup table should stay within 1e-6 of erf and clamp tails."""
+        import math
+
+        import numpy as np
+
+        from kenpom_client.prediction import _normal_cdf_table
+
+        xs = np.linspace(-8.0, 8.0, 2001)
+        expected = np.array([(1.0 + math.erf(x / math.sqrt(2.0))) / 2.0 for x in xs])
+
+        assert np.max(np.abs(_normal_cdf_table(xs) - expected)) < 1e-6
+        assert _normal_cdf_table(np.array([-50.0, 50.0])).tolist() == pytest.approx(
+            [0.0, 1.0], abs=1e-8
+        )
+
+
+class TestPredictFromArrow:
+    """Test the Arrow-native batch path."""
+
+    def test_arrow_matches_pandas_batch(self):
+        """predict_from_arrow should match predict_games_batch column for column."""
+        pa = pytest.importorskip("pyarrow")
+
+        from kenpom_client.prediction import predict_from_arrow, predict_games_batch
+
+        teams = pd.DataFrame({"adj_em": [12.3, 22.0], "sigma": [10.5, 11.2]})
+        matchup_df = pd.DataFrame(
+            {
+                "home_court_factor": [3.5, 4.0],
+                "delta_tempo": [-6.7, 6.7],
+                "shooting_advantage": [-2.7, 2.7],
+                "shooting_defense_advantage": [5.4, -5.4],
+                "turnover_advantage": [3.5, -3.5],
+                "rebounding_advantage": [5.0, -5.0],
+                "tempo_mismatch": [6.7, 6.7],
+                "pace_control": ["home_controls", "away_controls"],
+                "style_clash": ["similar", "3pt_vs_interior"],
+            }
+        )
+        home_df = teams.iloc[::-1].reset_index(drop=True)
+
+        expected = predict_games_batch(teams, home_df, matchup_df)
+
+        table = pa.Table.from_pandas(
+            matchup_df.assign(
+                home_adj_em=home_df["adj_em"],
+                away_adj_em=teams["adj_em"],
+                home_sigma=home_df["sigma"],
+                away_sigma=teams["sigma"],
+            )
+        )
+        result = predict_from_arrow(table)
+
+        assert result.num_rows == 2
+        for name in ("margin_enhanced", "sigma_game", "win_prob_enhanced"):
+            assert result.column(name).to_pylist() == pytest.approx(expected[name].tolist())
+
+        wide = predict_from_arrow(table, dtype=np.float64)
+        assert result.column("margin_enhanced").type == pa.float32()
+        assert wide.column("margin_enhanced").type == pa.float64()
+
+
+class TestSigmoidWinprob:
+    """Test scalar and vectorized sigmoid win probability."""
+
+    def test_vec_matches_scalar(self):
+        """sigmoid_winprob_vec should agree with sigmoid_winprob element-wise."""
+        import numpy as np
+
+        from kenpom_client.prediction import sigmoid_winprob, sigmoid_winprob_vec
+
+        margins = [-25.0, -3.5, 0.0, 10.0, 31.2]
+
+        result = sigmoid_winprob_vec(np.array(margins))
+
+        assert result.tolist() == pytest.approx([sigmoid_winprob(m) for m in margins])
+        assert result.dtype == np.float64
+        assert sigmoid_winprob_vec(np.array(margins, dtype=np.float32)).dtype == np.float32
+        assert sigmoid_winprob_vec(np.array([0, 10])).dtype == np.float64
+        assert sigmoid_winprob(10.0) == pytest.approx(0.7128, abs=1e-4)
+
+    def test_extreme_margins_do_not_overflow(self):
+        """Huge negative margins should give ~0 rather than OverflowError."""
+        from kenpom_client.prediction import sigmoid_winprob
+
+        assert sigmoid_winprob(-1e5) == pytest.approx(0.0, abs=1e-12)
+        assert sigmoid_winprob(1e5) == pytest.approx(1.0)
+
+
+class TestProjectScoresBatch:
+    """Test broadcasted score projection over team grids."""
+
+    def test_grid_matches_project_scores(self):
+        """Entry [i, j] should equal project_scores(home[i], visitor[j])."""
+        from kenpom_client.models import Rating
+        from kenpom_client.prediction import (
+            project_scores,
+            project_scores_batch,
+            ratings_to_soa,
+        )
+
+        def rating(name: str, oe: float, de: float, tempo: float) -> Rating:
+            return Rating(
+                DataThrough="2025-01-15",
+                Season=2025,
+                TeamName=name,
+                ConfShort="ACC",
+                Wins=15,
+                Losses=2,
+                AdjEM=oe - de,
+                AdjOE=oe,
+                AdjDE=de,
+                AdjTempo=tempo,
+                Tempo=tempo,
+                SOS=5.0,
+            )
+
+        ratings = [
+            rating("Duke", 120.0, 94.5, 70.0),
+            rating("North Carolina", 115.2, 98.1, 72.4),
+            rating("Virginia", 108.3, 91.0, 61.2),
+        ]
+        soa = ratings_to_soa(ratings)
+
+        grid = project_scores_batch(soa, soa)
+
+        assert grid["proj_margin"].shape == (3, 3)
+        for i, home in enumerate(ratings):
+            for j, visitor in enumerate(ratings):
+                expected = project_scores(home, visitor)
+                assert grid["proj_home"][i, j] == pytest.approx(expected.proj_home)
+                assert grid["proj_visitor"][i, j] == pytest.approx(expected.proj_visitor)
+                assert grid["win_prob_home"][i, j] == pytest.approx(expected.win_prob_home)
+
+        assert grid["proj_margin"].dtype == "float32"
+        assert grid["win_prob_home"].dtype == "float32"
+        wide = project_scores_batch(soa, soa, dtype=np.float64)
+        assert wide["proj_margin"].dtype == "float64"
+        assert wide["win_prob_home"].dtype == "float64"
+
+    def test_loglinear_grid_matches_scalar(self):
+        """Entry [i, j] should equal project_scores_loglinear(home[i], visitor[j])."""
+        from kenpom_client.models import Rating
+        from kenpom_client.prediction import (
+            project_scores_loglinear,
+            project_scores_loglinear_batch,
+            ratings_to_soa,
+        )
+
+        ratings = [
+            Rating(
+                DataThrough="2025-01-15",
+                Season=2025,
+                TeamName=name,
+                ConfShort="WCC",
+                Wins=15,
+                Losses=2,
+                AdjEM=oe - de,
+                AdjOE=oe,
+                AdjDE=de,
+                AdjTempo=tempo,
+                Tempo=tempo,
+                SOS=5.0,
+                Luck=luck,
+            )
+            for name, oe, de, tempo, luck in [
+                ("Gonzaga", 121.0, 95.2, 71.5, 0.04),
+                ("Bucknell", 101.3, 107.8, 66.0, -0.02),
+                ("Saint Mary's", 113.4, 93.9, 62.1, None),
+            ]
+        ]
+        soa = ratings_to_soa(ratings)
+
+        for apply_luck in (True, False):
+            grid = project_scores_loglinear_batch(
+                soa, soa, apply_luck_regression=apply_luck, dtype=np.float64
+            )
+            for i, home in enumerate(ratings):
+                for j, visitor in enumerate(ratings):
+                    expected = project_scores_loglinear(
+                        home, visitor, apply_luck_regression=apply_luck
+                    )
+                    assert grid["proj_home"][i, j] == pytest.approx(expected.proj_home)
+                    assert grid["proj_visitor"][i, j] == pytest.approx(expected.proj_visitor)
+                    assert grid["win_prob_home"][i, j] == pytest.approx(expected.win_prob_home)
+
+
+class TestPredictBracketMatrix:
+    """Test N x N pairwise prediction matrices."""
+
+    def _field(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "team": ["Duke", "Houston", "Auburn"],
+                "adj_em": [28.0, 25.5, 30.1],
+                "adj_tempo": [66.0, 62.5, 70.2],
+                "efg_pct": [55.0, 51.5, 56.1],
+                "defg_pct": [45.2, 44.0, 47.3],
+                "to_pct": [15.0, 14.2, 16.8],
+                "dto_pct": [18.5, 22.4, 19.0],
+                "or_pct": [33.0, 38.5, 31.0],
+                "dor_pct": [27.5, 26.0, 29.4],
+                "off_fg3": [38.0, 27.0, 33.0],
+                "sigma": [10.8, 9.9, 11.4],
+            }
+        )
+
+    def test_matrix_matches_predict_game(self):
+        """Entry [i, j] should equal predict_game(away=j, home=i)."""
+        from kenpom_client.prediction import predict_bracket_matrix
+
+        teams = self._field()
+
+        margin_mat, win_prob_mat = predict_bracket_matrix(teams)
+
+        assert margin_mat.shape == (3, 3)
+        assert win_prob_mat.shape == (3, 3)
+        for i in range(3):
+            for j in range(3):
+                if i == j:
+                    continue
+                expected = predict_game(teams.iloc[j], teams.iloc[i])
+                assert margin_mat[i, j] == pytest.approx(expected.margin_enhanced, abs=1e-4)
+                assert win_prob_mat[i, j] == pytest.approx(expected.win_prob_enhanced, abs=1e-4)
+
+    def test_neutral_site_drops_home_court(self):
+        """neutral_site should match predict_game with a zero home court factor."""
+        from dataclasses import replace
+
+        from kenpom_client.matchup import calculate_matchup_features
+        from kenpom_client.prediction import predict_bracket_matrix
+
+        teams = self._field()
+        away, home = teams.iloc[1], teams.iloc[0]
+        matchup = replace(calculate_matchup_features(away, home), home_court_factor=0.0)
+
+        margin_mat, win_prob_mat = predict_bracket_matrix(teams, neutral_site=True)
+        expected = predict_game(away, home, matchup_features=matchup)
+
+        assert margin_mat[0, 1] == pytest.approx(expected.margin_enhanced, abs=1e-4)
+        assert win_prob_mat[0, 1] == pytest.approx(expected.win_prob_enhanced, abs=1e-4)
+
+    def test_cached_matrix_round_trips(self, tmp_path):
+        """A second call should load the saved matrices from disk."""
+        from kenpom_client.prediction import (
+            predict_bracket_matrix,
+            predict_bracket_matrix_cached,
+        )
+
+        teams = self._field()
+        cache_dir = str(tmp_path / "predictions")
+
+        first = predict_bracket_matrix_cached(teams, neutral_site=True, cache_dir=cache_dir)
+        assert len(list((tmp_path / "predictions").glob("*.npz"))) == 1
+        second = predict_bracket_matrix_cached(teams, neutral_site=True, cache_dir=cache_dir)
+
+        expected = predict_bracket_matrix(teams, neutral_site=True)
+        for got in (first, second):
+            assert np.array_equal(got[0], expected[0])
+            assert np.array_equal(got[1], expected[1])
+        assert second[1].dtype == np.float32
+
+
+class TestProjectScoresLoglinear:
+    """Test the scalar log-linear projection."""
+
+    def test_archive_ratings_skip_luck(self):
+        """ArchiveRating has no Luck: no adjustment and the archive method label."""
+        from kenpom_client.models import ArchiveRating, Rating
+        from kenpom_client.prediction import project_scores_loglinear
+
+        archive = ArchiveRating(
+            ArchiveDate="2024-03-14",
+            Season=2024,
+            Preseason="false",
+            TeamName="Duke",
+            ConfShort="ACC",
+            AdjEM=25.0,
+            AdjOE=120.0,
+            AdjDE=95.0,
+            AdjTempo=68.0,
+        )
+        rating = Rating(
+            DataThrough="2024-03-14",
+            Season=2024,
+            TeamName="Virginia",
+            ConfShort="ACC",
+            Wins=20,
+            Losses=10,
+            AdjEM=15.0,
+            AdjOE=110.0,
+            AdjDE=95.0,
+            AdjTempo=60.0,
+            Tempo=60.0,
+            SOS=5.0,
+            Luck=0.05,
+        )
+
+        proj = project_scores_loglinear(archive, rating)
+
+        assert proj.method == "loglinear_archive"
+        assert proj.feature_source == "archive:2024-03-14"
+        assert proj.luck_adjustment_home == 0.0
+        assert proj.luck_adjustment_visitor == pytest.approx(-0.25)
@@ -0,0 +1,377 @@
+"""Tests for referee FAA snapshot lookups."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from kenpom_client.ref_ratings_scraper import RefRating, RefRatingsSnapshot
+
+
+def _snapshot() -> RefRatingsSnapshot:
+    return RefRatingsSnapshot(
+        date="2025-01-15",
+        season=2025,
+        avg_faa=0.0,
+        refs=[
+            RefRating(name="Roger Ayers", faa=1.25, rank=1, games=40),
+            RefRating(name="Kipp Kissinger", faa=0.40, rank=2, games=35),
+            RefRating(name="Ted Valentine", faa=-0.75, rank=3, games=28),
+        ],
+    )
+
+
+class TestRefRatingsSnapshot:
+    """Test referee FAA lookups."""
+
+    def test_exact_match_is_case_insensitive(self):
+        """Exact names should match regardless of case."""
+        snapshot = _snapshot()
+
+        assert snapshot.get_ref_faa("roger ayers") == pytest.approx(1.25)
+        assert snapshot.get_ref_faa("TED VALENTINE") == pytest.approx(-0.75)
+
+    def test_partial_match_on_last_name(self):
+        """A last name alone should fall back to substring matching."""
+        assert _snapshot().get_ref_faa("Kissinger") == pytest.approx(0.40)
+
+    def test_initial_and_last_name_variant(self):
+        """Abbreviated first names should match on initial + last name."""
+        snapshot = _snapshot()
+
+        assert snapshot.get_ref_faa("K. Kissinger") == pytest.approx(0.40)
+        assert snapshot.get_ref_faa("R Ayers") == pytest.approx(1.25)
+        assert snapshot.get_ref_faa("T. Ayers") is None
+
+    def test_unknown_ref_returns_none(self):
+        """Names with no match should return None."""
+        assert _snapshot().get_ref_faa("John Higgins") is None
+
+    def test_crew_faa_sums_known_refs(self):
+        """Crew FAA should sum known refs and skip unknown ones."""
+        crew = ["Roger Ayers", "Valentine", "John Higgins"]
+
+        assert _snapshot().get_crew_faa(crew) == pytest.approx(0.50)
+
+    def test_json_round_trip(self):
+        """from_json(to_json()) should rebuild an equal, indexed snapshot."""
+        snapshot = _snapshot()
+
+        restored = RefRatingsSnapshot.from_json(snapshot.to_json())
+
+        assert restored == snapshot
+        assert restored.get_ref_faa("kipp kissinger") == pytest.approx(0.40)
+
+    def test_score_crews_dataframe_matches_get_crew_faa(self):
+        """Slate-wide crew scoring should agree with per-game get_crew_faa."""
+        from kenpom_client.ref_ratings_scraper import score_crews_dataframe
+
+        snapshot = _snapshot()
+        crews = {
+            "g1": ["Roger Ayers", "K. Kissinger", "Nobody Known"],
+            "g2": [" TED VALENTINE ", "Kissinger"],
+            "g3": ["Nobody Known"],
+        }
+        games_df = pd.DataFrame(
+            [(game_id, name) for game_id, names in crews.items() for name in names],
+            columns=["game_id", "ref_name"],
+        )
+
+        result = score_crews_dataframe(games_df, snapshot)
+        for game_id, names in crews.items():
+            assert result[game_id] == pytest.approx(
+                snapshot.get_crew_faa([n.strip() for n in names])
+            )
+
+    def test_score_crews_dataframe_missing_official(self):
+        """Missing ref names should count as unmatched (0.0) rather than raising."""
+        from kenpom_client.ref_ratings_scraper import score_crews_dataframe
+
+        snapshot = _snapshot()
+        games_df = pd.DataFrame(
+            {
+                "game_id": [1, 1, 2, 2, 3],
+                "ref_name": ["Roger Ayers", "K. Kissinger", "Ted Valentine", None, float("nan")],
+            }
+        )
+
+        result = score_crews_dataframe(games_df, snapshot)
+
+        assert result.name == "crew_faa"
+        assert result[1] == pytest.approx(snapshot.get_crew_faa(["Roger Ayers", "K. Kissinger"]))
+        assert result[2] == pytest.approx(snapshot.get_ref_faa("Ted Valentine"))
+        assert result[3] == 0.0
+
+    def test_to_dataframe_schema(self):
+        """to_dataframe should keep RefRating column order with compact dtypes."""
+        base = _snapshot()
+        snapshot = replace(base, refs=[replace(base.refs[0], games=None), *base.refs[1:]])
+        df = snapshot.to_dataframe()
+        assert list(df.columns[:6]) == ["name", "faa", "rank", "games", "rating", "conference"]
+        assert df["faa"].dtype == "float32"
+        assert df["rank"].dtype == "int32"
+        assert df["games"].dtype == "Int32"
+        assert df["games"].isna().iloc[0]
+        assert df["faa"].iloc[0] == pytest.approx(1.25)
+        assert (df["season"] == snapshot.season).all()
+
+    def test_ratings_are_immutable(self):
+        """Refs should be frozen and held in a tuple so the lookup index cannot go stale."""
+        snapshot = _snapshot()
+        assert isinstance(snapshot.refs, tuple)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.refs[0].faa = 0.0  # type: ignore[misc]
+
+    def test_from_json_accepts_bytes(self):
+        """Snapshots read with read_bytes() should parse without decoding first."""
+        snapshot = _snapshot()
+        restored = RefRatingsSnapshot.from_json(snapshot.to_json().encode())
+        assert restored.refs == snapshot.refs
+
+
+class TestLatestSnapshotCache:
+    """Test the cached latest-snapshot loader."""
+
+    def test_latest_snapshot_parsed_once(self, tmp_path, monkeypatch):
+        """Repeated module-level lookups should reuse one parsed snapshot."""
+        from kenpom_client import ref_ratings_scraper
+
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        (data_dir / "kenpom_ref_ratings_2025-01-15.json").write_text(_snapshot().to_json())
+        monkeypatch.chdir(tmp_path)
+        ref_ratings_scraper.clear_ref_ratings_cache()
+
+        assert ref_ratings_scraper.get_ref_faa("Roger Ayers") == pytest.approx(1.25)
+        assert ref_ratings_scraper.get_crew_faa(["Kissinger"]) == pytest.approx(0.40)
+
+        info = ref_ratings_scraper._load_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+        ref_ratings_scraper.clear_ref_ratings_cache()
+
+
+class TestCloudflareIndicators:
+    """Test the batched Cloudflare indicator check."""
+
+    def test_single_evaluate_call(self):
+        """All indicators should be checked in one page.evaluate round-trip."""
+        from kenpom_client.ref_ratings_scraper import (
+            _CLOUDFLARE_INDICATORS,
+            RefRatingsScraper,
+        )
+
+        class FakePage:
+            def __init__(self):
+                self.calls = []
+
+            def evaluate(self, script, arg):
+                self.calls.append(arg)
+                return False
+
+        page = FakePage()
+        assert RefRatingsScraper._any_visible(page, _CLOUDFLARE_INDICATORS) is False
+        assert len(page.calls) == 1
+        texts, css = page.calls[0]
+        assert "just a moment" in texts
+        assert "#challenge-running" in css
+        assert not any(s.startswith("text=") for s in css)
+
+    def test_wait_cloudflare_cleared_reports_timeout(self):
+        """A challenge still showing at the deadline should return False, not raise."""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        from kenpom_client.ref_ratings_scraper import RefRatingsScraper
+
+        class StuckPage:
+            def wait_for_function(self, expression, **kwargs):
+                raise PlaywrightTimeoutError("still verifying")
+
+        class ClearedPage:
+            def wait_for_function(self, expression, **kwargs):
+                return True
+
+        assert RefRatingsScraper._wait_cloudflare_cleared(StuckPage(), 100) is False
+        assert RefRatingsScraper._wait_cloudflare_cleared(ClearedPage(), 100) is True
+
+
+def _patch_playwright(monkeypatch):
+    """Replace Playwright with fakes; returns (launches, storage_states) call logs."""
+    from kenpom_client import ref_ratings_scraper
+
+    launches = []
+    storage_states = []
+
+    class FakeContext:
+        def route(self, pattern, handler):
+            pass
+
+        def new_page(self):
+            return object()
+
+        def storage_state(self, path=None):
+            state = {"cookies": ["session"]}
+            if path is not None:
+                Path(path).write_text(json.dumps(state))
+            return state
+
+        def close(self):
+            pass
+
+    class FakeBrowser:
+        def new_context(self, **kwargs):
+            storage_states.append(kwargs.get("storage_state"))
+            return FakeContext()
+
+        def close(self):
+            pass
+
+    class FakePlaywright:
+        class chromium:
+            @staticmethod
+            def launch(**kwargs):
+                launches.append(kwargs)
+                return FakeBrowser()
+
+        def start(self):
+            return self
+
+        def stop(self):
+            pass
+
+    monkeypatch.setattr(ref_ratings_scraper, "sync_playwright", FakePlaywright)
+    monkeypatch.setattr(ref_ratings_scraper.RefRatingsScraper, "login", lambda self, page: True)
+    monkeypatch.setattr(
+        ref_ratings_scraper.RefRatingsScraper,
+        "scrape_ref_ratings",
+        lambda self, page, season, use_menu=True: season,
+    )
+    return launches, storage_states
+
+
+class TestScraperBrowserReuse:
+    """Test that the scraper reuses one browser and login session."""
+
+    def test_one_launch_for_many_seasons(self, monkeypatch):
+        """Fetching several seasons should launch Chromium once and reuse the login."""
+        from kenpom_client.ref_ratings_scraper import RefRatingsScraper
+
+        launches, storage_states = _patch_playwright(monkeypatch)
+
+        with RefRatingsScraper(username="u", password="p", session_path=None) as scraper:
+            assert scraper.fetch_ref_ratings(2024) == 2024
+            assert scraper.fetch_ref_ratings(2025) == 2025
+
+        assert len(launches) == 1
+        assert storage_states == [None, {"cookies": ["session"]}]
+        assert scraper._browser is None
+
+    def test_fetch_many_logs_in_once(self, monkeypatch):
+        """fetch_ref_ratings_many should scrape every season from one context."""
+        from kenpom_client.ref_ratings_scraper import RefRatingsScraper
+
+        launches, storage_states = _patch_playwright(monkeypatch)
+
+        scraper = RefRatingsScraper(username="u", password="p", session_path=None)
+        assert scraper.fetch_ref_ratings_many([2023, 2024, 2025]) == {
+            2023: 2023,
+            2024: 2024,
+            2025: 2025,
+        }
+        assert len(launches) == 1
+        assert len(storage_states) == 1
+        assert scraper._browser is None
+
+    def test_saved_session_reused_across_runs(self, tmp_path, monkeypatch):
+        """A fresh session file should seed the next run unless force_login is set."""
+        from kenpom_client.ref_ratings_scraper import RefRatingsScraper
+
+        _, storage_states = _patch_playwright(monkeypatch)
+        session = tmp_path / "session.json"
+
+        RefRatingsScraper(username="u", password="p", session_path=session).fetch_ref_ratings()
+        assert session.exists()
+
+        RefRatingsScraper(username="u", password="p", session_path=session).fetch_ref_ratings()
+        RefRatingsScraper(
+            username="u", password="p", session_path=session, force_login=True
+        ).fetch_ref_ratings()
+
+        assert storage_states == [None, str(session), None]
+
+
+class TestResourceBlocking:
+    """Test the route handler that drops non-essential requests."""
+
+    @pytest.mark.parametrize(
+        ("resource_type", "url", "aborted"),
+        [
+            ("image", "https://kenpom.com/logo.png", True),
+            ("stylesheet", "https://kenpom.com/css/main.css", True),
+            ("script", "https://www.googletagmanager.com/gtag/js", True),
+            ("document", "https://kenpom.com/officials.php?y=2025", False),
+            ("script", "https://challenges.cloudflare.com/turnstile/v0/api.js", False),
+        ],
+    )
+    def test_block_nonessential(self, resource_type, url, aborted):
+        """Only images, fonts, CSS, media and trackers should be aborted."""
+        from types import SimpleNamespace
+
+        from kenpom_client.ref_ratings_scraper import _block_nonessential
+
+        calls = []
+        route = SimpleNamespace(
+            request=SimpleNamespace(resource_type=resource_type, url=url),
+            abort=lambda: calls.append("abort"),
+            continue_=lambda: calls.append("continue"),
+        )
+        _block_nonessential(route)
+        assert calls == ["abort" if aborted else "continue"]
+
+
+class TestGotoWithRetry:
+    """Test navigation retries on rate limiting."""
+
+    def test_retries_429_using_retry_after(self, monkeypatch):
+        """A 429 should be retried after the server's Retry-After delay."""
+        from types import SimpleNamespace
+
+        from kenpom_client import ref_ratings_scraper
+
+        sleeps = []
+        monkeypatch.setattr(ref_ratings_scraper.time, "sleep", sleeps.append)
+        responses = [
+            SimpleNamespace(status=429, headers={"retry-after": "3"}),
+            SimpleNamespace(status=200, headers={}),
+        ]
+
+        class FakePage:
+            def goto(self, url, **kwargs):
+                return responses.pop(0)
+
+        ref_ratings_scraper._goto_with_retry(FakePage(), "https://kenpom.com/")
+        assert sleeps == [3.0]
+        assert responses == []
+
+    def test_gives_up_after_max_retries(self, monkeypatch):
+        """Persistent 429s should raise once retries are exhausted."""
+        from types import SimpleNamespace
+
+        from kenpom_client import ref_ratings_scraper
+
+        sleeps = []
+        monkeypatch.setattr(ref_ratings_scraper.time, "sleep", sleeps.append)
+
+        class FakePage:
+            def goto(self, url, **kwargs):
+                return SimpleNamespace(status=429, headers={})
+
+        with pytest.raises(ref_ratings_scraper._RateLimited):
+            ref_ratings_scraper._goto_with_retry(FakePage(), "https://kenpom.com/", max_retries=2)
+        assert len(sleeps) == 2
+        assert 1.0 <= sleeps[0] <= 1.1
+        assert 2.0 <= sleeps[1] <= 2.2
@@ -0,0 +1,221 @@
+"""Tests for the fanmatch slate table builder."""
+
+from __future__ import annotations
+
+import math
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from kenpom_client.prediction import calculate_luck_adjustment
+from kenpom_client.slate import (
+    _normalize_team_names,
+    fanmatch_slate_table,
+    join_with_odds,
+    normalize_team_name,
+)
+
+RATINGS = {
+    1: {"TeamName": "Duke", "AdjOE": 120.0, "AdjDE": 92.0, "AdjTempo": 70.0, "Luck": 0.04},
+    2: {"TeamName": "Kansas", "AdjOE": 114.0, "AdjDE": 95.0, "AdjTempo": 66.0, "Luck": -0.02},
+    3: {"TeamName": "Houston", "AdjOE": 116.0, "AdjDE": 88.0, "AdjTempo": 63.0, "Luck": None},
+    4: {"TeamName": "Gonzaga", "AdjOE": 118.0, "AdjDE": 97.0, "AdjTempo": 71.0, "Luck": 0.01},
+}
+
+SLATE = [
+    {"Season": 2025, "DateOfGame": "2025-01-15", "Home": "Duke", "Visitor": "Kansas",
+     "GameID": 10, "PredTempo": 68.5, "HomePred": 78.0, "VisitorPred": 70.0},
+    {"Season": 2025, "DateOfGame": "2025-01-15", "Home": "Houston", "Visitor": "Gonzaga",
+     "GameID": 11, "HomePred": 71.0, "VisitorPred": 69.0},
+    {"Season": 2025, "DateOfGame": "2025-01-15", "Home": "Duke", "Visitor": "Nowhere St.",
+     "GameID": 12},
+]  # fmt: skip
+
+
+def _client() -> Mock:
+    client = Mock()
+    client.fanmatch.return_value = SLATE
+    client.teams.return_value = [
+        {"TeamName": r["TeamName"], "TeamID": tid} for tid, r in RATINGS.items()
+    ]
+    client.ratings.side_effect = lambda y, team_id=None: (
+        [RATINGS[team_id]] if team_id else list(RATINGS.values())
+    )
+    client.archive.side_effect = lambda d, team_id=None: (
+        [RATINGS[team_id]] if team_id else list(RATINGS.values())
+    )
+    return client
+
+
+def _expected_loglinear(home: int, vis: int, poss: float, home_adv: float = 3.0):
+    h, v = RATINGS[home], RATINGS[vis]
+    e_home = (
+        h["AdjOE"]
+        + v["AdjDE"]
+        - 100.0
+        + home_adv * 100.0 / poss
+        + calculate_luck_adjustment(h["Luck"])
+    )
+    e_vis = v["AdjOE"] + h["AdjDE"] - 100.0 + calculate_luck_adjustment(v["Luck"])
+    return poss * e_home / 100.0, poss * e_vis / 100.0
+
+
+class TestFanmatchSlateTable:
+    """Test slate projections against the per-game formulas."""
+
+    def test_loglinear_projection(self):
+        """Log-linear scores should use PredTempo when given and team tempos otherwise."""
+        df = fanmatch_slate_table(d="2025-01-15", client=_client()).set_index("fanmatch_GameID")
+
+        for game_id, (h, v, poss) in {10: (1, 2, 68.5), 11: (3, 4, 67.0)}.items():
+            score_h, score_v = _expected_loglinear(h, v, poss)
+            row = df.loc[game_id]
+            assert row["proj_home"] == pytest.approx(score_h, abs=0.051)
+            assert row["proj_visitor"] == pytest.approx(score_v, abs=0.051)
+            assert row["proj_margin"] == pytest.approx(score_h - score_v, abs=0.051)
+            assert row["possessions"] == pytest.approx(poss)
+            p_home = 1.0 / (1.0 + math.exp(-(score_h - score_v) / 11.0))
+            assert row["win_prob_home"] == pytest.approx(p_home, abs=1e-4)
+            assert row["win_prob_home"] + row["win_prob_visitor"] == pytest.approx(1.0)
+            assert row["method"] == "loglinear"
+            assert row["feature_source_home"] == "ratings"
+
+    def test_label_columns_are_categorical(self):
+        """Feature source and method labels should be stored as categoricals."""
+        df = fanmatch_slate_table(d="2025-01-15", client=_client())
+
+        for col in ("feature_source_home", "feature_source_visitor", "method"):
+            assert isinstance(df[col].dtype, pd.CategoricalDtype)
+        assert list(df["method"].cat.categories) == ["loglinear"]
+
+    def test_sorted_by_absolute_margin_with_mapping_errors_last(self):
+        """Games sort by |margin| descending; unmapped teams keep an error row."""
+        df = fanmatch_slate_table(d="2025-01-15", client=_client())
+
+        margins = df["proj_margin"].dropna().abs().tolist()
+        assert margins == sorted(margins, reverse=True)
+        assert df["error"].iloc[-1] == "TeamID mapping failed"
+        assert pd.isna(df["proj_margin"].iloc[-1])
+        assert df["fanmatch_GameID"].tolist()[-1] == 12
+
+    def test_legacy_and_fanmatch_scores(self):
+        """Legacy mode averages efficiencies; fanmatch mode takes HomePred/VisitorPred."""
+        client = _client()
+        legacy = fanmatch_slate_table(
+            d="2025-01-15", client=client, use_loglinear=False, use_pred_tempo=False
+        ).set_index("fanmatch_GameID")
+        h, v = RATINGS[1], RATINGS[2]
+        poss = (h["AdjTempo"] + v["AdjTempo"]) / 2.0
+        score_h = poss * (h["AdjOE"] + v["AdjDE"]) / 200.0 + 1.5
+        assert legacy.loc[10, "proj_home"] == pytest.approx(score_h, abs=0.051)
+        assert "hca_efficiency" not in legacy.columns
+
+        fanmatch = fanmatch_slate_table(
+            d="2025-01-15", client=client, use_fanmatch_scores=True
+        ).set_index("fanmatch_GameID")
+        assert fanmatch.loc[10, "proj_margin"] == pytest.approx(8.0)
+        assert fanmatch.loc[11, "proj_total"] == pytest.approx(140.0)
+        assert (fanmatch["method"].dropna() == "fanmatch_scores").all()
+
+    def test_features_prefetched_in_one_bulk_call(self):
+        """A slate with several teams should fetch all ratings with one call."""
+        client = _client()
+        fanmatch_slate_table(d="2025-01-15", client=client)
+
+        client.ratings.assert_called_once_with(y=2025)
+
+    def test_archive_fallback_warning(self):
+        """A failed archive lookup should fall back to ratings and record a warning."""
+        client = _client()
+        client.archive.side_effect = lambda d, team_id=None: (
+            [r for tid, r in RATINGS.items() if tid != 2]
+            if team_id is None
+            else ([] if team_id == 2 else [RATINGS[team_id]])
+        )
+        df = fanmatch_slate_table(d="2025-01-15", client=client, use_archive=True)
+        duke = df.set_index("fanmatch_GameID").loc[10]
+
+        assert duke["feature_source_home"] == "archive"
+        assert duke["feature_source_visitor"] == "ratings_fallback"
+        assert duke["warnings"].startswith("visitor_archive_failed_fallback_to_ratings")
+        assert duke["method"] == "loglinear_archive"
+
+
+class TestJoinWithOdds:
+    """Test joining slate projections with market odds."""
+
+    def test_normalized_names_match_scalar_helper(self):
+        """The vectorized normalizer should agree with normalize_team_name."""
+        names = pd.Series(
+            ["UConn", "Morgan State", "Penn State", "Duke", "Kansas St.", "App State", "Statesboro"]
+        )
+        assert _normalize_team_names(names).tolist() == [normalize_team_name(n) for n in names]
+
+    def test_state_suffix_only(self):
+        """Only a trailing " State" should be abbreviated; mapped names win."""
+        assert normalize_team_name("Morgan State") == "Morgan St."
+        assert normalize_team_name("App State") == "Appalachian St."
+        assert normalize_team_name("State Fair") == "State Fair"
+
+    def test_join_on_normalized_names(self, tmp_path):
+        """Odds rows should join on normalized names and produce a spread edge."""
+        slate_df = pd.DataFrame(
+            {
+                "date": ["2025-01-15", "2025-01-15"],
+                "home": ["Connecticut", "Duke"],
+                "visitor": ["Penn St.", "Kansas"],
+                "proj_margin": [6.0, 2.5],
+            }
+        )
+        odds_path = tmp_path / "odds.csv"
+        pd.DataFrame(
+            {
+                "home_team": ["UConn"],
+                "away_team": ["Penn State"],
+                "home_spread": [-4.5],
+                "home_spread_odds": [-110],
+                "home_ml": [-200],
+                "away_ml": [170],
+                "total": [141.5],
+                "over_odds": [-110],
+                "under_odds": [-110],
+                "game_time": ["7:00 PM"],
+            }
+        ).to_csv(odds_path, index=False)
+
+        merged = join_with_odds(slate_df, odds_path=odds_path)
+
+        assert merged["odds_joined"].tolist() == [True, False]
+        assert merged["odds_spread"].iloc[0] == pytest.approx(-4.5)
+        assert merged["spread_edge"].iloc[0] == pytest.approx(10.5)
+        assert merged["odds_total"].iloc[0] == pytest.approx(141.5)
+        assert "home_norm" not in merged.columns
+
+    def test_duplicate_odds_lines_keep_one_row_per_game(self, tmp_path):
+        """A matchup listed twice in the odds file should not duplicate slate rows."""
+        slate_df = pd.DataFrame(
+            {"date": ["2025-01-15"], "home": ["Duke"], "visitor": ["Kansas"], "proj_margin": [2.5]},
+            index=[7],
+        )
+        odds_path = tmp_path / "odds.csv"
+        pd.DataFrame(
+            {
+                "home_team": ["Duke", "Duke"],
+                "away_team": ["Kansas", "Kansas"],
+                "home_spread": [-3.0, -3.5],
+                "home_spread_odds": [-110, -105],
+                "home_ml": [-150, -160],
+                "away_ml": [130, 140],
+                "total": [150.5, 151.0],
+                "over_odds": [-110, -110],
+                "under_odds": [-110, -110],
+                "game_time": ["9:00 PM", "9:00 PM"],
+            }
+        ).to_csv(odds_path, index=False)
+
+        merged = join_with_odds(slate_df, odds_path=odds_path)
+
+        assert len(merged) == 1
+        assert merged["odds_spread"].iloc[0] == pytest.approx(-3.0)
+        assert merged["spread_edge"].iloc[0] == pytest.approx(5.5)
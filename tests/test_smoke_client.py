@@ -0,0 +1,49 @@
+"""Tests for KenPomClient response caching."""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+
+import numpy as np
+
+from kenpom_client.cache import ArrayCache, FileCache
+from kenpom_client.client import _immutable_ttl
+
+
+class TestResponseCacheTTL:
+    """Test per-request TTL overrides for immutable responses."""
+
+    def test_past_archive_dates_never_expire(self):
+        """Archive snapshots for past dates should be cached indefinitely."""
+        assert _immutable_ttl("archive", {"d": "2024-02-01"}) == math.inf
+        assert _immutable_ttl("archive", {"preseason": "true", "y": 2025}) is None
+        assert _immutable_ttl("ratings", {"y": 2024}) is None
+
+    def test_ttl_override_keeps_stale_entry(self, tmp_path):
+        """An entry past the cache-wide TTL should still be served under an override."""
+        cache = FileCache(str(tmp_path), ttl_seconds=60)
+        cache.set("k", {"AdjOE": 120.0})
+        path = cache._path_for_key("k")
+        obj = json.loads(path.read_text())
+        obj["created_ts"] = time.time() - 3600
+        path.write_text(json.dumps(obj))
+
+        assert cache.get("k") is None
+        assert cache.get("k", ttl_seconds=math.inf) == {"AdjOE": 120.0}
+
+
+class TestArrayCache:
+    """Test the bounded on-disk array cache."""
+
+    def test_oversized_entry_survives_its_own_write(self, tmp_path):
+        """An entry larger than max_bytes should still be served after set()."""
+        cache = ArrayCache(str(tmp_path), max_bytes=64)
+        cache.set("small", {"a": np.zeros(2)})
+        cache.set("big", {"a": np.arange(1000.0)})
+
+        assert cache.get("small") is None
+        got = cache.get("big")
+        assert got is not None
+        assert np.array_equal(got["a"], np.arange(1000.0))